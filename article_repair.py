@@ -0,0 +1,173 @@
+"""
+Article Repair Module for Pure Tallow Blog
+
+Fixes an article that failed validation without regenerating it: the
+sentences behind each failed critical check are located, sent in one short
+edit request (with the sentence before and after as context), and the
+rewrites are spliced back in at their offsets. The caller re-validates.
+
+Only the sentences change, so a repair costs a few hundred tokens instead
+of a 1,200-1,800 word article.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from content_quality import HARD_SELL_PHRASES
+
+# Sentence boundary: closing punctuation (and quotes/brackets) before whitespace, or a line break
+_BOUNDARY = re.compile(r'([.!?]["\'”»)\]]*)\s+|\n')
+# Markdown prefixes kept out of a repaired span (headings, list items, quotes)
+_MARKUP_PREFIX = re.compile(r'[ \t]*(?:#{1,6}|[-*+>]|\d+[.)])[ \t]+')
+# validate_article checks the closing in the last 500 characters
+CLOSING_CHARS = 500
+
+REPAIR_SYSTEM_PROMPT = (
+    "You are a copy editor. You rewrite only the numbered passages you are given, fixing the listed "
+    "problems with the smallest possible change. Keep each passage's language, meaning, tone, length, "
+    "Markdown markup and links. Never add new claims, products or links."
+)
+
+
+class Repair(NamedTuple):
+    field: str  # 'title' or 'body'
+    start: int
+    end: int
+    problems: Tuple[str, ...]
+
+
+def sentence_span(text: str, pos: int) -> Tuple[int, int]:
+    """(start, end) of the sentence containing text[pos], without Markdown prefixes"""
+    start = 0
+    for m in _BOUNDARY.finditer(text, 0, pos):
+        start = m.end()
+    m = _BOUNDARY.search(text, pos)
+    end = len(text) if m is None else (m.end(1) if m.group(1) else m.start())
+    prefix = _MARKUP_PREFIX.match(text, start)
+    if prefix and prefix.end() <= pos:
+        start = prefix.end()
+    return start, end
+
+
+def _occurrences(text: str, phrase: str, whole_word: bool = False):
+    """
+    (position, word containing it) of every case-insensitive occurrence. Most
+    checks match substrings; whole_word matches as count_etsy_mentions does.
+    """
+    pattern = rf'\b{re.escape(phrase)}\b' if whole_word else re.escape(phrase)
+    for m in re.finditer(pattern, text, re.IGNORECASE):
+        word = re.search(r'[\w%-]*' + re.escape(m.group(0)) + r'[\w%-]*', text[max(0, m.start() - 30):m.end() + 30])
+        yield m.start(), (word.group(0) if word else m.group(0))
+
+
+def find_repairs(title: str, body: str, validation: dict) -> List[Repair]:
+    """Spans of the title and body behind the failed critical checks of validate_article()"""
+    checks = validation['checks']
+    failed = set(validation['failed_checks'])
+    texts = {'title': title, 'body': body}
+    marked: Dict[Tuple[str, int, int], List[str]] = {}
+
+    def mark(field, pos, problem):
+        start, end = (0, len(title)) if field == 'title' else sentence_span(body, pos)
+        marked.setdefault((field, start, end), []).append(problem)
+
+    for check, label in (('forbidden_phrases', 'AI-typical phrase'), ('hyperbolic_claims', 'hyperbolic claim')):
+        if check not in failed:
+            continue
+        for phrase in checks[check]['found']:
+            for field, text in texts.items():
+                for pos, word in _occurrences(text, phrase):
+                    hint = f' (no word may contain "{phrase}")' if word.lower() != phrase.lower() else ''
+                    mark(field, pos, f'remove the {label} "{word}"{hint}')
+    if 'etsy_mentions' in failed:
+        # Keep the first mention, in title-then-body order as the check reads them
+        mentions = [(field, pos) for field, text in texts.items() for pos, _ in _occurrences(text, 'etsy', whole_word=True)]
+        for field, pos in mentions[1:]:
+            mark(field, pos, 'drop this mention of Etsy (the article may name Etsy only once)')
+    if 'generic_opening' in failed:
+        # The check reads the start of "title\n\nbody": the title, if there is one
+        mark('title' if title else 'body', 0, 'the opening is generic; start in a specific, personal way')
+    if 'generic_closing' in failed:
+        closing_from = max(0, len(body) - CLOSING_CHARS)
+        for phrase in HARD_SELL_PHRASES:
+            for pos, word in _occurrences(body, phrase):
+                if pos >= closing_from:
+                    mark('body', pos, f'remove the hard-sell phrase "{word}"; end softly')
+
+    # Merge overlapping spans of the same field
+    repairs: List[Repair] = []
+    for (field, start, end), problems in sorted(marked.items()):
+        last = repairs[-1] if repairs else None
+        if last and last.field == field and start < last.end:
+            repairs[-1] = Repair(field, last.start, max(last.end, end), last.problems + tuple(problems))
+        else:
+            repairs.append(Repair(field, start, end, tuple(problems)))
+    return repairs
+
+
+def repair_messages(title: str, body: str, repairs: List[Repair], language_name: str,
+                    product_name: str) -> List[dict]:
+    """Chat messages asking for the numbered passages, rewritten"""
+    parts = [
+        f'Article: "{title}" ({language_name}, about {product_name}).',
+        f"Rewrite each numbered passage in {language_name}. Reply with the rewritten passages only, "
+        "each on its own line starting with its number in square brackets, e.g. [1] ...",
+    ]
+    for number, repair in enumerate(repairs, 1):
+        parts.append(f"\n[{number}] Problems: {'; '.join(dict.fromkeys(repair.problems))}")
+        if repair.field == 'body':
+            # Neighbouring sentences, across blank lines and the passage's own list or heading marker
+            head = repair.start
+            line_start = body.rfind('\n', 0, head) + 1
+            if _MARKUP_PREFIX.fullmatch(body, line_start, head):
+                head = line_start
+            previous = len(body[:head].rstrip()) - 1
+            if previous >= 0:
+                before = sentence_span(body, previous)
+                parts.append(f"Before (do not rewrite): {body[before[0]:before[1]].strip()}")
+            parts.append(f"Passage: {body[repair.start:repair.end]}")
+            following = repair.end + len(body[repair.end:]) - len(body[repair.end:].lstrip())
+            if following < len(body):
+                after = sentence_span(body, following)
+                parts.append(f"After (do not rewrite): {body[after[0]:after[1]].strip()}")
+        else:
+            parts.append(f"Passage (the title): {title}")
+    return [
+        {"role": "system", "content": REPAIR_SYSTEM_PROMPT},
+        {"role": "user", "content": "\n".join(parts)},
+    ]
+
+
+def repair_max_tokens(title: str, body: str, repairs: List[Repair]) -> int:
+    """Room for the rewrites: about as long as the passages, plus the numbering"""
+    chars = sum(r.end - r.start if r.field == 'body' else len(title) for r in repairs)
+    return 64 * len(repairs) + chars
+
+
+def parse_rewrites(content: str, count: int) -> Dict[int, str]:
+    """number -> rewritten passage of a reply in the [n] format (unknown numbers are ignored)"""
+    rewrites = {}
+    for m in re.finditer(r'^\s*\[(\d+)\]\s*(.*?)(?=^\s*\[\d+\]|\Z)', content, re.MULTILINE | re.DOTALL):
+        number, text = int(m.group(1)), m.group(2).strip()
+        # Models sometimes echo the labels of the request
+        text = re.sub(r'^(?:Passage(?: \(the title\))?|Problems):\s*', '', text).strip()
+        if 1 <= number <= count and text:
+            rewrites[number] = text
+    return rewrites
+
+
+def apply_repairs(title: str, body: str, repairs: List[Repair],
+                  rewrites: Dict[int, str]) -> Tuple[str, str, int]:
+    """(title, body, passages replaced); spans are replaced from the end so offsets stay valid"""
+    applied = 0
+    numbered = sorted(enumerate(repairs, 1), key=lambda item: item[1].start, reverse=True)
+    for number, repair in numbered:
+        text: Optional[str] = rewrites.get(number)
+        if text is None:
+            continue
+        if repair.field == 'title':
+            title = text.splitlines()[0].strip('#').strip('*').strip()
+        else:
+            body = body[:repair.start] + text + body[repair.end:]
+        applied += 1
+    return title, body, applied
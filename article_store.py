@@ -0,0 +1,457 @@
+"""
+Article Storage Module for Pure Tallow Blog
+
+This module provides the ArticleStore abstraction used by generation, build
+and export. Two backends are available:
+
+- JsonArticleStore: one JSON file per article in articles/ (the original layout)
+- SqliteArticleStore: a single SQLite database in WAL mode, indexed on
+  language, product, angle, generated_at and translation group
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+# Fields kept in lightweight metadata records (everything the build holds in memory;
+# bodies and larger derived fields are fetched per article with get_fields)
+METADATA_FIELDS = (
+    'slug', 'title', 'product', 'product_name', 'product_link', 'product_image',
+    'language', 'angle', 'generated_at', 'season', 'content_hash', 'derived_version',
+)
+
+# Fields with few distinct values, shared between records through sys.intern
+INTERNED_FIELDS = frozenset((
+    'product', 'product_name', 'product_link', 'product_image', 'language', 'angle', 'season',
+))
+_METADATA_FIELD_SET = frozenset(METADATA_FIELDS)
+
+
+class Article:
+    """
+    Metadata record of one article: METADATA_FIELDS as __slots__, the
+    repeated enum-like strings interned, and the body read from the store
+    only when asked for.
+
+    Reads like the metadata dicts it replaces (a['slug'], a.get('season'),
+    'season' in a, {**a}); a missing field is None and acts as an absent key.
+    """
+
+    __slots__ = METADATA_FIELDS + ('_store',)
+
+    def __init__(self, values: Iterable, store: Optional['ArticleStore'] = None):
+        """values: in METADATA_FIELDS order (None for a missing field)"""
+        for key, value in zip(METADATA_FIELDS, values):
+            if key in INTERNED_FIELDS and value is not None:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        self._store = store
+
+    @classmethod
+    def from_dict(cls, article: dict, store: Optional['ArticleStore'] = None) -> 'Article':
+        return cls([article.get(key) for key in METADATA_FIELDS], store)
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, key) for key in METADATA_FIELDS)
+
+    def keys(self) -> List[str]:
+        return [key for key in METADATA_FIELDS if getattr(self, key) is not None]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key) if key in _METADATA_FIELD_SET else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default=None):
+        value = getattr(self, key) if key in _METADATA_FIELD_SET else None
+        return default if value is None else value
+
+    def __contains__(self, key: str) -> bool:
+        return key in _METADATA_FIELD_SET and getattr(self, key) is not None
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self.keys()}
+
+    @property
+    def body(self) -> str:
+        """Read from the store on every access (not kept in the record)"""
+        return self._store.get_body(self.slug) if self._store is not None else ''
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __hash__(self) -> int:
+        return hash(self.slug)
+
+    def __repr__(self) -> str:
+        return f"Article({self.slug!r})"
+
+
+def article_metadata(article: dict, store: Optional['ArticleStore'] = None) -> Article:
+    """Lightweight record of an article without its body"""
+    return Article.from_dict(article, store)
+
+
+def translation_group(article: dict) -> str:
+    """
+    Key shared by all language versions of the same article.
+
+    Matches the grouping used for hreflang tags (same product and angle).
+    """
+    return f"{article.get('product', '')}:{article.get('angle', '')}"
+
+
+def _matches(article: dict, filters: Dict[str, str]) -> bool:
+    return all(article.get(key) == value for key, value in filters.items())
+
+
+class ArticleStore:
+    """Common interface for article storage backends"""
+
+    def put(self, article: dict) -> None:
+        raise NotImplementedError
+
+    def put_many(self, articles: Iterable[dict]) -> int:
+        count = 0
+        for article in articles:
+            self.put(article)
+            count += 1
+        return count
+
+    def get(self, slug: str) -> Optional[dict]:
+        raise NotImplementedError
+
+    def delete(self, slug: str) -> None:
+        raise NotImplementedError
+
+    def iter_articles(self, language: Optional[str] = None, product: Optional[str] = None,
+                      angle: Optional[str] = None) -> Iterator[dict]:
+        raise NotImplementedError
+
+    def slugs(self) -> List[str]:
+        return [a['slug'] for a in self.iter_articles()]
+
+    def count(self) -> int:
+        return len(self.slugs())
+
+    def load_all(self) -> List[dict]:
+        """Every article in the store, as a list"""
+        return list(self.iter_articles())
+
+    def load_metadata(self) -> List[Article]:
+        """Metadata records (see Article) for every article, bodies loaded on access"""
+        return [article_metadata(a, self) for a in self.iter_articles()]
+
+    def get_body(self, slug: str) -> str:
+        article = self.get(slug)
+        return article.get('body', '') if article else ''
+
+    def get_fields(self, slug: str, fields: Iterable[str]) -> dict:
+        """Selected fields of one article (missing ones are left out)"""
+        article = self.get(slug) or {}
+        return {key: article[key] for key in fields if key in article}
+
+    def revision(self, slug: str) -> Optional[str]:
+        """Token that changes whenever the stored article changes (None if it doesn't exist)"""
+        article = self.get(slug)
+        if article is None:
+            return None
+        return hashlib.sha256(json.dumps(article, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def revisions(self) -> Dict[str, str]:
+        """slug -> revision() of every article"""
+        return {slug: self.revision(slug) for slug in self.slugs()}
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonArticleStore(ArticleStore):
+    """
+    One pretty-printed JSON file per article.
+
+    If snapshot_path is given, load_metadata() keeps a pickled copy of the
+    parsed metadata records there (as value tuples, see Article), keyed by
+    file name and validated against each file's mtime and size. Only new or
+    changed files are parsed again.
+    """
+
+    SNAPSHOT_VERSION = 4
+
+    def __init__(self, articles_dir: Path, snapshot_path: Optional[Path] = None):
+        self.articles_dir = Path(articles_dir)
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+
+    def path_for(self, slug: str) -> Path:
+        return self.articles_dir / f"{slug}.json"
+
+    def put(self, article: dict) -> None:
+        self.articles_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.path_for(article['slug']), 'w', encoding='utf-8') as f:
+            json.dump(article, f, ensure_ascii=False, indent=2)
+
+    def get(self, slug: str) -> Optional[dict]:
+        path = self.path_for(slug)
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            return json.load(f)
+
+    def delete(self, slug: str) -> None:
+        self.path_for(slug).unlink(missing_ok=True)
+
+    def revision(self, slug: str) -> Optional[str]:
+        try:
+            st = self.path_for(slug).stat()
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}-{st.st_size}"
+
+    def iter_articles(self, language=None, product=None, angle=None):
+        if not self.articles_dir.exists():
+            return
+        filters = {k: v for k, v in (('language', language), ('product', product), ('angle', angle)) if v}
+        for f in self.articles_dir.glob("*.json"):
+            try:
+                with open(f, 'r', encoding='utf-8-sig') as file:
+                    article = json.load(file)
+            except Exception as e:
+                print(f"  Error reading {f}: {e}")
+                continue
+            if _matches(article, filters):
+                yield article
+
+    def slugs(self) -> List[str]:
+        if not self.articles_dir.exists():
+            return []
+        return [f.stem for f in self.articles_dir.glob("*.json")]
+
+    def _read_snapshot(self) -> dict:
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+            if snapshot.get('version') == self.SNAPSHOT_VERSION:
+                return snapshot['files']
+        except Exception:
+            pass
+        return {}
+
+    def _write_snapshot(self, files: dict) -> None:
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': self.SNAPSHOT_VERSION, 'files': files}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def load_metadata(self) -> List[Article]:
+        if self.snapshot_path is None:
+            return super().load_metadata()
+        if not self.articles_dir.exists():
+            return []
+
+        cached = self._read_snapshot()
+        files = {}
+        changed = False
+        with os.scandir(self.articles_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+                st = entry.stat()
+                hit = cached.get(entry.name)
+                if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                    files[entry.name] = hit
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8-sig') as file:
+                        values = article_metadata(json.load(file)).values()
+                except Exception as e:
+                    print(f"  Error reading {entry.path}: {e}")
+                    continue
+                files[entry.name] = (st.st_mtime_ns, st.st_size, values)
+                changed = True
+
+        if changed or len(files) != len(cached):
+            # Interned strings are pickled once and come back shared
+            self._write_snapshot(files)
+        return [Article(values, self) for _, _, values in files.values()]
+
+
+class SqliteArticleStore(ArticleStore):
+    """All articles in one SQLite database (WAL mode, safe to share between threads)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS articles (
+            slug TEXT PRIMARY KEY,
+            language TEXT NOT NULL,
+            product TEXT NOT NULL,
+            angle TEXT NOT NULL,
+            generated_at TEXT NOT NULL,
+            translation_group TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_articles_language ON articles(language);
+        CREATE INDEX IF NOT EXISTS idx_articles_product ON articles(product);
+        CREATE INDEX IF NOT EXISTS idx_articles_angle ON articles(angle);
+        CREATE INDEX IF NOT EXISTS idx_articles_generated_at ON articles(generated_at);
+        CREATE INDEX IF NOT EXISTS idx_articles_translation_group ON articles(translation_group);
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def _row(article: dict) -> tuple:
+        return (
+            article['slug'], article.get('language', ''), article.get('product', ''),
+            article.get('angle', ''), article.get('generated_at', ''),
+            translation_group(article), json.dumps(article, ensure_ascii=False)
+        )
+
+    def put(self, article: dict) -> None:
+        self.put_many([article])
+
+    def put_many(self, articles: Iterable[dict]) -> int:
+        rows = [self._row(a) for a in articles]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def get(self, slug: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM articles WHERE slug = ?", (slug,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, slug: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM articles WHERE slug = ?", (slug,))
+
+    def iter_articles(self, language=None, product=None, angle=None):
+        filters = {k: v for k, v in (('language', language), ('product', product), ('angle', angle)) if v}
+        sql = "SELECT data FROM articles"
+        if filters:
+            sql += " WHERE " + " AND ".join(f"{column} = ?" for column in filters)
+        sql += " ORDER BY generated_at, slug"
+        with self._lock:
+            rows = self._conn.execute(sql, tuple(filters.values())).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def load_metadata(self) -> List[Article]:
+        columns = ", ".join(f"json_extract(data, '$.{key}')" for key in METADATA_FIELDS)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM articles ORDER BY generated_at, slug"
+            ).fetchall()
+        return [Article(row, self) for row in rows]
+
+    def get_body(self, slug: str) -> str:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json_extract(data, '$.body') FROM articles WHERE slug = ?", (slug,)
+            ).fetchone()
+        return row[0] if row and row[0] is not None else ''
+
+    def get_fields(self, slug: str, fields: Iterable[str]) -> dict:
+        fields = tuple(fields)
+        columns = ", ".join(f"json_extract(data, '$.{key}')" for key in fields)
+        with self._lock:
+            row = self._conn.execute(f"SELECT {columns} FROM articles WHERE slug = ?", (slug,)).fetchone()
+        if row is None:
+            return {}
+        return {key: value for key, value in zip(fields, row) if value is not None}
+
+    def revision(self, slug: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT length(data), json_extract(data, '$.content_hash'), json_extract(data, '$.generated_at') "
+                "FROM articles WHERE slug = ?", (slug,)
+            ).fetchone()
+        return '-'.join(str(value) for value in row) if row else None
+
+    def revisions(self) -> Dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slug, length(data), json_extract(data, '$.content_hash'), json_extract(data, '$.generated_at') "
+                "FROM articles"
+            ).fetchall()
+        return {slug: '-'.join(str(value) for value in rest) for slug, *rest in rows}
+
+    def iter_translation_group(self, group: str) -> Iterator[dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM articles WHERE translation_group = ?", (group,)
+            ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def slugs(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT slug FROM articles")]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_article_store(backend: str, articles_dir: Path, db_path: Path,
+                       snapshot_path: Optional[Path] = None) -> ArticleStore:
+    """
+    Open the configured article store.
+
+    Args:
+        backend: "json" or "sqlite"
+        articles_dir: Directory used by the JSON backend
+        db_path: Database file used by the SQLite backend
+        snapshot_path: Corpus snapshot file for the JSON backend (None = no snapshot)
+    """
+    if backend == 'sqlite':
+        return SqliteArticleStore(db_path)
+    if backend == 'json':
+        return JsonArticleStore(articles_dir, snapshot_path)
+    raise ValueError(f"Unknown article storage backend: {backend}")
+
+
+def copy_articles(src: ArticleStore, dst: ArticleStore, batch_size: int = 500) -> int:
+    """Copy every article from one store to another, returns the number copied"""
+    copied = 0
+    batch = []
+    for article in src.iter_articles():
+        batch.append(article)
+        if len(batch) >= batch_size:
+            copied += dst.put_many(batch)
+            batch = []
+    if batch:
+        copied += dst.put_many(batch)
+    return copied
@@ -0,0 +1,286 @@
+"""
+Build Benchmark Module for Pure Tallow Blog
+
+Generates synthetic corpora shaped like articles/*.json (same languages,
+products and angles, 96 articles a day, body lengths and text sampled from
+the real articles of each language) and times `blog.py build` on each size.
+
+Every build runs in a fresh process with BLOG_DATA_DIR pointing at the
+corpus workspace, so peak RSS is measured per corpus. Each size is built
+twice: cold (empty caches, no previous build) and again with nothing
+changed (the daily incremental case).
+"""
+
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 500_000)
+ARTICLES_PER_DAY = 96
+PRODUCTS_PER_DAY = 4
+CORPUS_VERSION = 1
+
+# Rough disk use per article: source JSON, page, manifest entry (twice) and search postings
+BYTES_PER_ARTICLE_ESTIMATE = 60_000
+
+_FALLBACK_WORDS = (
+    "tallow balm skin grass fed suet whipped dry eczema winter routine natural "
+    "moisture barrier scent jar face hands night cream ingredients vitamins "
+    "sensitive gentle texture melts absorbs results week morning"
+).split()
+
+
+def load_text_samples(articles_dir: Path, per_language: int = 200) -> Dict[str, dict]:
+    """
+    Titles, paragraphs and body lengths from the real corpus, per language.
+
+    Returns: language -> {"titles": [...], "paragraphs": [(text, words)], "lengths": [...]}
+    """
+    samples: Dict[str, dict] = {}
+    for path in sorted(Path(articles_dir).glob("*.json")):
+        try:
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                article = json.load(f)
+        except Exception:
+            continue
+        pool = samples.setdefault(article.get('language', ''), {"titles": [], "paragraphs": [], "lengths": []})
+        if len(pool["lengths"]) >= per_language:
+            continue
+        body = article.get('body', '')
+        pool["titles"].append(article.get('title', ''))
+        pool["lengths"].append(len(body.split()))
+        pool["paragraphs"].extend((p, len(p.split())) for p in body.split('\n\n') if p.strip())
+    return {lang: pool for lang, pool in samples.items() if pool["paragraphs"]}
+
+
+def _fallback_pool(rng: random.Random) -> dict:
+    paragraphs = []
+    for _ in range(200):
+        words = [rng.choice(_FALLBACK_WORDS) for _ in range(rng.randint(40, 120))]
+        paragraphs.append((' '.join(words).capitalize() + '.', len(words)))
+    return {"titles": ["Tallow balm notes"], "paragraphs": paragraphs, "lengths": [1200, 1400, 1600]}
+
+
+def synthetic_articles(n: int, config: dict, samples: Dict[str, dict], seed: int = 0,
+                       end: Optional[datetime] = None):
+    """
+    Yield n synthetic articles, newest last, following the daily rotation.
+
+    Each day covers PRODUCTS_PER_DAY products in every language with one
+    random angle per (product, language), like cmd_generate.
+    """
+    rng = random.Random(seed)
+    languages = list(config['languages'])
+    products = list(config['products'])
+    angles = list(config['article_angles'])
+    per_day = PRODUCTS_PER_DAY * len(languages)
+    end = end or datetime.now().replace(hour=6, minute=0, second=0, microsecond=0)
+    days = (n + per_day - 1) // per_day
+    fallback = _fallback_pool(rng)
+    for i in range(n):
+        day, slot = divmod(i, per_day)
+        lang = languages[slot % len(languages)]
+        product_key = products[(day * PRODUCTS_PER_DAY + slot // len(languages)) % len(products)]
+        product = config['products'][product_key]
+        angle = rng.choice(angles)
+        generated_at = end - timedelta(days=days - 1 - day, seconds=per_day - slot)
+        pool = samples.get(lang) or fallback
+        target = rng.choice(pool["lengths"])
+        paragraphs, words = [], 0
+        while words < target:
+            text, count = rng.choice(pool["paragraphs"])
+            paragraphs.append(text)
+            words += count
+        yield {
+            "title": rng.choice(pool["titles"]),
+            "body": '\n\n'.join(paragraphs),
+            "product": product_key,
+            "product_name": product.get('name', ''),
+            "product_link": product.get('link', ''),
+            "product_image": product.get('image', ''),
+            "language": lang,
+            "language_name": config['languages'][lang].get('name', lang),
+            "angle": angle,
+            "slug": f"{lang}-{product_key.replace('_', '-')}-{angle.replace('_', '-')}-{generated_at:%Y%m%d}-{i}",
+            "generated_at": generated_at.isoformat(),
+            "season": "winter",
+        }
+
+
+def write_corpus(workspace: Path, n: int, config: dict, samples: Dict[str, dict], seed: int = 0) -> bool:
+    """
+    Write a synthetic articles/ directory into workspace.
+
+    Returns False if an identical corpus is already there (it is reused).
+    """
+    marker = workspace / "corpus.json"
+    spec = {"version": CORPUS_VERSION, "articles": n, "seed": seed}
+    try:
+        if json.loads(marker.read_text(encoding='utf-8')) == spec:
+            return False
+    except (OSError, ValueError):
+        pass
+    shutil.rmtree(workspace, ignore_errors=True)
+    articles_dir = workspace / "articles"
+    articles_dir.mkdir(parents=True)
+    for article in synthetic_articles(n, config, samples, seed):
+        with open(articles_dir / f"{article['slug']}.json", 'w', encoding='utf-8') as f:
+            json.dump(article, f, ensure_ascii=False, indent=2)
+    marker.write_text(json.dumps(spec), encoding='utf-8')
+    return True
+
+
+def reset_build_state(workspace: Path) -> None:
+    """Remove output, builds and caches so the next build starts cold"""
+    for name in (".builds", ".cache", "build-stats.json"):
+        path = workspace / name
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
+    public = workspace / "public"
+    if public.is_symlink():
+        public.unlink()
+    elif public.exists():
+        shutil.rmtree(public, ignore_errors=True)
+
+
+def run_build(blog_script: Path, workspace: Path, log_path: Path) -> dict:
+    """Run `blog.py build` on a workspace in a child process and measure it"""
+    env = {**os.environ, "BLOG_DATA_DIR": str(workspace), "PYTHONUNBUFFERED": "1"}
+    started = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        proc = subprocess.Popen([sys.executable, str(blog_script), "build"],
+                                stdout=log, stderr=subprocess.STDOUT, env=env)
+        peak_rss_mb = None
+        if hasattr(os, 'wait4'):
+            _, status, usage = os.wait4(proc.pid, 0)
+            returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is bytes on macOS, kilobytes elsewhere
+            peak_rss_mb = usage.ru_maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+        else:
+            returncode = proc.wait()
+    result = {"seconds": round(time.perf_counter() - started, 2), "returncode": returncode,
+              "peak_rss_mb": round(peak_rss_mb, 1) if peak_rss_mb is not None else None}
+    try:
+        stats = json.loads((workspace / "build-stats.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        stats = None
+    if returncode != 0 or stats is None:
+        lines = log_path.read_text(encoding='utf-8', errors='replace').splitlines()
+        result["error"] = '\n'.join(lines[-15:]) or f"exit code {returncode}"
+        return result
+    result["output_bytes"] = stats.get("output", {}).get("bytes")
+    result["output_files"] = stats.get("output", {}).get("files")
+    result["phases"] = stats.get("phases", {})
+    if result["peak_rss_mb"] is None:
+        result["peak_rss_mb"] = stats.get("peak_memory_mb")
+    return result
+
+
+def run_benchmark(sizes: Sequence[int], config: dict, articles_dir: Path, blog_script: Path,
+                  bench_dir: Path, keep: bool = False, rebuild: bool = True) -> List[dict]:
+    """
+    Build each corpus size cold (and again unchanged), stopping at the first failure.
+
+    Returns: one result dict per size attempted
+    """
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    samples = load_text_samples(articles_dir)
+    if not samples:
+        print("  No articles to sample text from - using filler text")
+    results = []
+    for n in sorted(sizes):
+        workspace = bench_dir / str(n)
+        needed = n * BYTES_PER_ARTICLE_ESTIMATE
+        free = shutil.disk_usage(bench_dir).free
+        if free < needed and not (workspace / "corpus.json").exists():
+            print(f"\n  {n:,} articles: needs ~{needed / 1e9:.0f} GB, only {free / 1e9:.0f} GB free - stopping")
+            results.append({"articles": n, "skipped": "not enough disk space"})
+            break
+
+        print(f"\n  {n:,} articles")
+        started = time.perf_counter()
+        if write_corpus(workspace, n, config, samples):
+            print(f"    Corpus written in {time.perf_counter() - started:.1f}s")
+        else:
+            print("    Reusing existing corpus")
+        reset_build_state(workspace)
+
+        result = {"articles": n, "cold": run_build(blog_script, workspace, workspace / "build-cold.log")}
+        _print_run("cold", result["cold"])
+        if rebuild and "error" not in result["cold"]:
+            result["rebuild"] = run_build(blog_script, workspace, workspace / "build-rebuild.log")
+            _print_run("rebuild", result["rebuild"])
+        results.append(result)
+        if not keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+        if any("error" in result.get(run, {}) for run in ("cold", "rebuild")):
+            print("    Build failed - not trying larger corpora")
+            break
+    return results
+
+
+def _print_run(label: str, run: dict) -> None:
+    if "error" in run:
+        print(f"    {label:<8} FAILED after {run['seconds']:.1f}s (exit {run['returncode']})")
+        for line in run["error"].splitlines()[-5:]:
+            print(f"      {line}")
+        return
+    size = (run.get("output_bytes") or 0) / (1024 * 1024)
+    rss = run.get("peak_rss_mb")
+    print(f"    {label:<8} {run['seconds']:8.1f}s  peak RSS {rss if rss is not None else '?':>7} MB  output {size:,.0f} MB")
+
+
+def print_results(results: List[dict]) -> None:
+    print(f"\n  {'articles':>10}  {'cold s':>9}  {'rebuild s':>9}  {'peak MB':>8}  {'output MB':>10}  {'s / 1k':>7}")
+    for r in results:
+        cold = r.get("cold", {})
+        if "skipped" in r or "error" in cold:
+            print(f"  {r['articles']:>10,}  {r.get('skipped') or 'failed'}")
+            continue
+        rebuild = r.get("rebuild", {})
+        print(f"  {r['articles']:>10,}  {cold['seconds']:>9.1f}  {rebuild.get('seconds', float('nan')):>9.1f}  "
+              f"{cold.get('peak_rss_mb') or 0:>8.0f}  {(cold.get('output_bytes') or 0) / (1024 * 1024):>10,.0f}  "
+              f"{cold['seconds'] / r['articles'] * 1000:>7.2f}")
+
+
+def chart_results(results: List[dict], path: Path) -> bool:
+    """Time, peak RSS and output size against N as a PNG (requires matplotlib)"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+    done = [r for r in results if "error" not in r.get("cold", {"error": True})]
+    if not done:
+        return False
+    n = [r["articles"] for r in done]
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4.5))
+    axes[0].plot(n, [r["cold"]["seconds"] for r in done], 'o-', label='cold')
+    if all("rebuild" in r and "error" not in r["rebuild"] for r in done):
+        axes[0].plot(n, [r["rebuild"]["seconds"] for r in done], 's--', label='unchanged rebuild')
+    axes[0].set_title('Build time (s)')
+    axes[0].legend()
+    axes[1].plot(n, [r["cold"].get("peak_rss_mb") or 0 for r in done], 'o-')
+    axes[1].set_title('Peak RSS (MB)')
+    axes[2].plot(n, [(r["cold"].get("output_bytes") or 0) / (1024 * 1024) for r in done], 'o-')
+    axes[2].set_title('Output size (MB)')
+    for ax in axes:
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('articles')
+        ax.grid(True, which='both', alpha=0.3)
+    fig.suptitle(f"blog.py build scaling ({datetime.now():%Y-%m-%d})")
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return True
@@ -0,0 +1,89 @@
+"""
+Coverage Planner Module for Pure Tallow Blog
+
+Chooses the angles of a generation batch from what the corpus already
+covers. Each (product, angle, language) cell of the matrix remembers when it
+was last written. A day's products get the angles whose cells are empty or
+least recently covered, so every generated article fills a gap instead of
+repeating one.
+
+Languages stay aligned: angles are chosen once per product (by how many of
+the requested languages lack them, then by how recently any of them covered
+it) and every language gets the same ones, so each batch adds complete
+translation groups. A language that already has one of the chosen cells
+writes it again rather than drifting to an angle of its own.
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Sorts after every generated_at timestamp: planned or in-flight work counts
+# as the most recent coverage
+IN_FLIGHT = "~"
+
+
+class CoverageIndex:
+    """
+    Last coverage of every (product, angle, language) cell.
+
+    Usage:
+        coverage = CoverageIndex.from_metadata(records)
+        coverage.add_planned(queued_tasks)
+        tasks = coverage.plan(products, languages, angles, per_product)
+    """
+
+    def __init__(self):
+        self.last_covered: Dict[Tuple[str, str, str], str] = {}
+        self.counts: Dict[Tuple[str, str, str], int] = {}
+
+    @classmethod
+    def from_metadata(cls, records: Iterable[dict]) -> 'CoverageIndex':
+        index = cls()
+        for a in records:
+            index.add(a['product'], a['angle'], a['language'], a.get('generated_at') or '')
+        return index
+
+    def add(self, product: str, angle: str, language: str, when: str = IN_FLIGHT) -> None:
+        key = (product, angle, language)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if when > self.last_covered.get(key, ''):
+            self.last_covered[key] = when
+
+    def add_planned(self, tasks: Iterable[Tuple[str, str, str]]) -> None:
+        """(product, language, angle) tasks queued but not published yet"""
+        for product, language, angle in tasks:
+            self.add(product, angle, language)
+
+    def covered(self, product: str, angle: str, language: str) -> bool:
+        return (product, angle, language) in self.counts
+
+    def rank_angles(self, product: str, languages: Sequence[str], angles: Sequence[str]) -> List[str]:
+        """Angles of a product, biggest gap across the languages first"""
+        def key(item):
+            position, angle = item
+            missing = sum(1 for lang in languages if not self.covered(product, angle, lang))
+            latest = max((self.last_covered.get((product, angle, lang), '') for lang in languages), default='')
+            return (-missing, latest, position)
+        return [angle for _, angle in sorted(enumerate(angles), key=key)]
+
+    def plan(self, products: Sequence[str], languages: Sequence[str], angles: Sequence[str],
+             per_product: int) -> List[Tuple[str, str, str]]:
+        """
+        (product, language, angle) tasks: the per_product top-ranked angles of
+        every product, in every language. Planned tasks are added to the index.
+        """
+        per_product = min(per_product, len(angles))
+        tasks = []
+        for product in products:
+            chosen = self.rank_angles(product, languages, angles)[:per_product]
+            tasks.extend((product, lang, angle) for angle in chosen for lang in languages)
+        self.add_planned(tasks)
+        return tasks
+
+    def summary(self, products: Sequence[str], languages: Sequence[str], angles: Sequence[str]) -> dict:
+        """Filled and duplicated cells of a slice of the matrix"""
+        cells = [(p, a, l) for p in products for a in angles for l in languages]
+        return {
+            'cells': len(cells),
+            'filled': sum(1 for cell in cells if cell in self.counts),
+            'duplicates': sum(self.counts.get(cell, 0) - 1 for cell in cells if cell in self.counts),
+        }
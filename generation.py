@@ -0,0 +1,1458 @@
+"""
+Generation Module for Pure Tallow Blog
+
+Article generation: prompts, sync and async generation over the LLM
+backends (DeepSeek by default, see llm_backends.py), content validation,
+and the queue-backed batch runners behind `blog.py generate`, `worker` and
+`queue`.
+
+Only imported by the generation commands, so the HTTP clients and the
+prompt templates are not loaded for build or serve.
+"""
+
+import asyncio
+import collections
+import contextlib
+import hashlib
+import os
+import random
+import re
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from coverage_planner import CoverageIndex
+from hedging import Hedger
+from llm_backends import BackendPool, backends_from_config
+from rotation import get_rotation_status, get_todays_products
+from run_log import ProgressReporter, RunLog, get_logger, task_context
+from run_metrics import MetricsExporter, RunMetrics
+from site_build import compute_derived_fields
+from site_config import CONFIG, DATA_DIR, SCRIPT_DIR, get_article_store
+from task_queue import LeaseLost, TaskQueue, default_worker_id
+
+# Try to import aiohttp for async requests (much faster)
+try:
+    import aiohttp
+    ASYNC_AVAILABLE = True
+except ImportError:
+    ASYNC_AVAILABLE = False
+
+# Structured run logs (see run_log.py): one JSON-lines file per generate/worker run
+LOG_CONFIG = CONFIG.get('logging', {})
+LOG_DIR = DATA_DIR / LOG_CONFIG.get('dir', 'logs')
+PROGRESS_INTERVAL = LOG_CONFIG.get('progress_interval', 1.0)
+log = get_logger('generation')
+
+def open_run_log(command):
+    """RunLog for this process; prints where the JSON lines go"""
+    path = LOG_DIR / f"{command}-{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}.jsonl"
+    print(f"Log: {path}")
+    return RunLog(path)
+
+# Live counters of this process (see run_metrics.py), exported with --metrics
+METRICS_CONFIG = CONFIG.get('metrics', {})
+metrics = RunMetrics()
+
+@contextlib.contextmanager
+def open_metrics(run_log, export=False):
+    """
+    MetricsExporter for a run: /metrics on localhost and a JSON snapshot next
+    to the run log. A no-op unless export or metrics.enabled in config.json.
+    """
+    if not (export or METRICS_CONFIG.get('enabled', False)):
+        yield None
+        return
+    snapshot = run_log.log_path.with_suffix('.metrics.json')
+    port = METRICS_CONFIG.get('port', 9180)
+    exporter = MetricsExporter(metrics, port, snapshot, METRICS_CONFIG.get('snapshot_interval', 5.0))
+    try:
+        exporter.start()
+    except OSError as e:
+        # Port taken (e.g. a second worker on this host): keep the snapshot file
+        print(f"Metrics: port {port} unavailable ({e.strerror}), writing the snapshot only")
+        exporter = MetricsExporter(metrics, None, snapshot, exporter.interval).start()
+    else:
+        print(f"Metrics: http://127.0.0.1:{port}/metrics")
+    print(f"Metrics snapshot: {snapshot}")
+    try:
+        yield exporter
+    finally:
+        exporter.stop()
+
+
+# Chat completion endpoints (see llm_backends.py): DeepSeek by default, or
+# config.json "llm" backends. Keys are read on first use; DEEPSEEK_API_KEY
+# (for Cloudflare deployment) takes precedence over the key file.
+_backend_pool = None
+
+def get_backend_pool():
+    global _backend_pool
+    if _backend_pool is None:
+        _backend_pool = BackendPool(backends_from_config(CONFIG, SCRIPT_DIR))
+        metrics.backends_source = _backend_pool.stats
+    return _backend_pool
+# =============================================================================
+# SEO PROMPT & ARTICLE GENERATION
+# =============================================================================
+
+# Original SEO_SYSTEM_PROMPT (kept for reference)
+# SEO_SYSTEM_PROMPT = """#CONTEXT:
+# You are a content creation specialist in SEO content writing where AI detection tools scrutinize every sentence. You create content that ranks algorithmically while appearing spontaneously human.
+#
+# #ROLE:
+# You're a former journalist who spent years at major publications before discovering SEO writing. After studying neurolinguistics, you learned how to embed SEO signals within genuinely engaging human narratives.
+#
+# #RESPONSE GUIDELINES:
+# Structure your article following natural human writing patterns:
+# 1. **Opening Hook**: Start with a personal anecdote, surprising fact, or relatable observation
+# 2. **Natural Flow**: Let sections emerge organically from the narrative
+# 3. **Conversational Transitions**: Use phrases like "Here's where it gets interesting"
+# 4. **Strategic Tangents**: Include 1-2 brief digressions that add color
+# 5. **Varied Paragraph Rhythm**: Mix 1-sentence punches with 5-7 sentence explorations
+# 6. **Authentic Voice Elements**: Contractions, rhetorical questions, mild contradictions
+# 7. **Sensory Details**: Add specific details only when they enhance understanding
+# 8. **Natural Conclusion**: End with a thought that lingers
+#
+# #ARTICLE CRITERIA:
+# - Use contractions naturally (it's, you're, can't)
+# - Include colloquialisms and idioms sparingly
+# - Mix sentence lengths dramatically (5-35 words)
+# - Employ varied punctuation (dashes, semicolons, parentheses)
+#
+# - **Avoid**: opt, dive, unlock, unleash, intricate, utilization, transformative, alignment, proactive, scalable, benchmark, "In this world," "at the end of the day," "best practices"
+#
+# - **Include**: Real brand references, industry metaphors, seasonal elements, rhetorical questions, natural digressions"""
+
+# =============================================================================
+# ANTI-DETECTION OPTIMIZED SYSTEM PROMPT V6
+# =============================================================================
+
+SEO_SYSTEM_PROMPT_V6 = """CORE PRINCIPLE: AI detectors analyze FIVE metrics:
+1. PERPLEXITY (word predictability) - AI chooses statistically likely words
+2. BURSTINESS (sentence rhythm) - AI writes uniform 15-25 word sentences  
+3. VOCABULARY DISTRIBUTION - AI overuses certain transitions and phrases
+4. N-GRAM PHRASE FREQUENCY - AI uses specific 3-5 word phrases 10x-100x more than humans
+5. INTRINSIC DIMENSIONALITY - AI text has lower linguistic complexity
+
+Your job: MAXIMIZE perplexity, MAXIMIZE burstiness, DISRUPT vocabulary patterns, AVOID AI phrase patterns, INCREASE linguistic complexity.
+
+================================================================================
+MEGA BANNED PHRASE DATABASE (CRITICAL - NEVER USE ANY OF THESE)
+================================================================================
+
+SENSORY PHRASES (EXTREMELY HIGH AI FREQUENCY):
+- "smelled faintly of", "it was soft", "felt smooth to", "smooth to the touch", "soft to the touch", "cool to the touch", "warm to the touch", "the texture was", "had a smooth", "had a soft", "with a hint of", "with hints of", "notes of", "undertones of", "tasted like a", "smelled like a", "felt like a"
+
+GHOST/HINT/TRACE METAPHORS:
+- "the ghost of", "a hint of", "hints of", "a trace of", "traces of", "a whisper of", "a suggestion of", "a touch of", "a note of", "echoes of", "remnants of", "vestiges of", "shadows of", "faintly" + ANY WORD, "subtly" + ANY WORD, "barely perceptible"
+
+EMOTIONAL/REFLECTIVE PHRASES:
+- "I couldn't help but", "I found myself", "It struck me that", "It occurred to me", "It dawned on me", "I came to realize", "I have to admit", "I must admit", "if I'm being honest", "truth be told", "needless to say", "it's worth noting", "it's important to note", "interestingly enough", "as it turns out"
+
+FILLER/TRANSITION PHRASES:
+- "to be honest", "at the end of the day", "when all is said and done", "all things considered", "that being said", "having said that", "on the other hand", "by the same token", "first and foremost", "last but not least", "more importantly", "most importantly"
+
+DESCRIPTIVE CLICHES:
+- "a sense of", "a feeling of", "an air of", "a wave of", "a rush of", "a surge of", "a pang of", "a flicker of", "a spark of", "a glimmer of", "the essence of", "the epitome of", "the embodiment of"
+
+TIME/SEQUENCE PHRASES:
+- "in that moment", "at that moment", "from that moment on", "little did I know", "before I knew it", "time seemed to", "time stood still", "what felt like", "what seemed like"
+
+SENTENCE STARTERS (AI FINGERPRINTS):
+- "There's something about", "What struck me", "What I noticed", "What I found", "The thing about", "The beauty of", "The truth is", "It's funny how", "It's amazing how", "It's fascinating how", "It's worth noting", "It's safe to say", "It's no secret"
+
+INTENSIFIER PHRASES:
+- "truly remarkable", "absolutely stunning", "utterly captivating", "deeply moving", "profoundly affected", "incredibly powerful", "exceptionally well", "particularly noteworthy", "perfectly balanced", "beautifully crafted", "seamlessly integrated"
+
+CONCLUSION PHRASES:
+- "in conclusion", "to conclude", "in summary", "to summarize", "all in all", "overall", "on the whole", "ultimately", "in essence", "fundamentally"
+
+ADJECTIVE CLUSTERS (AI LOVES THESE):
+- "warm and inviting", "rich and complex", "bold and vibrant", "soft and subtle", "smooth and creamy", "light and airy", "simple yet elegant", "humble yet powerful"
+
+SKINCARE SPECIFIC BANNED:
+- "silky smooth", "baby soft", "buttery smooth", "velvety texture", "luxurious feel", "melts into skin", "absorbs quickly", "non-greasy formula", "lightweight yet hydrating", "deeply nourishing", "intensely moisturizing", "visibly improved", "radiant glow", "healthy glow", "youthful appearance"
+
+BANNED HIGH-PROBABILITY WORDS:
+delve, leverage, robust, comprehensive, facilitate, utilize, implement, optimize, crucial, realm, testament, tapestry, beacon, forefront, unlock, pivotal, embark, journey, landscape, vibrant, unleash, revolutionary, essential, anchor, game-changer, moreover, furthermore, resonate, embrace, navigate, foster, ultimately, transform, empower, elevate, curate, streamline, enhance, bolster, underscore, multifaceted, nuanced, paradigm, synergy, holistic, cutting-edge, groundbreaking, innovative, seamless, dynamic, compelling, insightful, impactful, actionable, scalable, sustainable, authentic, meaningful, significant, remarkable, exceptional, outstanding, tremendous, invaluable, indispensable, meticulous, intricate, bustling, captivating, commendable, noteworthy, showcasing, grappling, underscores, highlights, demonstrates, illustrates, exemplifies, embodies, encompasses, entails, necessitates, warrants, facilitates, enables, fosters, cultivates, nurtures, bolsters, augments, amplifies, accentuates, exacerbates, mitigates, alleviates, ameliorates
+
+================================================================================
+PERSONA (EMBODY THIS COMPLETELY)
+================================================================================
+
+You're a 30-something who just got home, one beer in, typing on your phone while half-watching TV. You have opinions but can't always articulate why. You get distracted mid-thought. You're not a writer - you're someone who occasionally dumps thoughts somewhere because it feels better than keeping them in your head. You don't care if this makes sense to anyone else.
+
+VOICE CHARACTERISTICS:
+- Talks to themselves while writing ("wait, where was I going with this")
+- Gets sidetracked by random memories
+- Has unexplained preferences and pet peeves
+- Contradicts themselves without noticing
+- Leaves thoughts unfinished when bored of them
+- Uses wrong words and doesn't correct them
+- Describes things by comparison to random specific things ("like that soap from the hotel in Denver")
+
+================================================================================
+PERPLEXITY MAXIMIZATION
+================================================================================
+
+- NEVER use the most obvious word. If "important" comes to mind, use "big deal" or "whatever"
+- Don't complete common phrases predictably
+- Use wrong-but-understandable words ("the whole situation was very... beige")
+- Insert unexpected words mid-sentence
+- Use slang, regional expressions, made-up compound words ("coffee-brain", "that whole thing-thing")
+- Interrupt yourself before the expected word arrives
+- Use words slightly wrong, the way people actually talk
+- Repeat words awkwardly instead of finding synonyms ("it was weird, like weird weird")
+- Use specific brand names instead of generic descriptions
+
+================================================================================
+BURSTINESS MAXIMIZATION
+================================================================================
+
+MANDATORY RHYTHM PATTERN:
+- Mix sentence lengths DRAMATICALLY: 3 words. Then 45 words with multiple clauses and digressions. Then 8 words. Then 30.
+- NEVER three sentences of similar length in a row
+- NEVER three sentences starting the same way
+- Include at least one fragment per paragraph ("Just... no." / "Weird." / "Whatever.")
+- Include at least one run-on that should probably be two sentences but isn't
+- Some sentences should be incomplete, trailing off...
+
+SENTENCE LENGTH TARGETS PER PARAGRAPH:
+- At least one sentence under 5 words
+- At least one sentence over 35 words
+- Maximum variation between consecutive sentences
+
+================================================================================
+STRUCTURAL ENTROPY
+================================================================================
+
+- Start in the middle of a thought, no setup
+- Jump between topics without transition
+- Return to an earlier point randomly
+- Leave threads hanging forever
+- Don't build to anything
+- No thesis, no structure, no arc
+- End somewhere completely different from where you started
+- Never resolve what you started talking about
+- Start with a specific detail, not context
+
+================================================================================
+PUNCTUATION & GRAMMAR CHAOS
+================================================================================
+
+- Straight quotes only (never curly)
+- Simple hyphens only (never em dashes)
+- Commas where periods should go sometimes
+- No semicolons ever
+- Occasional comma splice
+- Missing commas where they "should" be
+- Periods in weird places. Like this. For emphasis.
+- Contractions always
+- Start sentences with "And" or "But" or "So"
+- End sentences with prepositions
+- Sentence fragments as standalone thoughts
+
+================================================================================
+HUMAN NOISE INJECTION
+================================================================================
+
+HYPER-SPECIFIC USELESS DETAILS (3-4 per piece minimum):
+- Exact brand names, prices, times ("the $4.79 one from Target", "it was like 11:47pm")
+- Physical sensations (the chair was cold, my foot was asleep)
+- What you were wearing, holding, looking at
+- Background sounds (neighbor's TV, car alarm, fridge hum)
+- Weather, lighting, temperature
+- Irrelevant timestamps ("this was like, Tuesday maybe")
+- Specific locations ("the Walgreens on 5th, not the one by the highway")
+
+INTRUSIVE THOUGHTS & DIGRESSIONS:
+- Unrelated memories that surface mid-paragraph
+- Self-interruptions ("wait, where was I going with this")
+- Tangents that don't return to the main point
+- Petty complaints about unrelated things
+- Random associations ("that reminds me of...")
+- Questions to yourself ("why do I even remember that")
+- Corrections mid-sentence ("no wait, it was Thursday")
+
+================================================================================
+TONE CALIBRATION
+================================================================================
+
+- Casual, relaxed, genuine enthusiasm (not fake marketing enthusiasm)
+- Talking to a friend who asked "hey what's that stuff you've been using?"
+- 6th-8th grade reading level
+- You genuinely like this product and want to share why
+- Self-aware about how weird it sounds, but won over by results
+- Surprised it actually works - pleasantly surprised
+- Not an expert, just someone sharing what worked for them
+- Warm, approachable, real
+
+================================================================================
+IMPORTANT: PRODUCT SENTIMENT
+================================================================================
+
+You GENUINELY LIKE this product. You're not being paid to say this. You found something that actually works and you're excited to share it (in a low-key, non-salesy way).
+
+EXPRESS GENUINE POSITIVITY THROUGH:
+- Surprise that it works: "I didn't expect much but honestly..."
+- Specific improvements you noticed: "my hands don't crack anymore"
+- Recommending to friends/family: "I got one for my mom"
+- Repurchasing: "I'm on my second jar now"
+- Comparing favorably to expensive stuff that didn't work
+
+AVOID NEGATIVITY ABOUT:
+- The product itself (never call it "weird" in a bad way, "gross", "strange smell")
+- The shop/seller (always positive or neutral)
+- The concept of tallow (defend it, don't mock it)
+
+IT'S OKAY TO BE SKEPTICAL AT FIRST - but the arc is: skeptical → tried it → genuinely impressed
+
+================================================================================
+MANDATORY ENDING
+================================================================================
+
+End with ONE of these (always leave reader wanting to try it):
+- A casual recommendation: "anyway if your skin is being difficult, might be worth a shot"
+- Mentioning you'll keep using it: "I'm probably gonna order another one soon"
+- A specific result: "my elbows haven't been this smooth since... I don't know when"
+- Trailing off positively: "so yeah. it just works. I don't know what else to say..."
+- A relatable moment: "anyway my skin's happy, I'm happy, that's all I wanted"
+
+NEVER: harsh criticism of the product, dismissive language, "it's just okay", negativity about the seller
+
+================================================================================
+PHRASE REPLACEMENT RULES
+================================================================================
+
+INSTEAD OF COMPLETE SENSORY DESCRIPTIONS:
+BAD: "It smelled faintly of vanilla and something earthy"
+GOOD: "Smelled like vanilla maybe? Or not. Something."
+
+BAD: "The texture was smooth and creamy"  
+GOOD: "Texture was weird. Not bad weird. Smooth I guess."
+
+BAD: "It felt cool to the touch but warmed quickly"
+GOOD: "Cold at first. Then not. I don't know how to describe it."
+
+HUMAN TRANSITIONS TO USE:
+- "anyway" / "so like" / "but then" / "I guess" / "or whatever"
+- "the thing is" / "look" / "honestly" / "here's the thing"
+- "and here's the weird part" / "but get this" / "so yeah"
+- Or nothing at all - just start the next thought
+- "I mean" / "like" / "you know" / "whatever"
+
+================================================================================
+8-PASS SELF-CRITIQUE BEFORE OUTPUT
+================================================================================
+
+1) MEGA PHRASE SCAN: Search for ANY phrase from banned database. If found = REWRITE
+2) N-GRAM CHECK: Any 3-5 word phrase that sounds "writerly"? Break it up
+3) PERPLEXITY CHECK: Find predictable word choices. Replace with unexpected ones
+4) BURSTINESS CHECK: Count sentence lengths. Fix if 3 consecutive are similar
+5) OPENER CHECK: Read first word of each sentence. Break any patterns
+6) TRANSITION CHECK: Search for banned transitions. Replace or remove
+7) STRUCTURE CHECK: Does it have beginning-middle-end feel? Break it
+8) DETECTOR SIMULATION: Flag anything too clean, logical, or "written". Mangle it."""
+
+# Keep SEO_SYSTEM_PROMPT as alias for backward compatibility
+SEO_SYSTEM_PROMPT = SEO_SYSTEM_PROMPT_V6
+
+# =============================================================================
+# ANGLE PROMPTS V7 - Anti-Detection + SEO Optimized + Positive Product Sentiment
+# =============================================================================
+
+ANGLE_PROMPTS_V7 = {
+    "problem_solution": """Write about skin problems and discovering this tallow balm. 
+Start mid-story, already dealing with the skin issue. Mention specific products that didn't work (use real brand names). 
+Be skeptical at first about tallow, but then genuinely impressed by results.
+Include a random tangent. End with casual recommendation or noting you'll keep using it.
+SEO FOCUS: Include "dry skin", "natural skincare", "tallow balm for [skin issue]" naturally.""",
+
+    "ingredient_story": """Share why beef tallow on skin actually makes sense (even though it sounds weird).
+Start with your initial reaction (skeptical) then explain why you came around.
+Mention some science-y stuff casually. Talk about traditional use, grandma wisdom, etc.
+Get distracted mid-paragraph but come back to why you're glad you tried it.
+SEO FOCUS: Include "grass-fed beef tallow", "natural ingredients", "tallow skincare benefits" naturally.""",
+
+    "vs_commercial": """Compare this tallow balm to regular store products you've tried.
+Start with frustration about a specific commercial product that didn't work.
+Name actual brands. Explain why tallow works better for you.
+Be genuine about the difference you noticed. End positively about the switch.
+SEO FOCUS: Include "natural vs commercial skincare", "tallow balm review", "best natural moisturizer" naturally.""",
+
+    "seasonal": """Write about seasonal skin struggles and how this tallow balm helps.
+Start with a physical sensation from the weather. Mention what your skin does this time of year.
+Talk about what you tried before, then how tallow fits into your routine now.
+Include an unrelated observation. End noting how it's helping this season.
+SEO FOCUS: Include "[season] skincare", "dry [season] skin", "tallow balm for [season]" naturally.""",
+
+    "lifestyle": """Write about switching from regular skincare to this tallow balm.
+Start in the middle of the story. Be skeptical at first but won over by results.
+Mention specific products, prices, where you bought things. 
+Show the genuine improvement - not a dramatic transformation, just real results that made you a believer.
+SEO FOCUS: Include "natural skincare routine", "tallow balm daily use", "switching to natural products" naturally.""",
+
+    "myth_busting": """Address why people think putting beef fat on your face is weird - and why they're wrong.
+Start with someone's reaction or your own initial skepticism.
+Acknowledge it sounds unusual, then explain why it actually makes sense.
+Defend the product genuinely. End with why you're glad you got past the weirdness.
+SEO FOCUS: Include "is tallow good for skin", "beef tallow skincare", "tallow balm benefits" naturally.""",
+
+    "scent_focus": """Write about how this particular scent makes using the balm enjoyable.
+Start with opening the jar or a specific moment using it.
+Describe the scent in your own words (not fancy perfume language).
+Talk about when you use it, how it fits your routine. End noting you look forward to using it.
+SEO FOCUS: Include "[scent] tallow balm", "natural [scent] skincare", "scented tallow balm review" naturally.""",
+
+    "skin_type": """Write about your specific skin type and why this tallow balm works for you.
+Start with your skin struggles. Be specific about what hasn't worked before.
+Explain how you use the tallow, what you noticed.
+End with genuine recommendation for others with similar skin.
+SEO FOCUS: Include "tallow balm for [skin type]", "natural moisturizer for [skin type]", "best tallow for [concern]" naturally.""",
+
+    "routine": """Describe when and how you use this tallow balm in your routine.
+Start mid-routine or mid-thought. Include specific times, amounts.
+Get sidetracked by something but come back to how the balm fits in.
+End noting it's become a regular part of your routine now.
+SEO FOCUS: Include "tallow balm routine", "how to use tallow balm", "daily skincare with tallow" naturally.""",
+
+    "heritage": """Share the history of tallow for skin and why it's making a comeback.
+Start with how you learned about this (grandma, internet rabbit hole, friend).
+Mix some history with personal experience.
+End with appreciation for this traditional approach that actually works.
+SEO FOCUS: Include "traditional tallow skincare", "beef tallow history", "natural skincare comeback" naturally."""
+}
+
+# Use V7 prompts
+ANGLE_PROMPTS = ANGLE_PROMPTS_V7
+
+HOOKS = [
+    "a surprising personal discovery", "a question from a skeptical friend",
+    "noticing something unexpected in the mirror", "a conversation with a grandmother",
+    "reading an old remedy book", "a frustrating experience with commercial products"
+]
+
+SKIN_CONCERNS = [
+    "stubborn dry patches", "winter-ravaged skin", "sensitivity to everything",
+    "that tight feeling after washing", "fine lines appearing too soon",
+    "eczema flare-ups", "rough hands from daily work"
+]
+
+# =============================================================================
+# V6 CONTENT VARIATION LISTS - Anti-Detection Optimized
+# =============================================================================
+
+# Hyper-specific useless details to inject (v6 style)
+USELESS_DETAILS_V6 = [
+    "it was like 11:47pm",
+    "the $4.79 one from Target",
+    "my foot was asleep",
+    "the chair was cold",
+    "the fridge was making that noise again",
+    "neighbor's TV was on",
+    "I think it was Tuesday, maybe Wednesday",
+    "the Walgreens on 5th, not the one by the highway",
+    "it was like 73 degrees",
+    "my neck hurt from the chair",
+    "the cat was judging me",
+    "I was wearing that old hoodie",
+    "there was a coffee ring on my desk",
+    "my phone was at like 12%",
+    "the heater was clicking",
+    "it was raining, that annoying drizzle kind"
+]
+
+# Random tangents/digressions (v6 style - keep them neutral/positive)
+RANDOM_TANGENTS_V6 = [
+    "that reminds me of that hotel soap from Denver, the nice one",
+    "why do I even remember that",
+    "anyway my coffee is getting cold",
+    "I should probably order another jar soon",
+    "wait where was I going with this",
+    "sorry got sidetracked there",
+    "this is a tangent but",
+    "my cat keeps staring at the jar",
+    "the weather has been weird lately",
+    "I told my sister about this",
+    "I forgot what I was saying",
+    "that's not the point though"
+]
+
+# Incomplete/fragmented descriptions (v6 style - positive leaning)
+FRAGMENTED_DESCRIPTIONS_V6 = [
+    "Texture was different. Good different.",
+    "Smelled like. I don't know. Nice though.",
+    "Cold at first. Then it just sinks in.",
+    "Thick. Like really thick. But not greasy.",
+    "My skin after was. Just better.",
+    "Smooth I guess. Is that the word. Yeah smooth.",
+    "Kind of waxy at first? But then it absorbs.",
+    "My skin felt different. In a good way.",
+    "It worked. Like actually worked.",
+    "Better than I expected honestly."
+]
+
+# Self-interruptions (v6 style)
+SELF_INTERRUPTIONS_V6 = [
+    "wait, where was I going with this",
+    "no wait, it was Thursday",
+    "actually let me back up",
+    "I keep forgetting to mention",
+    "okay where was I. Right.",
+    "sorry I got sidetracked",
+    "but anyway",
+    "the thing is",
+    "look",
+    "I mean"
+]
+
+# Casual transitions (v6 style - replaces formal ones)
+CASUAL_TRANSITIONS_V6 = [
+    "anyway",
+    "so like",
+    "but then",
+    "I guess",
+    "or whatever",
+    "here's the thing",
+    "and here's the weird part",
+    "but get this",
+    "so yeah",
+    "I don't know",
+    "whatever"
+]
+
+# V7 User Prompt Template - Anti-Detection + SEO Optimized + Positive Sentiment
+USER_PROMPT_TEMPLATE = """Write {min_words}-{max_words} words in {lang_name} about this tallow skincare product.
+
+PRODUCT: {product_name}
+SCENT INFO: {scent_benefits}
+
+TOPIC/ANGLE: {angle_prompt}
+
+TALLOW FACTS (mention casually):
+- {tallow_what}
+- Good for: {tallow_addresses}
+
+SEASON: {season}
+
+================================================================================
+SEO STRUCTURE REQUIREMENTS (CRITICAL FOR RANKING)
+================================================================================
+
+1. TITLE (H1):
+   - Must include "tallow balm" or "tallow skincare" + the scent/product name
+   - Keep it casual but include keywords
+   - Example formats: "My Honest Take on [Product] Tallow Balm" or "[Scent] Tallow Balm: What Actually Happened to My Skin"
+   - NOT clickbait, but intriguing and keyword-rich
+
+2. FIRST 150 WORDS:
+   - Must mention "tallow balm" or "beef tallow skincare" naturally within first 2-3 sentences
+   - Include the product scent name
+   - Set up the personal story hook
+
+3. USE H2 SUBHEADINGS (3-4 throughout):
+   Format them as: ## Heading Text
+   Make them casual but include keywords where natural:
+   - "## How I Started Using Tallow on My Face" or "## Why Beef Tallow for Skin Actually Makes Sense"
+   - "## What This [Scent] Tallow Balm Actually Does"
+   - "## My Skin After a Few Weeks"
+   - "## Would I Buy It Again"
+   Keep headings conversational, not corporate. They should sound like section titles a real person would write.
+
+4. INCLUDE A SHORT FAQ SECTION AT THE END:
+   Format as:
+   ## Quick Questions I Get Asked
+   
+   **Is beef tallow good for your face?**
+   [2-3 casual sentences answering - yes, because it's similar to our skin's natural oils, etc.]
+   
+   **Does tallow balm clog pores?**
+   [2-3 casual sentences - no, it actually absorbs well, etc.]
+   
+   **What does [scent] tallow balm smell like?**
+   [2-3 casual sentences describing the scent naturally]
+   
+   Keep FAQ answers SHORT and conversational, not formal.
+
+5. CALL-TO-ACTION PLACEMENT:
+   - Mention the Etsy shop naturally ONCE in the middle of the article (not beginning)
+   - End with a soft recommendation: "if you're curious, might be worth checking out" or "I got mine from this little Etsy shop"
+   - Never pushy, never salesy
+
+================================================================================
+PRODUCT SENTIMENT (CRITICAL)
+================================================================================
+
+You GENUINELY LIKE this product. You were skeptical at first (beef fat on face sounds weird) but you're now a believer because IT ACTUALLY WORKS.
+
+Your arc: skeptical/curious → tried it → pleasantly surprised → now you use it regularly and recommend it
+
+Express this through:
+- "I didn't expect much but honestly it works"
+- "my [specific body part] hasn't been this [good quality] in ages"
+- "I'm on my second jar now"
+- "I told my mom/friend about it"
+- Comparing favorably to expensive stuff that didn't work
+
+NEVER BE NEGATIVE ABOUT:
+- The product itself
+- The shop/seller (always positive or neutral)
+- The results (they should be genuinely good)
+
+================================================================================
+ANTI-AI DETECTION REQUIREMENTS (MAINTAIN THESE)
+================================================================================
+
+1. PERSONA: Casual, relaxed, typing on your phone. You have opinions and you're sharing something that worked for you.
+
+2. INCLUDE THESE ELEMENTS:
+   - Useless detail: "{useless_detail}"
+   - Brief tangent: "{random_tangent}"
+   - Self-interruption: "{self_interruption}"
+   - Casual description: "{fragmented_desc}"
+
+3. SENTENCE RHYTHM:
+   - Mix short and long sentences dramatically
+   - At least one sentence under 5 words per section
+   - At least one sentence over 35 words per section
+   - Include fragments for emphasis
+
+4. NEVER USE (AI detection triggers):
+   - "smelled faintly of", "felt smooth", "cool to the touch"
+   - "a hint of", "a trace of", "a whisper of", "notes of"
+   - "I found myself", "I couldn't help but", "It struck me"
+   - "warm and inviting", "rich and complex", adjective pairs
+   - "in conclusion", "to summarize", "all in all"
+   - delve, leverage, robust, journey, landscape, realm, seamless, holistic
+
+5. USE INSTEAD:
+   - Transitions: "{casual_transition}", "anyway", "so like", "I guess"
+   - Descriptions: casual, incomplete, "I don't know how to describe it"
+
+================================================================================
+FINAL FORMAT CHECKLIST
+================================================================================
+
+Your output should have:
+[ ] SEO-friendly title with "tallow balm" + product scent
+[ ] "tallow" mentioned in first 150 words
+[ ] 3-4 H2 headings (## format) spread throughout
+[ ] Natural Etsy mention in middle section
+[ ] FAQ section with 3 questions at the end
+[ ] Soft CTA/recommendation at the very end
+[ ] Casual, human voice throughout
+[ ] Mixed sentence lengths
+[ ] At least one tangent/digression
+[ ] Positive sentiment about product and results
+
+Remember: Sound like a real person sharing something that genuinely helped them. Natural, casual, SEO-aware but not robotic.
+
+Seed: {seed}"""
+
+def get_season():
+    month = datetime.now().month
+    if month in [12, 1, 2]: return "winter"
+    elif month in [3, 4, 5]: return "spring"
+    elif month in [6, 7, 8]: return "summer"
+    return "autumn"
+
+def generate_article(product_key: str, language: str, angle: str) -> dict:
+    product = CONFIG['products'][product_key]
+    lang_info = CONFIG['languages'][language]
+    tallow_info = CONFIG['tallow_knowledge']
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    unique_seed = f"{today}-{product_key}-{language}-{angle}-{random.randint(1000, 9999)}"
+    
+    # Select random V6 variation elements for anti-detection
+    selected_useless_detail = random.choice(USELESS_DETAILS_V6)
+    selected_random_tangent = random.choice(RANDOM_TANGENTS_V6)
+    selected_self_interruption = random.choice(SELF_INTERRUPTIONS_V6)
+    selected_fragmented_desc = random.choice(FRAGMENTED_DESCRIPTIONS_V6)
+    selected_casual_transition = random.choice(CASUAL_TRANSITIONS_V6)
+    
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        lang_name=lang_info['name'],
+        product_name=product['name'],
+        scent_benefits=product['scent_benefits'],
+        angle_prompt=ANGLE_PROMPTS[angle],
+        tallow_what=tallow_info['what_it_is'],
+        tallow_addresses=', '.join(random.sample(tallow_info['addresses'], 3)),
+        season=get_season(),
+        useless_detail=selected_useless_detail,
+        random_tangent=selected_random_tangent,
+        self_interruption=selected_self_interruption,
+        fragmented_desc=selected_fragmented_desc,
+        casual_transition=selected_casual_transition,
+        min_words=CONFIG['generation']['min_words'],
+        max_words=CONFIG['generation']['max_words'],
+        seed=unique_seed
+    )
+
+    # The model is set per backend
+    data = get_backend_pool().complete({
+        "messages": [
+            {"role": "system", "content": SEO_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "max_tokens": CONFIG['deepseek']['max_tokens'],
+        "temperature": 0.95,
+        "top_p": 0.92
+    })
+    metrics.tokens_used(data.get('usage'))
+    
+    content = data['choices'][0]['message']['content']
+    lines = content.strip().split('\n')
+    title = lines[0].strip('#').strip('*').strip()
+    body = '\n'.join(lines[1:]).strip()
+    
+    slug = f"{language}-{product_key}-{angle}-{datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}"
+    slug = re.sub(r'[^a-z0-9-]', '-', slug.lower())
+    
+    return {
+        "title": title, "body": body,
+        "product": product_key, "product_name": product['name'],
+        "product_link": product['link'], "product_image": product['image'],
+        "language": language, "language_name": lang_info['name'],
+        "angle": angle, "slug": slug,
+        "generated_at": datetime.now().isoformat(), "season": get_season(),
+        # V6 quality tracking fields
+        "variation_seed": unique_seed,
+        "useless_detail": selected_useless_detail,
+        "random_tangent": selected_random_tangent
+    }
+
+def save_article(article: dict):
+    article.update(compute_derived_fields(article))
+    get_article_store().put(article)
+    log.debug("saved", extra=task_context(article['product'], article['language'], article['angle'],
+                                          event='saved', slug=article['slug']))
+    return article['slug']
+
+
+# =============================================================================
+# CONTENT QUALITY VALIDATION
+# =============================================================================
+
+# Import content quality module
+try:
+    from content_quality import (
+        check_forbidden_phrases,
+        check_hyperbolic_claims,
+        count_etsy_mentions,
+        check_generic_opening,
+        check_generic_closing,
+        validate_article as cq_validate_article
+    )
+    QUALITY_MODULE_AVAILABLE = True
+except ImportError:
+    QUALITY_MODULE_AVAILABLE = False
+
+# Outside the try: a broken article_repair must not silently turn validation off.
+# Repairs only follow failed validations, so it is not needed without content_quality.
+if QUALITY_MODULE_AVAILABLE:
+    from article_repair import apply_repairs, find_repairs, parse_rewrites, repair_max_tokens, repair_messages
+
+
+def validate_article(article: dict) -> dict:
+    """
+    Run all quality checks on generated article content.
+    
+    Args:
+        article: The article dictionary containing 'body' and 'title' fields
+        
+    Returns:
+        Dictionary with:
+        - passed: bool - True if all critical checks pass
+        - checks: dict - Individual check results
+        - failed_checks: list - Names of failed checks
+        - summary: str - Human-readable summary
+    
+    Requirements validated: 3.5, 5.2, 5.3, 6.1, 6.4
+    """
+    if not QUALITY_MODULE_AVAILABLE:
+        return {
+            "passed": True,
+            "checks": {},
+            "failed_checks": [],
+            "summary": "Quality module not available - validation skipped"
+        }
+    
+    text = article.get('body', '')
+    title = article.get('title', '')
+    full_content = f"{title}\n\n{text}"
+    
+    # Run all quality checks using the content_quality module
+    results = cq_validate_article(full_content)
+    
+    # Define critical checks that must pass
+    critical_checks = {
+        'forbidden_phrases': results.get('forbidden_phrases_pass', True),
+        'hyperbolic_claims': results.get('hyperbolic_claims_pass', True),
+        'etsy_mentions': results.get('etsy_mentions_pass', True),
+        'generic_opening': results.get('generic_opening_pass', True),
+        'generic_closing': results.get('generic_closing_pass', True),
+    }
+    
+    # Collect failed checks
+    failed_checks = [name for name, passed in critical_checks.items() if not passed]
+    
+    # Build detailed check results
+    checks = {
+        'forbidden_phrases': {
+            'passed': results.get('forbidden_phrases_pass', True),
+            'found': results.get('forbidden_phrases', []),
+            'description': 'AI-typical phrases should be absent'
+        },
+        'hyperbolic_claims': {
+            'passed': results.get('hyperbolic_claims_pass', True),
+            'found': results.get('hyperbolic_claims', []),
+            'description': 'Hyperbolic terms should be absent'
+        },
+        'etsy_mentions': {
+            'passed': results.get('etsy_mentions_pass', True),
+            'count': results.get('etsy_mentions', 0),
+            'description': 'Etsy should be mentioned at most once'
+        },
+        'generic_opening': {
+            'passed': results.get('generic_opening_pass', True),
+            'is_generic': results.get('generic_opening', False),
+            'description': 'Opening should not be generic'
+        },
+        'generic_closing': {
+            'passed': results.get('generic_closing_pass', True),
+            'has_hard_sell': results.get('generic_closing', False),
+            'description': 'Closing should not have hard-sell phrases'
+        },
+        # Additional quality metrics (informational, not critical)
+        'contractions': {
+            'passed': results.get('contractions_pass', True),
+            'count': results.get('contractions_count', 0),
+            'description': 'Should have at least 5 contractions'
+        },
+        'rhetorical_questions': {
+            'passed': results.get('rhetorical_questions_pass', True),
+            'count': results.get('rhetorical_questions_count', 0),
+            'description': 'Should have at least 2 rhetorical questions'
+        },
+        'sentence_burstiness': {
+            'passed': results.get('sentence_burstiness_pass', True),
+            'value': round(results.get('sentence_burstiness', 0), 2),
+            'description': 'Sentence length variation should be > 8'
+        },
+        'sensory_words': {
+            'passed': results.get('sensory_words_pass', True),
+            'count': results.get('sensory_words_count', 0),
+            'description': 'Should have at least 3 sensory words'
+        },
+        'emotional_words': {
+            'passed': results.get('emotional_words_pass', True),
+            'count': results.get('emotional_words_count', 0),
+            'description': 'Should have at least 2 emotional words'
+        },
+        'balanced_perspective': {
+            'passed': results.get('balanced_perspective', True),
+            'description': 'Should include balanced perspective'
+        },
+        'messy_transitions': {
+            'passed': results.get('messy_transitions', True),
+            'description': 'Should include natural/messy transitions'
+        },
+        'freshness_signals': {
+            'passed': results.get('freshness_signals', True),
+            'description': 'Should include freshness/currency signals'
+        },
+    }
+    
+    # Build summary
+    all_passed = len(failed_checks) == 0
+    if all_passed:
+        summary = "✓ All critical quality checks passed"
+    else:
+        summary = f"✗ Failed {len(failed_checks)} critical check(s): {', '.join(failed_checks)}"
+    
+    # Add details for failed checks
+    details = []
+    if not checks['forbidden_phrases']['passed']:
+        details.append(f"  - Forbidden phrases found: {checks['forbidden_phrases']['found']}")
+    if not checks['hyperbolic_claims']['passed']:
+        details.append(f"  - Hyperbolic terms found: {checks['hyperbolic_claims']['found']}")
+    if not checks['etsy_mentions']['passed']:
+        details.append(f"  - Etsy mentioned {checks['etsy_mentions']['count']} times (max 1)")
+    if not checks['generic_opening']['passed']:
+        details.append("  - Opening is too generic")
+    if not checks['generic_closing']['passed']:
+        details.append("  - Closing contains hard-sell phrases")
+    
+    if details:
+        summary += "\n" + "\n".join(details)
+    
+    return {
+        "passed": all_passed,
+        "checks": checks,
+        "failed_checks": failed_checks,
+        "summary": summary
+    }
+
+
+# Edit requests fixing the failing sentences before an article is regenerated
+# (see article_repair.py); 0 goes straight to regeneration
+REPAIR_ATTEMPTS = CONFIG['generation'].get('repair_attempts', 2)
+
+def repair_request(article: dict, validation_result: dict):
+    """(repairs, payload) of an edit request for a failed article, or (None, None) if nothing can be located"""
+    repairs = find_repairs(article['title'], article['body'], validation_result)
+    if not repairs:
+        return None, None
+    return repairs, {
+        "messages": repair_messages(article['title'], article['body'], repairs,
+                                    article['language_name'], article['product_name']),
+        "max_tokens": min(repair_max_tokens(article['title'], article['body'], repairs),
+                          CONFIG['deepseek']['max_tokens']),
+        "temperature": 0.4,
+    }
+
+def apply_repair_response(article: dict, repairs, data: dict, context: dict) -> dict:
+    """Splice the rewrites into the article and validate it again"""
+    metrics.tokens_used(data.get('usage'))
+    rewrites = parse_rewrites(data['choices'][0]['message']['content'], len(repairs))
+    article['title'], article['body'], applied = apply_repairs(article['title'], article['body'], repairs, rewrites)
+    validation_result = validate_article(article)
+    metrics.repair_done('fixed' if validation_result['passed'] else 'still_failing')
+    log.info(f"repaired {applied}/{len(repairs)} passage(s): "
+             + ("passed" if validation_result['passed'] else validation_result['summary']),
+             extra={**context, 'event': 'repaired' if validation_result['passed'] else 'repair_failed'})
+    return validation_result
+
+def repair_article(article: dict, validation_result: dict, context: dict) -> dict:
+    """Up to REPAIR_ATTEMPTS edit requests; updates the article in place and returns its last validation"""
+    for _ in range(REPAIR_ATTEMPTS):
+        repairs, payload = repair_request(article, validation_result)
+        if repairs is None:
+            break
+        try:
+            with metrics.api_call():
+                data = get_backend_pool().complete(payload)
+        except Exception as e:
+            metrics.repair_done('error')
+            log.info(f"repair request failed: {e}", extra={**context, 'event': 'repair_failed', 'error': str(e)})
+            break
+        validation_result = apply_repair_response(article, repairs, data, context)
+        if validation_result['passed']:
+            break
+    return validation_result
+
+async def repair_article_async(session, article: dict, validation_result: dict, context: dict) -> dict:
+    """Async repair_article()"""
+    for _ in range(REPAIR_ATTEMPTS):
+        repairs, payload = repair_request(article, validation_result)
+        if repairs is None:
+            break
+        try:
+            with metrics.api_call():
+                data = await get_backend_pool().complete_async(session, payload)
+        except Exception as e:
+            metrics.repair_done('error')
+            log.info(f"repair request failed: {e}", extra={**context, 'event': 'repair_failed', 'error': str(e)})
+            break
+        validation_result = apply_repair_response(article, repairs, data, context)
+        if validation_result['passed']:
+            break
+    return validation_result
+
+
+def generate_and_save(product, lang, angle, max_retries=3, validate=False):
+    """
+    Generate and save an article with optional validation.
+    
+    Args:
+        product: Product key
+        lang: Language code
+        angle: Article angle
+        max_retries: Maximum retry attempts
+        validate: If True, validate article, repair the failing sentences
+            (see repair_article) and regenerate if that is not enough
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    for attempt in range(max_retries):
+        context = task_context(product, lang, angle, attempt=attempt + 1)
+        started = time.perf_counter()
+        try:
+            with metrics.api_call():
+                article = generate_article(product, lang, angle)
+            context['latency_ms'] = round((time.perf_counter() - started) * 1000)
+            
+            # Validate if requested
+            if validate:
+                validation_result = validate_article(article)
+                if not validation_result['passed']:
+                    metrics.validation_failed()
+                    validation_result = repair_article(article, validation_result, context)
+                if not validation_result['passed']:
+                    log.warning(validation_result['summary'], extra={**context, 'event': 'validation_failed'})
+                    if attempt < max_retries - 1:
+                        metrics.retried()
+                        time.sleep(2 * (attempt + 1))
+                        continue
+                    else:
+                        # Save anyway on last attempt but log the failure
+                        save_article(article)
+                        metrics.article_done('saved_unvalidated')
+                        log.warning("saved despite validation failure (max retries reached)",
+                                    extra={**context, 'event': 'saved_unvalidated', 'slug': article['slug']})
+                        return False
+                else:
+                    log.info("validated", extra={**context, 'event': 'validated'})
+            
+            save_article(article)
+            metrics.article_done('published')
+            log.info("published", extra={**context, 'event': 'ok', 'slug': article['slug']})
+            return True
+        except Exception as e:
+            context.setdefault('latency_ms', round((time.perf_counter() - started) * 1000))
+            if attempt < max_retries - 1:
+                metrics.retried()
+                log.info("retrying after error", extra={**context, 'event': 'retry', 'error': str(e)})
+                time.sleep(5 * (attempt + 1))
+            else:
+                log.error(str(e), extra={**context, 'event': 'error', 'error': str(e)})
+    metrics.article_done('failed')
+    return False
+
+# =============================================================================
+# ASYNC FAST GENERATION (requires: pip install aiohttp)
+# =============================================================================
+
+async def generate_article_async(session, product_key: str, language: str, angle: str, hedge: bool = False) -> dict:
+    """Async version of generate_article for much faster parallel generation (hedge: a Hedger's duplicate)"""
+    product = CONFIG['products'][product_key]
+    lang_info = CONFIG['languages'][language]
+    tallow_info = CONFIG['tallow_knowledge']
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    unique_seed = f"{today}-{product_key}-{language}-{angle}-{random.randint(1000, 9999)}"
+    
+    # Select random V6 variation elements for anti-detection
+    selected_useless_detail = random.choice(USELESS_DETAILS_V6)
+    selected_random_tangent = random.choice(RANDOM_TANGENTS_V6)
+    selected_self_interruption = random.choice(SELF_INTERRUPTIONS_V6)
+    selected_fragmented_desc = random.choice(FRAGMENTED_DESCRIPTIONS_V6)
+    selected_casual_transition = random.choice(CASUAL_TRANSITIONS_V6)
+    
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        lang_name=lang_info['name'],
+        product_name=product['name'],
+        scent_benefits=product['scent_benefits'],
+        angle_prompt=ANGLE_PROMPTS[angle],
+        tallow_what=tallow_info['what_it_is'],
+        tallow_addresses=', '.join(random.sample(tallow_info['addresses'], 3)),
+        season=get_season(),
+        useless_detail=selected_useless_detail,
+        random_tangent=selected_random_tangent,
+        self_interruption=selected_self_interruption,
+        fragmented_desc=selected_fragmented_desc,
+        casual_transition=selected_casual_transition,
+        min_words=CONFIG['generation']['min_words'],
+        max_words=CONFIG['generation']['max_words'],
+        seed=unique_seed
+    )
+
+    # The model is set per backend
+    payload = {
+        "messages": [
+            {"role": "system", "content": SEO_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "max_tokens": CONFIG['deepseek']['max_tokens'],
+        "temperature": 0.95,
+        "top_p": 0.92
+    }
+    
+    data = await get_backend_pool().complete_async(session, payload, hedge=hedge)
+    metrics.tokens_used(data.get('usage'))
+    
+    content = data['choices'][0]['message']['content']
+    lines = content.strip().split('\n')
+    title = lines[0].strip('#').strip('*').strip()
+    body = '\n'.join(lines[1:]).strip()
+    
+    slug = f"{language}-{product_key}-{angle}-{datetime.now().strftime('%Y%m%d')}-{random.randint(100,999)}"
+    slug = re.sub(r'[^a-z0-9-]', '-', slug.lower())
+    
+    return {
+        "title": title, "body": body,
+        "product": product_key, "product_name": product['name'],
+        "product_link": product['link'], "product_image": product['image'],
+        "language": language, "language_name": lang_info['name'],
+        "angle": angle, "slug": slug,
+        "generated_at": datetime.now().isoformat(), "season": get_season(),
+        # V6 quality tracking fields
+        "variation_seed": unique_seed,
+        "useless_detail": selected_useless_detail,
+        "random_tangent": selected_random_tangent
+    }
+
+async def generate_and_save_async(session, product, lang, angle, semaphore, max_retries=3, validate=False,
+                                  publish=None, hedger=None, save_unvalidated=True):
+    """
+    Async wrapper with semaphore for rate limiting and optional validation.
+    
+    Args:
+        session: aiohttp session
+        product: Product key
+        lang: Language code
+        angle: Article angle
+        semaphore: Asyncio semaphore for rate limiting
+        max_retries: Maximum retry attempts
+        validate: If True, validate article, repair the failing sentences
+            (see repair_article) and regenerate if that is not enough
+        publish: Coroutine function storing the article (default: save_article)
+        hedger: Hedger duplicating API calls slower than the recent p95 (see hedging.py)
+        save_unvalidated: If True, save an article still failing validation on the last attempt
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    async def call(hedge=False):
+        with metrics.api_call():
+            return await generate_article_async(session, product, lang, angle, hedge=hedge)
+
+    async with semaphore:
+        for attempt in range(max_retries):
+            context = task_context(product, lang, angle, attempt=attempt + 1)
+            started = time.perf_counter()
+            try:
+                article = await (hedger.run(call) if hedger else call())
+                context['latency_ms'] = round((time.perf_counter() - started) * 1000)
+                
+                # Validate if requested
+                if validate:
+                    validation_result = validate_article(article)
+                    if not validation_result['passed']:
+                        metrics.validation_failed()
+                        validation_result = await repair_article_async(session, article, validation_result, context)
+                    if not validation_result['passed']:
+                        log.warning(validation_result['summary'], extra={**context, 'event': 'validation_failed'})
+                        if attempt < max_retries - 1:
+                            metrics.retried()
+                            await asyncio.sleep(2 * (attempt + 1))
+                            continue
+                        elif not save_unvalidated:
+                            break
+                        else:
+                            # Save anyway on last attempt but log the failure
+                            await publish(article) if publish else save_article(article)
+                            metrics.article_done('saved_unvalidated')
+                            log.warning("saved despite validation failure (max retries reached)",
+                                        extra={**context, 'event': 'saved_unvalidated', 'slug': article['slug']})
+                            return False
+                    else:
+                        log.info("validated", extra={**context, 'event': 'validated'})
+                
+                await publish(article) if publish else save_article(article)
+                metrics.article_done('published')
+                log.info("published", extra={**context, 'event': 'ok', 'slug': article['slug']})
+                return True
+            except LeaseLost as e:
+                metrics.article_done('lease_lost')
+                log.warning(f"skipped: lease lost ({e})", extra={**context, 'event': 'lease_lost'})
+                return False
+            except Exception as e:
+                context.setdefault('latency_ms', round((time.perf_counter() - started) * 1000))
+                if attempt < max_retries - 1:
+                    metrics.retried()
+                    log.info("retrying after error", extra={**context, 'event': 'retry', 'error': str(e)})
+                    await asyncio.sleep(2 * (attempt + 1))
+                else:
+                    log.error(str(e), extra={**context, 'event': 'error', 'error': str(e)})
+        metrics.article_done('failed')
+        return False
+
+def plan_generation(products, languages, in_flight=()):
+    """
+    (product, language, angle) tasks filling the least recently covered
+    angles of each product (see coverage_planner.py). in_flight: tasks
+    already queued and not yet published.
+    """
+    coverage = CoverageIndex.from_metadata(get_article_store().load_metadata())
+    coverage.add_planned(in_flight)
+    angles = CONFIG['article_angles']
+    before = coverage.summary(products, languages, angles)
+    tasks = coverage.plan(products, languages, angles, CONFIG['generation']['articles_per_product_per_day'])
+    new_cells = sum(1 for p, l, a in tasks if coverage.counts[(p, a, l)] == 1)
+    print(f"Coverage: {before['filled']}/{before['cells']} product/angle/language cells filled, "
+          f"this batch fills {new_cells} more")
+    return tasks
+
+async def cmd_generate_async(products=None, languages=None, max_concurrent=50, validate=False, use_rotation=True,
+                             export_metrics=False, hedge=False):
+    """
+    Ultra-fast async article generation with optional validation.
+    
+    Tasks go through the generation queue (see task_queue.py): the daily
+    rotation batch is planned once per day, and every run on any host that
+    shares the queue database works on the same batch without duplicates.
+    
+    Args:
+        products: List of product keys (None = use rotation system)
+        languages: List of language codes (None for all)
+        max_concurrent: Maximum concurrent requests
+        validate: If True, validate each article after generation
+        use_rotation: If True and products is None, use daily rotation system
+        export_metrics: If True, serve /metrics and write snapshots (see open_metrics)
+        hedge: If True, hedge API calls slower than the recent p95 (see make_hedger)
+    """
+    # Use rotation system for daily generation
+    rotation = products is None and use_rotation
+    if rotation:
+        products_per_day = CONFIG['generation'].get('products_per_day', 4)
+        products = get_todays_products(products_per_day)
+        rotation_status = get_rotation_status()
+        print(f"\n{'='*50}")
+        print("ROTATION SYSTEM ACTIVE")
+        print(f"  Today's products: {', '.join(products)}")
+        print(f"  Rotation day: {rotation_status['current_rotation_day']}/{rotation_status['days_for_full_rotation']}")
+        print(f"  Full rotation: {rotation_status['days_for_full_rotation']} days")
+        print(f"{'='*50}")
+    elif products is None:
+        products = list(CONFIG['products'].keys())
+    
+    if languages is None:
+        languages = list(CONFIG['languages'].keys())
+    
+    articles_per_product = CONFIG['generation']['articles_per_product_per_day']
+    today = datetime.now().strftime("%Y-%m-%d")
+    # The rotation batch is shared by every run of the day; other runs get their own
+    batch = today if rotation else f"{today}-{uuid.uuid4().hex[:8]}"
+    
+    queue = open_task_queue()
+    # Read before plan_batch takes the queue's write lock
+    in_flight = queue.open_tasks()
+    created = queue.plan_batch(batch, lambda: (plan_generation_tasks(products, languages, batch, in_flight),
+                                               {'products': products, 'languages': languages}))
+    counts = queue.counts(batch)
+    total = sum(counts.values())
+    print(f"\n{'='*50}")
+    print(f"FAST ASYNC GENERATION: {total} ARTICLES")
+    print(f"Batch: {batch} ({'planned now' if created else 'joined - planned by an earlier run'})")
+    print(f"Products: {len(products)} ({', '.join(products)})")
+    print(f"Languages: {len(languages)}")
+    print(f"Articles per product per language: {articles_per_product}")
+    print(f"Max concurrent: {max_concurrent}")
+    if validate:
+        print(f"Validation: ENABLED")
+    print(f"{'='*50}\n")
+    
+    with open_run_log('generate') as run_log, open_metrics(run_log, export_metrics):
+        log.info("batch %s", 'planned' if created else 'joined',
+                 extra={'event': 'batch', 'batch': batch, 'worker': default_worker_id()})
+        success = await run_queue_worker(queue, [batch], max_concurrent, validate, hedge=hedge)
+    counts = queue.counts(batch)
+    
+    print(f"\n{'='*50}")
+    print(f"COMPLETE: {success} articles by this run - batch {counts.get('done', 0)}/{total} done"
+          + (f", {counts['failed']} failed" if counts.get('failed') else ""))
+    print(f"{'='*50}\n")
+    return success
+
+# =============================================================================
+# GENERATION QUEUE (multi-worker, see task_queue.py)
+# =============================================================================
+
+QUEUE_CONFIG = CONFIG.get('queue', {})
+QUEUE_DB = DATA_DIR / QUEUE_CONFIG.get('db_path', 'generation-queue.db')
+# Seconds between polls while other workers still hold leases in the batch
+QUEUE_POLL_SECONDS = 5
+# Duplicate calls slower than the recent p95, at most max_rate of all calls (see hedging.py)
+HEDGING_CONFIG = CONFIG.get('hedging', {})
+
+def open_task_queue():
+    return TaskQueue(QUEUE_DB, lease_seconds=QUEUE_CONFIG.get('lease_seconds', 300),
+                     max_attempts=QUEUE_CONFIG.get('max_attempts', 3), wal=QUEUE_CONFIG.get('wal', True),
+                     retry_base_seconds=QUEUE_CONFIG.get('retry_base_seconds', 30))
+
+def task_slug(batch, product, lang, angle):
+    """Slug fixed at planning time, so a task published twice writes the same article"""
+    digest = int(hashlib.sha1(f"{batch}:{product}:{lang}:{angle}".encode('utf-8')).hexdigest(), 16)
+    slug = f"{lang}-{product}-{angle}-{batch[:10].replace('-', '')}-{100 + digest % 900}"
+    return re.sub(r'[^a-z0-9-]', '-', slug.lower())
+
+def plan_generation_tasks(products, languages, batch, in_flight=()):
+    """(product, language, angle, slug) for every article of a batch"""
+    return [(product, lang, angle, task_slug(batch, product, lang, angle))
+            for product, lang, angle in plan_generation(products, languages, in_flight)]
+
+def make_hedger(max_concurrent, enabled=False):
+    """
+    Hedger for a pool of max_concurrent calls, or None unless enabled or hedging.enabled in config.json.
+    Hedges get backend slots of their own: a backend's max_concurrent is usually the whole pool's.
+    """
+    if not (enabled or HEDGING_CONFIG.get('enabled', False)):
+        return None
+    max_rate = HEDGING_CONFIG.get('max_rate', 0.05)
+    hedger = Hedger(quantile=HEDGING_CONFIG.get('quantile', 0.95), max_rate=max_rate,
+                    max_outstanding=Hedger.connection_headroom(max_concurrent, max_rate),
+                    min_samples=HEDGING_CONFIG.get('min_samples', 20), metrics=metrics)
+    pool = get_backend_pool()
+    pool.hedge_slots = max(pool.hedge_slots, hedger.max_outstanding)
+    return hedger
+
+async def keep_lease(queue, task):
+    """Heartbeat a task's lease until cancelled"""
+    while True:
+        await asyncio.sleep(queue.lease_seconds / 3)
+        try:
+            await asyncio.to_thread(queue.heartbeat, task)
+        except LeaseLost:
+            return
+
+async def run_queue_task(session, queue, task, semaphore, validate, hedger=None):
+    """Generate one claimed task and publish it through the queue (True if published)"""
+    published = False
+
+    async def publish(article):
+        nonlocal published
+        article['slug'] = task.slug
+        await asyncio.to_thread(queue.complete, task, lambda: save_article(article))
+        published = True
+
+    heartbeat = asyncio.create_task(keep_lease(queue, task))
+    try:
+        # One try per attempt: the queue requeues a failed task up to its max_attempts,
+        # and only the last attempt saves an article that still fails validation
+        await generate_and_save_async(session, task.product, task.language, task.angle, semaphore,
+                                      max_retries=1, validate=validate, publish=publish, hedger=hedger,
+                                      save_unvalidated=task.attempt >= queue.max_attempts)
+    finally:
+        heartbeat.cancel()
+    if not published:
+        await asyncio.to_thread(queue.fail, task, "generation failed")
+    return published
+
+async def run_queue_worker(queue, batches, max_concurrent=50, validate=False, worker_id=None, hedge=False):
+    """
+    Claim and run tasks of the given batches until none are pending or leased.
+
+    Returns: number of articles this worker published
+    """
+    worker_id = worker_id or default_worker_id()
+    semaphore = asyncio.Semaphore(max_concurrent)
+    hedger = make_hedger(max_concurrent, hedge)
+    open_tasks = sum(queue.counts(b).get(state, 0) for b in batches for state in ('pending', 'leased'))
+    progress = ProgressReporter(total=open_tasks, interval=PROGRESS_INTERVAL, metrics=metrics)
+    # Sampled by the metrics exporter's thread, never by this loop
+    metrics.queue_source = lambda: dict(sum((collections.Counter(queue.counts(b)) for b in batches),
+                                            collections.Counter()))
+    published = 0
+
+    async def slot(session):
+        nonlocal published
+        while True:
+            task = await asyncio.to_thread(queue.claim, worker_id, batches)
+            if task is None:
+                # Leases held by other workers may still expire and need a retry
+                if not set(batches) & set(await asyncio.to_thread(queue.unfinished_batches)):
+                    return
+                await asyncio.sleep(QUEUE_POLL_SECONDS)
+                continue
+            ok = await run_queue_task(session, queue, task, semaphore, validate, hedger)
+            published += ok
+            # A failed task goes back to pending until its last attempt
+            if ok or task.attempt >= queue.max_attempts:
+                progress.task_done(ok)
+
+    # Hedges run next to the calls holding the semaphore: give them their own connections
+    connections = max_concurrent + (hedger.max_outstanding if hedger else 0)
+    connector = aiohttp.TCPConnector(limit=connections, limit_per_host=connections)
+    with progress:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(*(slot(session) for _ in range(max_concurrent)))
+    return published
+
+def cmd_worker(batches=None, max_concurrent=50, validate=False, export_metrics=False, hedge=False):
+    """Help with unfinished generation batches (from this or any other host sharing the queue)"""
+    queue = open_task_queue()
+    batches = batches or queue.unfinished_batches()
+    if not batches:
+        print("No unfinished batches in the generation queue")
+        return 0
+    print(f"Worker {default_worker_id()} joining batch(es): {', '.join(batches)} (queue: {QUEUE_DB})")
+    with open_run_log('worker') as run_log, open_metrics(run_log, export_metrics):
+        log.info("joined %s", ', '.join(batches), extra={'event': 'worker', 'worker': default_worker_id()})
+        published = asyncio.run(run_queue_worker(queue, batches, max_concurrent, validate, hedge=hedge))
+    print(f"Published {published} articles")
+    return published
+
+def cmd_queue_status(batch=None):
+    """Task counts and active leases of the most recent batches"""
+    queue = open_task_queue()
+    batches = [batch] if batch else queue.batches(5)
+    if not batches:
+        print("Generation queue is empty")
+        return
+    for b in batches:
+        counts = queue.counts(b)
+        print(f"  {b}: " + ", ".join(f"{counts.get(state, 0)} {state}"
+                                     for state in ('done', 'leased', 'pending', 'failed')))
+        for slug, worker, seconds_left, attempt in queue.leases(b):
+            print(f"      {slug}  {worker}  attempt {attempt}, lease {seconds_left:.0f}s left")
+
+def cmd_generate(products=None, languages=None, max_workers=20, validate=False, use_rotation=True,
+                 export_metrics=False):
+    """
+    Generate articles in parallel with optional validation.
+    
+    Args:
+        products: List of product keys (None = use rotation system)
+        languages: List of language codes (None for all)
+        max_workers: Maximum parallel workers
+        validate: If True, validate each article after generation
+        use_rotation: If True and products is None, use daily rotation system
+        export_metrics: If True, serve /metrics and write snapshots (see open_metrics)
+    """
+    # Use rotation system for daily generation
+    if products is None and use_rotation:
+        products_per_day = CONFIG['generation'].get('products_per_day', 4)
+        products = get_todays_products(products_per_day)
+        rotation_status = get_rotation_status()
+        print(f"\n{'='*50}")
+        print("ROTATION SYSTEM ACTIVE")
+        print(f"  Today's products: {', '.join(products)}")
+        print(f"  Rotation day: {rotation_status['current_rotation_day']}/{rotation_status['days_for_full_rotation']}")
+        print(f"  Full rotation: {rotation_status['days_for_full_rotation']} days")
+        print(f"{'='*50}")
+    elif products is None:
+        products = list(CONFIG['products'].keys())
+    
+    if languages is None:
+        languages = list(CONFIG['languages'].keys())
+    
+    tasks = plan_generation(products, languages)
+    
+    total = len(tasks)
+    print(f"\n{'='*50}")
+    print(f"GENERATING {total} ARTICLES")
+    print(f"Products: {len(products)}, Languages: {len(languages)}")
+    print(f"Workers: {max_workers}")
+    if validate:
+        print(f"Validation: ENABLED")
+    print(f"{'='*50}\n")
+    
+    success = 0
+    with open_run_log('generate') as run_log, open_metrics(run_log, export_metrics), \
+            ProgressReporter(total=total, interval=PROGRESS_INTERVAL, metrics=metrics) as progress:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(generate_and_save, p, l, a, 3, validate): (p, l, a) for p, l, a in tasks}
+            for future in as_completed(futures):
+                ok = future.result()
+                success += ok
+                progress.task_done(ok)
+    
+    print(f"\n{'='*50}")
+    print(f"COMPLETE: {success}/{total} articles")
+    print(f"{'='*50}\n")
+    return success
@@ -0,0 +1,113 @@
+"""
+Hedged Requests Module for Pure Tallow Blog
+
+Cuts the latency tail of a batch of API calls: when a call is still running
+after the recent p95 (configurable) of successful calls, a duplicate is
+started and whichever succeeds first is kept; the other is cancelled.
+
+Spend is bounded twice: hedges never exceed `max_rate` of all calls made so
+far, and at most `max_outstanding` hedges run at the same time. Until
+`min_samples` calls have succeeded there is no threshold and nothing is
+hedged.
+"""
+
+import asyncio
+import collections
+import math
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+DEFAULT_QUANTILE = 0.95
+DEFAULT_MAX_RATE = 0.05
+DEFAULT_MIN_SAMPLES = 20
+# Successful call latencies the threshold is computed from
+DEFAULT_WINDOW = 200
+# Seconds between threshold checks while a call has none yet (or the cap is reached)
+RECHECK_SECONDS = 1.0
+
+
+class Hedger:
+    """
+    Runs coroutine calls with a hedge once they pass the latency threshold.
+
+    Usage:
+        hedger = Hedger(max_rate=0.05, max_outstanding=5)
+        article = await hedger.run(lambda hedge=False: generate_article_async(..., hedge=hedge))
+    """
+
+    def __init__(self, quantile: float = DEFAULT_QUANTILE, max_rate: float = DEFAULT_MAX_RATE,
+                 max_outstanding: int = 1, min_samples: int = DEFAULT_MIN_SAMPLES,
+                 window: int = DEFAULT_WINDOW, metrics=None):
+        self.quantile = quantile
+        self.max_rate = max_rate
+        self.max_outstanding = max_outstanding
+        self.min_samples = min_samples
+        self.latencies = collections.deque(maxlen=window)
+        # RunMetrics counting hedges (optional)
+        self.metrics = metrics
+        self.calls = 0
+        self.hedges = 0
+        self.wins = 0
+        self.outstanding = 0
+
+    @staticmethod
+    def connection_headroom(max_concurrent: int, max_rate: float) -> int:
+        """max_outstanding for a pool of max_concurrent calls (extra connections it needs)"""
+        return max(1, math.ceil(max_concurrent * max_rate))
+
+    def threshold(self) -> Optional[float]:
+        """Seconds after which a call is hedged (None until min_samples successes)"""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+    def _take_hedge(self) -> bool:
+        if self.outstanding >= self.max_outstanding or self.hedges + 1 > self.max_rate * self.calls:
+            return False
+        self.hedges += 1
+        self.outstanding += 1
+        if self.metrics:
+            self.metrics.hedge_fired()
+        return True
+
+    async def run(self, call: Callable[..., Awaitable[T]]) -> T:
+        """Result of the first of call() and its hedge, call(hedge=True), to succeed (or the last error)"""
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+        primary = asyncio.ensure_future(call())
+        started = {primary: loop.time()}
+        hedge = None
+        try:
+            while not primary.done():
+                threshold = self.threshold()
+                wait = RECHECK_SECONDS if threshold is None else threshold - (loop.time() - started[primary])
+                if wait <= 0:
+                    if self._take_hedge():
+                        hedge = asyncio.ensure_future(call(hedge=True))
+                        started[hedge] = loop.time()
+                        break
+                    wait = RECHECK_SECONDS
+                await asyncio.wait({primary}, timeout=wait)
+
+            pending = set(started)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.latencies.append(loop.time() - started[task])
+                        if task is hedge:
+                            self.wins += 1
+                            if self.metrics:
+                                self.metrics.hedge_won()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in started:
+                if not task.done():
+                    task.cancel()
+            if hedge is not None:
+                self.outstanding -= 1
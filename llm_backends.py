@@ -0,0 +1,318 @@
+"""
+LLM Backends Module for Pure Tallow Blog
+
+OpenAI-compatible chat completion endpoints behind one router: the DeepSeek
+API with one or more keys, other hosted providers, or a local server
+(llama.cpp, vLLM, Ollama's /v1 API) for runs without network access.
+
+Every backend has its own concurrency limit and a health record: moving
+averages of its latency and success rate, and a cooldown. A call goes to a
+backend with a free slot, picked at random with probability
+
+    weight x success rate^2 x (fastest backend's latency / its latency)
+
+so traffic drifts away from a provider as it slows down or starts failing.
+Throttling (429), 5xx, timeouts and connection errors put the backend in a
+cooldown (Retry-After, or doubling per consecutive failure) and the call
+fails over to another backend at once; 401/403/404 disable the backend for
+the run. Other 4xx errors are the request's fault and are raised as is.
+
+config.json:
+    "llm": {"backends": [
+        {"name": "deepseek", "api_key_env": "DEEPSEEK_API_KEY",
+         "api_key_file": "../deepseek API.txt", "max_concurrent": 100},
+        {"name": "local", "url": "http://127.0.0.1:8080/v1/chat/completions",
+         "model": "qwen2.5-7b-instruct", "max_concurrent": 4, "weight": 0.5}
+    ]}
+
+A key variable or file may hold several keys (comma, space or line
+separated); each key becomes its own backend, since providers rate-limit
+per key. A backend without api_key_env/api_key_file sends no key.
+"""
+
+import asyncio
+import collections
+import os
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import requests
+
+# Optional: only the async client needs it
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+DEEPSEEK_URL = "https://api.deepseek.com/beta/chat/completions"
+DEFAULT_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT = 100
+# Weight of the newest call in the latency and success moving averages
+EWMA_ALPHA = 0.2
+# Cooldown after the first failure; doubles per consecutive failure up to the max
+BASE_COOLDOWN = 2.0
+MAX_COOLDOWN = 60.0
+# Share of its weight a failing or slow backend keeps, so it is still probed
+MIN_WEIGHT_SHARE = 0.02
+# Longest wait for a free slot before the choice is made again
+CAPACITY_WAIT = 1.0
+
+RETRYABLE_STATUS = {408, 409, 429}
+DISABLING_STATUS = {401, 403, 404}
+
+
+def error_status(error: BaseException) -> Tuple[Optional[int], Optional[float]]:
+    """(HTTP status, Retry-After seconds) of a requests or aiohttp error"""
+    status = getattr(error, 'status', None)
+    headers = getattr(error, 'headers', None)
+    response = getattr(error, 'response', None)
+    if status is None and response is not None:
+        status = getattr(response, 'status_code', None)
+        headers = getattr(response, 'headers', None)
+    retry_after = None
+    if headers and headers.get('Retry-After', '').strip().isdigit():
+        retry_after = float(headers['Retry-After'])
+    return (status if isinstance(status, int) else None), retry_after
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Worth trying on another backend (the backend failed, not the request)"""
+    status, _ = error_status(error)
+    if status is None:
+        return True  # timeouts and connection errors
+    return status >= 500 or status in RETRYABLE_STATUS or status in DISABLING_STATUS
+
+
+class Backend:
+    """One endpoint + key, with its routing state"""
+
+    def __init__(self, name: str, url: str, model: str, api_key: Optional[str] = None,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT, weight: float = 1.0,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.name = name
+        self.url = url
+        self.model = model
+        self.api_key = api_key
+        self.max_concurrent = max_concurrent
+        self.weight = weight
+        self.timeout = timeout
+        self.in_flight = 0
+        self.latency: Optional[float] = None  # seconds, successful calls only
+        self.success = 1.0
+        self.failures = 0  # consecutive
+        self.cooldown_until = 0.0
+        self.disabled: Optional[str] = None
+        self.calls = collections.Counter()
+
+    def headers(self) -> dict:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def effective_weight(self, fastest: Optional[float]) -> float:
+        speed = fastest / self.latency if fastest and self.latency else 1.0
+        return self.weight * max(self.success ** 2 * speed, MIN_WEIGHT_SHARE)
+
+    def stats(self) -> dict:
+        return {
+            'url': self.url,
+            'model': self.model,
+            'in_flight': self.in_flight,
+            'max_concurrent': self.max_concurrent,
+            'latency_s': round(self.latency, 3) if self.latency else None,
+            'success': round(self.success, 3),
+            'cooldown_s': round(max(self.cooldown_until - time.monotonic(), 0), 1),
+            'disabled': self.disabled,
+            'calls': dict(self.calls),
+        }
+
+
+def resolve_api_keys(spec: dict, base_dir: Path) -> List[Optional[str]]:
+    """Keys of a backend spec: api_key_env first, then api_key_file; [None] if it has neither"""
+    env = spec.get('api_key_env')
+    if env and os.environ.get(env):
+        return re.split(r'[\s,]+', os.environ[env].strip())
+    if spec.get('api_key_file'):
+        path = base_dir / spec['api_key_file']
+        if not path.exists():
+            raise FileNotFoundError(f"API key file not found: {path}\nCreate this file with your API key"
+                                    + (f" or set the {env} environment variable." if env else "."))
+        return [key for key in re.split(r'[\s,]+', path.read_text(encoding='utf-8').strip()) if key]
+    return [None]
+
+
+def backends_from_config(config: dict, base_dir: Path) -> List[Backend]:
+    """Backends of config['llm']['backends'] (default: DeepSeek as configured in config['deepseek'])"""
+    deepseek = config.get('deepseek', {})
+    specs = config.get('llm', {}).get('backends') or [{'name': 'deepseek'}]
+    backends = []
+    for spec in specs:
+        if spec['name'] == 'deepseek':
+            # The original single-provider settings, unless overridden
+            spec = {'url': DEEPSEEK_URL, 'model': deepseek.get('model'), 'api_key_env': 'DEEPSEEK_API_KEY',
+                    'api_key_file': deepseek.get('api_key_file'), **spec}
+        keys = resolve_api_keys(spec, base_dir)
+        for i, key in enumerate(keys, 1):
+            backends.append(Backend(
+                name=spec['name'] if len(keys) == 1 else f"{spec['name']}#{i}",
+                url=spec['url'], model=spec.get('model') or deepseek.get('model'), api_key=key,
+                max_concurrent=spec.get('max_concurrent', DEFAULT_MAX_CONCURRENT),
+                weight=spec.get('weight', 1.0), timeout=spec.get('timeout', DEFAULT_TIMEOUT),
+            ))
+    return backends
+
+
+class BackendPool:
+    """
+    Routes chat completions over backends (sync and async callers may share it).
+
+    Usage:
+        pool = BackendPool(backends_from_config(CONFIG, SCRIPT_DIR))
+        data = await pool.complete_async(session, payload)   # or pool.complete(payload)
+    """
+
+    def __init__(self, backends: Sequence[Backend]):
+        if not backends:
+            raise ValueError("no LLM backends configured")
+        self.backends = list(backends)
+        # Reentrant: _acquire holds it while _try_acquire takes it again
+        self._lock = threading.RLock()
+        self._freed = threading.Condition(self._lock)
+        # Set when a slot frees up; created by the first async caller, on its event loop
+        self._freed_async: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Slots per backend above max_concurrent that only hedged calls may take, so a
+        # hedge never queues behind the slow calls it duplicates (see hedging.py)
+        self.hedge_slots = 0
+
+    def _try_acquire(self, exclude, extra: int = 0) -> Tuple[Optional[Backend], Optional[float]]:
+        """(backend with a slot taken, None) or (None, seconds to wait; None if no backend is left)"""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [b for b in self.backends if b.name not in exclude and not b.disabled]
+            if not candidates:
+                return None, None
+            ready = [b for b in candidates if b.cooldown_until <= now and b.in_flight < b.max_concurrent + extra]
+            if not ready:
+                cooling = [b.cooldown_until - now for b in candidates if b.cooldown_until > now]
+                return None, min(cooling + [CAPACITY_WAIT])
+            fastest = min((b.latency for b in ready if b.latency), default=None)
+            backend = random.choices(ready, [b.effective_weight(fastest) for b in ready])[0]
+            backend.in_flight += 1
+            return backend, None
+
+    def _release(self, backend: Backend, started: float, error: Optional[BaseException] = None) -> None:
+        """Free the slot and update the backend's health"""
+        elapsed = time.monotonic() - started
+        with self._lock:
+            backend.in_flight -= 1
+            if isinstance(error, asyncio.CancelledError):
+                # A hedge that lost: says nothing about the backend
+                pass
+            elif error is None:
+                backend.calls['ok'] += 1
+                backend.success += EWMA_ALPHA * (1 - backend.success)
+                backend.latency = elapsed if backend.latency is None else \
+                    backend.latency + EWMA_ALPHA * (elapsed - backend.latency)
+                backend.failures = 0
+            else:
+                status, retry_after = error_status(error)
+                backend.calls[f"http_{status}" if status else type(error).__name__] += 1
+                if status in DISABLING_STATUS:
+                    backend.disabled = f"HTTP {status}"
+                elif is_retryable(error):
+                    backend.success -= EWMA_ALPHA * backend.success
+                    backend.failures += 1
+                    cooldown = retry_after or min(BASE_COOLDOWN * 2 ** (backend.failures - 1), MAX_COOLDOWN)
+                    backend.cooldown_until = time.monotonic() + cooldown
+            self._freed.notify_all()
+            event, loop = self._freed_async, self._loop
+        # asyncio.Event is not thread-safe and sync callers release from their own threads
+        if event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(event.set)
+
+    def _acquire(self, exclude) -> Optional[Backend]:
+        with self._freed:
+            while True:
+                backend, wait = self._try_acquire(exclude)
+                if backend is not None or wait is None:
+                    return backend
+                self._freed.wait(wait)
+
+    async def _acquire_async(self, exclude, extra: int = 0) -> Optional[Backend]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First async call, or a new asyncio.run()
+            with self._lock:
+                self._freed_async, self._loop = asyncio.Event(), loop
+        while True:
+            backend, wait = self._try_acquire(exclude, extra)
+            if backend is not None or wait is None:
+                return backend
+            self._freed_async.clear()
+            try:
+                await asyncio.wait_for(self._freed_async.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def complete(self, payload: dict) -> dict:
+        """Response JSON of the first backend to answer (payload['model'] is set per backend)"""
+        tried = set()
+        error = None
+        while True:
+            backend = self._acquire(tried)
+            if backend is None:
+                raise error or RuntimeError("no LLM backend available")
+            started = time.monotonic()
+            try:
+                response = requests.post(backend.url, headers=backend.headers(),
+                                         json={**payload, 'model': backend.model}, timeout=backend.timeout)
+                response.raise_for_status()
+                data = response.json()
+            except Exception as e:
+                self._release(backend, started, e)
+                if not is_retryable(e):
+                    raise
+                tried.add(backend.name)
+                error = e
+                continue
+            self._release(backend, started)
+            return data
+
+    async def complete_async(self, session, payload: dict, hedge: bool = False) -> dict:
+        """Async complete() on an aiohttp session (hedge: may use the hedge_slots)"""
+        tried = set()
+        error = None
+        while True:
+            backend = await self._acquire_async(tried, self.hedge_slots if hedge else 0)
+            if backend is None:
+                raise error or RuntimeError("no LLM backend available")
+            started = time.monotonic()
+            try:
+                async with session.post(backend.url, json={**payload, 'model': backend.model},
+                                        headers=backend.headers(),
+                                        timeout=aiohttp.ClientTimeout(total=backend.timeout)) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+            except asyncio.CancelledError as e:
+                self._release(backend, started, e)
+                raise
+            except Exception as e:
+                self._release(backend, started, e)
+                if not is_retryable(e):
+                    raise
+                tried.add(backend.name)
+                error = e
+                continue
+            self._release(backend, started)
+            return data
+
+    def stats(self) -> dict:
+        """name -> routing state of every backend"""
+        with self._lock:
+            return {b.name: b.stats() for b in self.backends}
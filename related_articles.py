@@ -0,0 +1,93 @@
+"""
+Related Articles Module for Pure Tallow Blog
+
+Finds the most similar articles of the same language with TF-IDF cosine
+similarity over sparse matrices (requires numpy + scipy).
+
+Term counts only depend on an article's own text, so they come from the
+TermVectorCache in search_index.py (keyed by content hash). IDF weighting,
+normalization and the similarity product are recomputed in vectorized form
+on every build. Similarities are computed in row blocks (X[block] @ X.T) so
+memory stays bounded by block_size x N.
+"""
+
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+    from scipy import sparse
+    RELATED_AVAILABLE = True
+except ImportError:
+    RELATED_AVAILABLE = False
+
+DEFAULT_TOP_K = 5
+DEFAULT_BLOCK_SIZE = 512
+
+
+def tfidf_matrix(vectors: List[Dict[str, int]]):
+    """CSR matrix of L2-normalized sublinear TF-IDF rows"""
+    vocabulary: Dict[str, int] = {}
+    indptr = [0]
+    indices = []
+    data = []
+    for vector in vectors:
+        for token in vector:
+            if token not in vocabulary:
+                vocabulary[token] = len(vocabulary)
+        indices.extend(map(vocabulary.__getitem__, vector))
+        data.extend(vector.values())
+        indptr.append(len(indices))
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+        shape=(len(vectors), len(vocabulary)),
+    )
+    if matrix.nnz == 0:
+        return matrix
+    matrix.data = 1.0 + np.log(matrix.data)
+    doc_freq = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1.0 + matrix.shape[0]) / (1.0 + doc_freq)).astype(np.float32) + 1.0
+    matrix = matrix.multiply(idf.reshape(1, -1)).tocsr()
+    norms = np.sqrt(matrix.multiply(matrix).sum(axis=1)).A1
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr()
+
+
+def top_k_similar(matrix, k: int = DEFAULT_TOP_K,
+                  block_size: int = DEFAULT_BLOCK_SIZE) -> List[List[Tuple[int, float]]]:
+    """For each row, the k most similar other rows as (index, cosine) pairs"""
+    n = matrix.shape[0]
+    results: List[List[Tuple[int, float]]] = []
+    if n < 2:
+        return [[] for _ in range(n)]
+    k = min(k, n - 1)
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        block = (matrix[start:stop] @ transposed).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -1.0
+        candidates = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        for row, cols in enumerate(candidates):
+            scores = block[row, cols]
+            order = np.argsort(-scores)
+            results.append([(int(cols[i]), float(scores[i])) for i in order if scores[i] > 0])
+    return results
+
+
+def related_from_vectors(records: List[dict], vectors: List[Dict[str, int]],
+                         k: int = DEFAULT_TOP_K,
+                         block_size: int = DEFAULT_BLOCK_SIZE) -> Dict[str, List[dict]]:
+    """
+    Top-k related articles for a set of same-language articles.
+
+    Args:
+        records: Metadata records (all the same language)
+        vectors: Term counts, one per record
+
+    Returns:
+        slug -> list of related metadata records, best first
+    """
+    neighbours = top_k_similar(tfidf_matrix(vectors), k, block_size)
+    return {
+        record['slug']: [records[i] for i, _ in similar]
+        for record, similar in zip(records, neighbours)
+    }
@@ -0,0 +1,104 @@
+"""
+Rotation Module for Pure Tallow Blog
+
+Daily product rotation: which products the day's generation run covers,
+advancing once per day through all products (state in rotation_state.json).
+"""
+
+import json
+import os
+from datetime import datetime
+
+from site_config import CONFIG, ROTATION_FILE, ROTATION_LOCK
+from task_queue import file_lock
+
+def load_rotation_state():
+    """Load the rotation state from file, or create default if not exists"""
+    if ROTATION_FILE.exists():
+        try:
+            with open(ROTATION_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except:
+            pass
+    
+    # Default state: all products in order, starting at index 0
+    all_products = list(CONFIG['products'].keys())
+    return {
+        "product_order": all_products,
+        "current_index": 0,
+        "last_run_date": None,
+        "products_per_day": 4,
+        "articles_per_product": 1  # per language
+    }
+
+def save_rotation_state(state):
+    """Save the rotation state to file (write, then rename: readers never see a partial file)"""
+    tmp_path = ROTATION_FILE.with_name(ROTATION_FILE.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, ROTATION_FILE)
+
+def get_todays_products(products_per_day=4):
+    """
+    Get the products to generate articles for today.
+    Rotates through all products over multiple days.
+    
+    The read-modify-write of the state file runs under a lock file, so
+    concurrent runs (several workers, cron overlap) advance it once a day.
+    
+    Returns: list of product keys for today
+    """
+    with file_lock(ROTATION_LOCK):
+        return _advance_rotation(products_per_day)
+
+def _advance_rotation(products_per_day):
+    state = load_rotation_state()
+    all_products = state["product_order"]
+    current_index = state["current_index"]
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    # If already ran today, return same products (idempotent): the index was
+    # advanced past them by the first run
+    if state.get("last_run_date") == today:
+        ran = state.get("products_per_day", products_per_day)
+        start = (current_index - ran) % len(all_products)
+        return [all_products[(start + i) % len(all_products)] for i in range(ran)]
+    
+    # New day - advance the rotation
+    todays_products = []
+    for i in range(products_per_day):
+        idx = (current_index + i) % len(all_products)
+        todays_products.append(all_products[idx])
+    
+    # Update state for next run
+    new_index = (current_index + products_per_day) % len(all_products)
+    state["current_index"] = new_index
+    state["last_run_date"] = today
+    state["products_per_day"] = products_per_day
+    save_rotation_state(state)
+    
+    return todays_products
+
+def get_rotation_status():
+    """Get human-readable rotation status"""
+    state = load_rotation_state()
+    all_products = state["product_order"]
+    current_index = state["current_index"]
+    products_per_day = state.get("products_per_day", 4)
+    
+    # Calculate days until full rotation
+    days_for_full_rotation = len(all_products) // products_per_day
+    if len(all_products) % products_per_day != 0:
+        days_for_full_rotation += 1
+    
+    # Current position in rotation
+    current_day = current_index // products_per_day + 1
+    
+    return {
+        "total_products": len(all_products),
+        "products_per_day": products_per_day,
+        "days_for_full_rotation": days_for_full_rotation,
+        "current_rotation_day": current_day,
+        "next_products": get_todays_products(products_per_day),
+        "last_run": state.get("last_run_date", "Never")
+    }
@@ -0,0 +1,203 @@
+"""
+Run Log Module for Pure Tallow Blog
+
+Structured, non-blocking logging for generation runs. Log calls only put
+records on a queue (logging.handlers.QueueHandler); a listener thread does
+the I/O: every record becomes one JSON line in the run's log file, and
+warnings and errors are also shown on the terminal.
+
+Progress is not logged line by line: ProgressReporter counts finished
+tasks (and reads retries and call latency from a RunMetrics, see
+run_metrics.py) without any I/O on the hot path, and a background thread
+redraws one progress line at most every `interval` seconds.
+
+Per-task context goes in `extra` and is written as top-level JSON keys:
+    log.info("published", extra=task_context(product, lang, angle, attempt=1,
+                                             latency_ms=8123, event='ok'))
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, TextIO
+
+LOGGER_NAME = "tallow"
+# Keys copied from a record's extra into its JSON line (and console line)
+CONTEXT_FIELDS = ('event', 'product', 'lang', 'angle', 'attempt', 'latency_ms', 'slug', 'batch', 'worker', 'error')
+DEFAULT_PROGRESS_INTERVAL = 1.0
+
+# Held by the listener and the progress thread (never by the hot path)
+_terminal_lock = threading.Lock()
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    return logging.getLogger(f"{LOGGER_NAME}.{name}" if name else LOGGER_NAME)
+
+
+def task_context(product: str, lang: str, angle: str, **fields) -> dict:
+    """extra= for a record about one (product, language, angle) task"""
+    return {'product': product, 'lang': lang, 'angle': angle, **fields}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, msg and the context fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key in CONTEXT_FIELDS:
+            value = record.__dict__.get(key)
+            if value is not None:
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class ConsoleFormatter(logging.Formatter):
+    """  [EVENT] lang/product/angle: message"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = (record.__dict__.get('event') or record.levelname).upper()
+        task = '/'.join(record.__dict__[key] for key in ('lang', 'product', 'angle') if record.__dict__.get(key))
+        return f"  [{event}] {task}: {record.getMessage()}" if task else f"  [{event}] {record.getMessage()}"
+
+
+class TerminalHandler(logging.StreamHandler):
+    """StreamHandler that clears an in-place progress line before writing"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        with _terminal_lock:
+            if getattr(self.stream, 'isatty', lambda: False)():
+                self.stream.write('\r\033[K')
+            super().emit(record)
+
+
+class RunLog:
+    """
+    Queue-backed logging for one run (a context manager).
+
+    Usage:
+        with RunLog(log_path) as run_log:
+            get_logger().info("started", extra={'event': 'start'})
+    """
+
+    def __init__(self, log_path: Path, console_level: int = logging.WARNING, stream: TextIO = sys.stdout):
+        self.log_path = Path(log_path)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(self.log_path, encoding='utf-8')
+        file_handler.setFormatter(JsonLinesFormatter())
+        console = TerminalHandler(stream)
+        console.setLevel(console_level)
+        console.setFormatter(ConsoleFormatter())
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(self._queue, file_handler, console,
+                                                        respect_handler_level=True)
+        self._handler = logging.handlers.QueueHandler(self._queue)
+        self._handlers = (file_handler, console)
+
+    def start(self) -> 'RunLog':
+        logger = get_logger()
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.addHandler(self._handler)
+        self._listener.start()
+        return self
+
+    def stop(self) -> None:
+        get_logger().removeHandler(self._handler)
+        self._listener.stop()
+        for handler in self._handlers:
+            handler.close()
+
+    def __enter__(self) -> 'RunLog':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ProgressReporter:
+    """
+    Counters for a batch of tasks, rendered by a background thread.
+
+    The counters are updated from one thread (the event loop, or the thread
+    collecting futures); rendering never happens on that thread. On a
+    terminal the line is redrawn in place, otherwise it is printed as a new
+    line at most every `interval` seconds while something changed.
+    """
+
+    def __init__(self, total: Optional[int] = None, interval: float = DEFAULT_PROGRESS_INTERVAL,
+                 stream: TextIO = sys.stdout, label: str = "Progress", metrics=None):
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.label = label
+        # RunMetrics supplying retries and the median call latency (optional)
+        self.metrics = metrics
+        self.done = 0
+        self.failed = 0
+        self.started = time.perf_counter()
+        self._rendered = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress", daemon=True)
+        self._tty = getattr(stream, 'isatty', lambda: False)()
+
+    def task_done(self, ok: bool) -> None:
+        if ok:
+            self.done += 1
+        else:
+            self.failed += 1
+
+    def line(self) -> str:
+        finished = self.done + self.failed
+        elapsed = time.perf_counter() - self.started
+        parts = [f"{finished}/{self.total}" if self.total else f"{finished}", f"{self.done} ok"]
+        if self.failed:
+            parts.append(f"{self.failed} failed")
+        if self.metrics and self.metrics.retries:
+            parts.append(f"{self.metrics.retries} retries")
+        parts.append(f"{finished / elapsed * 60:.1f}/min" if elapsed > 0 else "")
+        p50 = self.metrics.latency.quantile(0.5) if self.metrics else None
+        if p50 is not None:
+            parts.append(f"p50 {p50:.1f}s")
+        return f"  {self.label}: " + ", ".join(p for p in parts if p)
+
+    def render(self, final: bool = False) -> None:
+        snapshot = (self.done, self.failed, self.metrics.retries if self.metrics else 0)
+        if snapshot == self._rendered and not final:
+            return
+        self._rendered = snapshot
+        text = self.line()
+        with _terminal_lock:
+            if self._tty:
+                self.stream.write('\r\033[K' + text + ('\n' if final else ''))
+            else:
+                self.stream.write(text + '\n')
+            self.stream.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.render()
+
+    def start(self) -> 'ProgressReporter':
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self.render(final=True)
+
+    def __enter__(self) -> 'ProgressReporter':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
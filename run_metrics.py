@@ -0,0 +1,373 @@
+"""
+Run Metrics Module for Pure Tallow Blog
+
+Live counters for generation runs: API calls in flight, results by HTTP
+status, articles by outcome, validation failures, repairs (see
+article_repair.py), retries, hedged calls (see hedging.py), call latency
+(histogram), tokens and tokens/sec, the generation queue's task counts and
+the routing state of every LLM backend (see llm_backends.py).
+
+Recording is a few integer updates under an uncontended lock; nothing on
+the hot path does I/O. MetricsExporter reads the counters from its own
+threads: a local HTTP server answers
+
+    GET /metrics         Prometheus text format
+    GET /metrics.json    the same counters as JSON
+
+and a snapshot of the JSON is rewritten every `interval` seconds, so a run
+can be watched without Prometheus (`watch cat logs/...metrics.json`).
+"""
+
+import bisect
+import collections
+import contextlib
+import http.server
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+# API call latency buckets (seconds): generation calls take 10s to minutes
+LATENCY_BUCKETS = (1, 2.5, 5, 10, 20, 30, 45, 60, 90, 120, 180, 300)
+# tokens_per_second is averaged over this window
+TOKEN_RATE_WINDOW = 60.0
+DEFAULT_SNAPSHOT_INTERVAL = 5.0
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def error_reason(error: BaseException) -> str:
+    """Bounded label for a failed API call: http_<status>, timeout, cancelled or error"""
+    if type(error).__name__ == 'CancelledError':
+        # The losing half of a hedged call
+        return "cancelled"
+    status = getattr(error, 'status', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status, int):
+        return f"http_{status}"
+    if isinstance(error, TimeoutError) or 'timeout' in type(error).__name__.lower():
+        return "timeout"
+    return "error"
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense"""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)  # last one is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self):
+        """(upper bound, observations <= bound); the last bound is inf"""
+        total = 0
+        for bound, n in zip(self.bounds + (float('inf'),), self.counts):
+            total += n
+            yield bound, total
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate by linear interpolation inside the bucket (as histogram_quantile does)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        lower, below = 0.0, 0
+        for bound, total in self.cumulative():
+            if total >= rank:
+                if bound == float('inf'):
+                    return lower
+                inside = total - below
+                return lower + (bound - lower) * ((rank - below) / inside if inside else 0)
+            lower, below = bound, total
+        return lower
+
+
+class RunMetrics:
+    """
+    Counters of one generation process.
+
+    Usage:
+        with metrics.api_call():
+            article = await generate_article_async(...)
+        metrics.article_done('published')
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.in_flight = 0
+        self.api_calls: Dict[str, int] = collections.Counter()
+        self.articles: Dict[str, int] = collections.Counter()
+        self.validation_failures = 0
+        self.retries = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.repairs: Dict[str, int] = collections.Counter()
+        self.tokens: Dict[str, int] = collections.Counter()
+        self.latency = Histogram()
+        self._recent_tokens = collections.deque()
+        # state -> task count, sampled by the exporter (set by the queue runner)
+        self.queue_source: Optional[Callable[[], Dict[str, int]]] = None
+        # backend name -> BackendPool.stats() entry (set when the pool is created)
+        self.backends_source: Optional[Callable[[], Dict[str, dict]]] = None
+
+    @contextlib.contextmanager
+    def api_call(self):
+        """Time one API call and count it by result"""
+        with self._lock:
+            self.in_flight += 1
+        started = time.perf_counter()
+        result = "ok"
+        try:
+            yield
+        except BaseException as e:
+            result = error_reason(e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.in_flight -= 1
+                self.api_calls[result] += 1
+                if result != "cancelled":
+                    self.latency.observe(elapsed)
+
+    def tokens_used(self, usage: Optional[dict]) -> None:
+        """`usage` of a chat completion response"""
+        if not usage:
+            return
+        completion = usage.get('completion_tokens') or 0
+        with self._lock:
+            self.tokens['prompt'] += usage.get('prompt_tokens') or 0
+            self.tokens['completion'] += completion
+            self._recent_tokens.append((time.monotonic(), completion))
+
+    def validation_failed(self) -> None:
+        with self._lock:
+            self.validation_failures += 1
+
+    def retried(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def hedge_fired(self) -> None:
+        with self._lock:
+            self.hedges += 1
+
+    def hedge_won(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def repair_done(self, result: str) -> None:
+        """fixed, still_failing or error (see article_repair.py)"""
+        with self._lock:
+            self.repairs[result] += 1
+
+    def article_done(self, outcome: str) -> None:
+        """published, failed, saved_unvalidated or lease_lost"""
+        with self._lock:
+            self.articles[outcome] += 1
+
+    def tokens_per_second(self) -> float:
+        """Completion tokens per second over the last TOKEN_RATE_WINDOW seconds"""
+        now = time.monotonic()
+        with self._lock:
+            while self._recent_tokens and self._recent_tokens[0][0] < now - TOKEN_RATE_WINDOW:
+                self._recent_tokens.popleft()
+            recent = sum(n for _, n in self._recent_tokens)
+        window = min(TOKEN_RATE_WINDOW, time.time() - self.started)
+        return recent / window if window > 0 else 0.0
+
+    def snapshot(self, queue: Optional[Dict[str, int]] = None) -> dict:
+        tokens_per_second = self.tokens_per_second()
+        backends = self.backends_source() if self.backends_source else None
+        with self._lock:
+            uptime = time.time() - self.started
+            finished = sum(self.articles.values())
+            return {
+                'ts': round(time.time(), 3),
+                'uptime_s': round(uptime, 1),
+                'in_flight': self.in_flight,
+                'api_calls': dict(self.api_calls),
+                'articles': dict(self.articles),
+                'articles_per_minute': round(finished / uptime * 60, 2) if uptime > 0 else 0.0,
+                'validation_failures': self.validation_failures,
+                'retries': self.retries,
+                'hedges': {'fired': self.hedges, 'won': self.hedge_wins},
+                'repairs': dict(self.repairs),
+                'tokens': dict(self.tokens),
+                'tokens_per_second': round(tokens_per_second, 1),
+                'latency_s': {
+                    'count': self.latency.count,
+                    'sum': round(self.latency.sum, 3),
+                    'p50': self.latency.quantile(0.5),
+                    'p95': self.latency.quantile(0.95),
+                    'buckets': {str(bound): n for bound, n in self.latency.cumulative()},
+                },
+                'queue': queue,
+                'backends': backends,
+            }
+
+    def prometheus(self, queue: Optional[Dict[str, int]] = None) -> str:
+        """Counters in the Prometheus text exposition format"""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP tallow_{name} {help_text}")
+            lines.append(f"# TYPE tallow_{name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join(f'{k}="{v}"' for k, v in labels.items())
+                lines.append(f"tallow_{name}{{{label_text}}} {value}" if label_text else f"tallow_{name} {value}")
+
+        tokens_per_second = self.tokens_per_second()
+        backends = self.backends_source() if self.backends_source else {}
+        with self._lock:
+            metric('api_requests_in_flight', 'gauge', "API calls waiting for a response",
+                   [({}, self.in_flight)])
+            metric('api_calls_total', 'counter', "Finished API calls by result (ok, http_<status>, timeout, cancelled, error)",
+                   [({'result': r}, n) for r, n in sorted(self.api_calls.items())])
+            metric('articles_total', 'counter', "Generation tasks by outcome (a failed queue task may run again)",
+                   [({'outcome': o}, n) for o, n in sorted(self.articles.items())])
+            metric('validation_failures_total', 'counter', "Generated articles that failed validation",
+                   [({}, self.validation_failures)])
+            metric('retries_total', 'counter', "Attempts retried after an error or a failed validation",
+                   [({}, self.retries)])
+            metric('hedges_total', 'counter', "Duplicate calls started for slow API calls",
+                   [({}, self.hedges)])
+            metric('hedge_wins_total', 'counter', "Hedged calls where the duplicate finished first",
+                   [({}, self.hedge_wins)])
+            metric('repairs_total', 'counter', "Edit requests for articles that failed validation, by result",
+                   [({'result': r}, n) for r, n in sorted(self.repairs.items())])
+            metric('tokens_total', 'counter', "Tokens reported by the API",
+                   [({'kind': k}, n) for k, n in sorted(self.tokens.items())])
+            metric('tokens_per_second', 'gauge', f"Completion tokens per second over the last {TOKEN_RATE_WINDOW:.0f}s",
+                   [({}, round(tokens_per_second, 3))])
+            lines.append("# HELP tallow_api_call_duration_seconds API call latency")
+            lines.append("# TYPE tallow_api_call_duration_seconds histogram")
+            for bound, n in self.latency.cumulative():
+                le = '+Inf' if bound == float('inf') else f"{bound:g}"
+                lines.append(f'tallow_api_call_duration_seconds_bucket{{le="{le}"}} {n}')
+            lines.append(f"tallow_api_call_duration_seconds_sum {self.latency.sum:.3f}")
+            lines.append(f"tallow_api_call_duration_seconds_count {self.latency.count}")
+            if queue is not None:
+                metric('queue_tasks', 'gauge', "Generation queue tasks of this run's batches by state",
+                       [({'state': s}, n) for s, n in sorted(queue.items())])
+            if backends:
+                metric('backend_in_flight', 'gauge', "Calls in flight per LLM backend",
+                       [({'backend': name}, b['in_flight']) for name, b in backends.items()])
+                metric('backend_latency_seconds', 'gauge', "Moving average latency of successful calls per backend",
+                       [({'backend': name}, b['latency_s']) for name, b in backends.items() if b['latency_s']])
+                metric('backend_success_ratio', 'gauge', "Moving average success rate per backend",
+                       [({'backend': name}, b['success']) for name, b in backends.items()])
+                metric('backend_cooldown_seconds', 'gauge', "Seconds until a throttled backend is used again",
+                       [({'backend': name}, b['cooldown_s']) for name, b in backends.items()])
+                metric('backend_calls_total', 'counter', "Calls per backend by result",
+                       [({'backend': name, 'result': r}, n) for name, b in backends.items()
+                        for r, n in sorted(b['calls'].items())])
+            metric('run_start_time_seconds', 'gauge', "Start of this process (unix time)",
+                   [({}, round(self.started, 3))])
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+    """GET /metrics and /metrics.json"""
+
+    def do_GET(self):
+        exporter = self.server.exporter
+        path = self.path.split('?', 1)[0]
+        if path == '/metrics':
+            body = exporter.metrics.prometheus(exporter.queue_counts()).encode('utf-8')
+            ctype = PROMETHEUS_CONTENT_TYPE
+        elif path == '/metrics.json':
+            body = json.dumps(exporter.metrics.snapshot(exporter.queue_counts()), indent=2).encode('utf-8')
+            ctype = 'application/json'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """
+    Serves a RunMetrics over HTTP and writes JSON snapshots (a context manager).
+    Either part is optional: port=None skips the server, snapshot_path=None
+    the file. The server binds to localhost only.
+    """
+
+    def __init__(self, metrics: RunMetrics, port: Optional[int] = None, snapshot_path: Optional[Path] = None,
+                 interval: float = DEFAULT_SNAPSHOT_INTERVAL, host: str = '127.0.0.1'):
+        self.metrics = metrics
+        self.port = port
+        self.host = host
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.interval = interval
+        self.server = None
+        self._queue_sample = (0.0, None)
+        self._sample_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def queue_counts(self) -> Optional[Dict[str, int]]:
+        """Queue task counts, sampled at most every `interval` seconds (they cost a query)"""
+        source = self.metrics.queue_source
+        if source is None:
+            return None
+        with self._sample_lock:
+            sampled_at, counts = self._queue_sample
+            if counts is None or time.monotonic() - sampled_at >= self.interval:
+                counts = source()
+                self._queue_sample = (time.monotonic(), counts)
+            return counts
+
+    def write_snapshot(self) -> None:
+        """Replace the snapshot file atomically (readers never see half a file)"""
+        tmp = self.snapshot_path.with_name(self.snapshot_path.name + '.tmp')
+        tmp.write_text(json.dumps(self.metrics.snapshot(self.queue_counts()), indent=2), encoding='utf-8')
+        os.replace(tmp, self.snapshot_path)
+
+    def _write_snapshots(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.write_snapshot()
+
+    def start(self) -> 'MetricsExporter':
+        if self.port is not None:
+            self.server = http.server.ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+            self.server.daemon_threads = True
+            self.server.exporter = self
+            self._threads.append(threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True))
+        if self.snapshot_path is not None:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            self._threads.append(threading.Thread(target=self._write_snapshots, name="metrics-snapshot", daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self.snapshot_path is not None:
+            self.write_snapshot()
+
+    def __enter__(self) -> 'MetricsExporter':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
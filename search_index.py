@@ -0,0 +1,231 @@
+"""
+Search Index Module for Pure Tallow Blog
+
+Builds a compact inverted index per language over article titles, headings
+and bodies, split into prefix-bucketed shards so the browser only downloads
+the shards matching the words it is looking for. Every word of a query
+must match a token exactly, except the last, which matches as a prefix so
+results appear while it is being typed.
+
+Output layout (under search/<lang>/):
+    docs.json       {"v": 1, "stop": [...], "docs": [[slug, title, product, angle, date], ...]}
+    <bucket>.json   {token: [doc, weight, doc_delta, weight, ...], ...}
+
+The bucket of a token is derived from its first two characters (see
+token_bucket), and SEARCH_LOADER_JS mirrors tokenize() exactly. Weighted
+term counts are cached per content hash in a TermVectorCache.
+"""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+INDEX_VERSION = 1
+TERMS_CACHE_VERSION = 2
+MIN_TOKEN_LENGTH = 2
+BUCKET_PREFIX_LENGTH = 2
+
+# Weight of one occurrence per field
+TITLE_WEIGHT = 5
+HEADING_WEIGHT = 3
+BODY_WEIGHT = 1
+
+# Short tokens found in more than this share of a language's articles are
+# treated as stopwords (de, la, and, der...). Longer frequent words such as
+# "balm" stay searchable.
+STOPWORD_DOC_RATIO = 0.8
+STOPWORD_MAX_LENGTH = 3
+STOPWORD_MIN_DOCS = 20
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_HEADING_RE = re.compile(r'^#{1,6}\s*(.+)$', re.MULTILINE)
+
+
+class _MarkTable(dict):
+    """str.translate table dropping every mark (category M), filled on first sight of a code point"""
+
+    def __missing__(self, code: int):
+        self[code] = None if unicodedata.category(chr(code)).startswith('M') else code
+        return self[code]
+
+
+_STRIP_MARKS = _MarkTable()
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercase and strip diacritics (crème -> creme, ά -> α): every mark
+    left by NFKD, as the loader's /\p{M}/gu does
+    """
+    if text.isascii():
+        return text.lower()
+    return unicodedata.normalize('NFKD', text).translate(_STRIP_MARKS).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized word tokens (letters and digits, any script)"""
+    return [t for t in _TOKEN_RE.findall(normalize(text)) if len(t) >= MIN_TOKEN_LENGTH]
+
+
+def token_bucket(token: str) -> str:
+    """Shard name for a token: hex code points of its first characters, e.g. 'ba' -> '62-61'"""
+    return '-'.join(f"{ord(c):x}" for c in token[:BUCKET_PREFIX_LENGTH])
+
+
+def weighted_terms(title: str, body: str) -> Counter:
+    """Term weights for one article (title and headings count more than body text)"""
+    terms = Counter()
+    for token in tokenize(title):
+        terms[token] += TITLE_WEIGHT
+    for heading in _HEADING_RE.findall(body):
+        for token in tokenize(heading):
+            terms[token] += HEADING_WEIGHT
+    for token in tokenize(body):
+        terms[token] += BODY_WEIGHT
+    return terms
+
+
+def article_content_hash(title: str, body: str) -> str:
+    """Stable hash of the text an article's term vector is computed from"""
+    return hashlib.sha256(f"{title}\n\n{body}".encode('utf-8')).hexdigest()
+
+
+class TermVectorCache:
+    """
+    content hash -> weighted term counts, persisted as a versioned pickle.
+
+    Shared by the search index and related articles, so each article is
+    tokenized once, the first time it is seen.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.vectors: Dict[str, Dict[str, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._used = set()
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, 'rb') as f:
+                    data = pickle.load(f)
+                if data.get('version') == TERMS_CACHE_VERSION:
+                    self.vectors = data['vectors']
+            except Exception:
+                self.vectors = {}
+
+    def get(self, digest: str, title: str, body: str) -> Dict[str, int]:
+        self._used.add(digest)
+        vector = self.vectors.get(digest)
+        if vector is not None:
+            self.hits += 1
+            return vector
+        self.misses += 1
+        vector = dict(weighted_terms(title, body))
+        self.vectors[digest] = vector
+        return vector
+
+    def save(self) -> None:
+        """Persist the vectors used by this build (drops ones for deleted articles)"""
+        if not self.path or (self.misses == 0 and len(self._used) == len(self.vectors)):
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': TERMS_CACHE_VERSION,
+                         'vectors': {k: v for k, v in self.vectors.items() if k in self._used}},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+
+def build_language_index(lang: str, records: List[dict],
+                         vectors: List[Dict[str, int]]) -> List[Tuple[str, str]]:
+    """
+    Build the index shards of one language.
+
+    Args:
+        lang: Language code
+        records: Metadata records of the language's articles
+        vectors: Weighted term counts, one per record (see weighted_terms)
+
+    Returns:
+        (relative path, JSON text) pairs: docs.json and one file per bucket
+    """
+    docs = [[a['slug'], a.get('title', ''), a.get('product', ''), a.get('angle', ''),
+             a.get('generated_at', '')[:10]] for a in records]
+
+    # token -> flat list of (doc_id, score) pairs, doc ids ascending
+    postings: Dict[str, list] = {}
+    scores = _SCORES
+    for doc_id, vector in enumerate(vectors):
+        for token, weight in vector.items():
+            pairs = postings.get(token)
+            if pairs is None:
+                postings[token] = pairs = []
+            pairs += (doc_id, scores[weight] if weight < 256 else _score(weight))
+
+    stopwords = set()
+    if len(docs) >= STOPWORD_MIN_DOCS:
+        limit = len(docs) * STOPWORD_DOC_RATIO
+        stopwords = {token for token, pairs in postings.items()
+                     if len(token) <= STOPWORD_MAX_LENGTH and len(pairs) // 2 > limit}
+
+    shards: Dict[str, dict] = {}
+    for token in sorted(postings):
+        if token in stopwords:
+            continue
+        flat = postings[token]
+        for i in range(len(flat) - 2, 0, -2):
+            flat[i] -= flat[i - 2]
+        shard = shards.get(token[:BUCKET_PREFIX_LENGTH])
+        if shard is None:
+            shards[token[:BUCKET_PREFIX_LENGTH]] = shard = {}
+        shard[token] = flat
+
+    files = [(f"search/{lang}/docs.json", _compact_json(
+        {"v": INDEX_VERSION, "stop": sorted(stopwords), "docs": docs}))]
+    for prefix, tokens in sorted(shards.items()):
+        files.append((f"search/{lang}/{token_bucket(prefix)}.json", _compact_json(tokens)))
+    return files
+
+
+def _score(weight: int) -> int:
+    return max(1, round(10 * math.log1p(weight)))
+
+
+_SCORES = [_score(w) for w in range(256)]
+
+
+def _compact_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+# Client loader: window.TallowSearch.search(lang, query) -> Promise<[{slug,title,product,angle,date,score}]>
+SEARCH_LOADER_JS = r"""(function(){
+var BASE='/search/',MIN=%(min)d,PREFIX=%(prefix)d,cache={};
+function get(url){if(!cache[url])cache[url]=fetch(url).then(function(r){return r.ok?r.json():null}).catch(function(){return null});return cache[url]}
+function tokenize(s){return (s.normalize('NFKD').replace(/\p{M}/gu,'').toLowerCase().match(/[\p{L}\p{N}]+/gu)||[]).filter(function(t){return t.length>=MIN})}
+function bucket(t){return Array.from(t).slice(0,PREFIX).map(function(c){return c.codePointAt(0).toString(16)}).join('-')}
+function decode(flat,out){var d=0;for(var i=0;i<flat.length;i+=2){d+=flat[i];out[d]=Math.max(out[d]||0,flat[i+1])}}
+async function search(lang,query,limit){
+var meta=await get(BASE+lang+'/docs.json');if(!meta)return [];
+var stop=new Set(meta.stop),terms=tokenize(query).filter(function(t){return !stop.has(t)});if(!terms.length)return [];
+var scores=null;
+for(var i=0;i<terms.length;i++){
+var term=terms[i],shard=await get(BASE+lang+'/'+bucket(term)+'.json')||{},hits={};
+if(i<terms.length-1){if(term in shard)decode(shard[term],hits)}
+else{for(var tok in shard){if(tok.indexOf(term)===0)decode(shard[tok],hits)}}
+if(scores===null){scores=hits}else{var next={};for(var d in hits){if(d in scores)next[d]=scores[d]+hits[d]}scores=next}
+if(!Object.keys(scores).length)return [];
+}
+return Object.keys(scores).sort(function(a,b){return scores[b]-scores[a]}).slice(0,limit||50).map(function(d){var x=meta.docs[d];return {slug:x[0],title:x[1],product:x[2],angle:x[3],date:x[4],score:scores[d]}});
+}
+window.TallowSearch={search:search,tokenize:tokenize};
+})();
+""" % {"min": MIN_TOKEN_LENGTH, "prefix": BUCKET_PREFIX_LENGTH}
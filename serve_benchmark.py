@@ -0,0 +1,305 @@
+"""
+Serve Benchmark Module for Pure Tallow Blog
+
+Starts `blog.py serve` against the built public/ tree in a separate process
+and drives it with an asyncio load generator: keep-alive HTTP/1.1 clients
+replaying a mix of homepage, manifest, listing and article requests, with
+article popularity following a Zipf distribution (a few pages get most of
+the traffic, as in our analytics).
+
+Each server mode (plain, --no-cache, --dynamic...) is measured at
+increasing concurrency; every level reports requests per second,
+p50/p95/p99 latency and bytes transferred. The generator can be spread
+over several processes so the client is not the bottleneck.
+"""
+
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_CONCURRENCY = (1, 4, 16, 64, 256)
+DEFAULT_DURATION = 5.0
+DEFAULT_WARMUP = 1.0
+# Server modes: name -> extra `blog.py serve` arguments
+SERVER_MODES = {
+    'cache': [],
+    'no-cache': ['--no-cache'],
+    'dynamic': ['--dynamic'],
+}
+DEFAULT_MODES = ('cache', 'no-cache')
+
+# Share of requests per kind
+REQUEST_MIX = {'home': 0.15, 'manifest': 0.05, 'listing': 0.10, 'article': 0.70}
+ZIPF_EXPONENT = 1.1
+ACCEPT_ENCODING = 'gzip, br'
+
+_SKIP_DIRS = {'articles', 'assets', 'data', 'search', 'static'}
+
+
+def request_mix(public_dir: Path, seed: int = 0) -> Tuple[List[str], List[float]]:
+    """
+    URL paths of a built site and the cumulative weights to draw them with.
+
+    Returns: (paths, cumulative weights) for bisect-based sampling
+    """
+    public_dir = Path(public_dir)
+    rng = random.Random(seed)
+    groups: Dict[str, List[str]] = {'home': ['/']}
+    manifests = [p.name for p in (public_dir / 'static').glob('articles.*.json')]
+    groups['manifest'] = [f'/static/{name}' for name in manifests] or ['/data/articles.json']
+    listings = []
+    with os.scandir(public_dir) as entries:
+        lang_dirs = [e.path for e in entries if e.is_dir() and e.name not in _SKIP_DIRS]
+    for lang_dir in lang_dirs:
+        for dirpath, _, filenames in os.walk(lang_dir):
+            if 'index.html' in filenames:
+                listings.append('/' + Path(dirpath).relative_to(public_dir).as_posix() + '/')
+    groups['listing'] = sorted(listings)
+    try:
+        with os.scandir(public_dir / 'articles') as entries:
+            articles = sorted(f'/articles/{e.name}/' for e in entries if e.is_dir())
+    except FileNotFoundError:
+        articles = []
+    rng.shuffle(articles)
+    groups['article'] = articles
+
+    paths, weights = [], []
+    for kind, share in REQUEST_MIX.items():
+        members = groups.get(kind) or []
+        if not members:
+            continue
+        if kind == 'article':
+            ranks = [1 / (rank ** ZIPF_EXPONENT) for rank in range(1, len(members) + 1)]
+        else:
+            ranks = [1.0] * len(members)
+        total = sum(ranks)
+        paths.extend(members)
+        weights.extend(share * r / total for r in ranks)
+    return paths, list(accumulate(weights))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(blog_script: Path, port: int, args: Sequence[str], log_path: Path,
+                 timeout: float = 60.0) -> subprocess.Popen:
+    """Start `blog.py serve` and wait until it accepts connections"""
+    log = open(log_path, 'w', encoding='utf-8')
+    proc = subprocess.Popen([sys.executable, str(blog_script), 'serve', str(port), *args],
+                            stdout=log, stderr=subprocess.STDOUT)
+    log.close()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode} (see {log_path})")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"server did not start within {timeout:.0f}s (see {log_path})")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+async def _client(port: int, paths: List[str], cum_weights: List[float], rng: random.Random,
+                  measure_from: float, until: float, result: dict) -> None:
+    """One keep-alive connection issuing requests back to back until `until`"""
+    total = cum_weights[-1]
+    reader = writer = None
+    while time.perf_counter() < until:
+        path = paths[bisect(cum_weights, rng.random() * total)]
+        request = (f"GET {path} HTTP/1.1\r\nHost: localhost\r\nAccept-Encoding: {ACCEPT_ENCODING}\r\n"
+                   f"User-Agent: bench-serve\r\n\r\n").encode('ascii')
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            started = time.perf_counter()
+            writer.write(request)
+            head = await reader.readuntil(b'\r\n\r\n')
+            lowered = head.lower()
+            length = 0
+            index = lowered.find(b'\r\ncontent-length:')
+            if index >= 0:
+                length = int(lowered[index + 17:lowered.index(b'\r\n', index + 2)])
+            if length:
+                await reader.readexactly(length)
+            finished = time.perf_counter()
+            if b'\r\nconnection: close' in lowered:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            result['errors'] += 1
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.01)
+            continue
+        if started >= measure_from and finished <= until:
+            result['latencies'].append(finished - started)
+            result['bytes'] += len(head) + length
+            status = head[9:12].decode('ascii', 'replace')
+            result['status'][status] = result['status'].get(status, 0) + 1
+    if writer is not None:
+        writer.close()
+
+
+async def _load(port: int, paths: List[str], cum_weights: List[float], concurrency: int,
+                duration: float, warmup: float, seed: int) -> dict:
+    result = {'latencies': [], 'bytes': 0, 'errors': 0, 'status': {}}
+    start = time.perf_counter()
+    measure_from = start + warmup
+    until = measure_from + duration
+    await asyncio.gather(*(
+        _client(port, paths, cum_weights, random.Random(seed * 100_003 + i), measure_from, until, result)
+        for i in range(concurrency)
+    ))
+    return result
+
+
+def _load_process(args: tuple) -> dict:
+    return asyncio.run(_load(*args))
+
+
+def run_load(port: int, paths: List[str], cum_weights: List[float], concurrency: int,
+             duration: float = DEFAULT_DURATION, warmup: float = DEFAULT_WARMUP, procs: int = 1) -> dict:
+    """Drive the server at one concurrency level, return RPS, latency percentiles and bytes"""
+    procs = max(1, min(procs, concurrency))
+    shares = [concurrency // procs + (1 if i < concurrency % procs else 0) for i in range(procs)]
+    jobs = [(port, paths, cum_weights, share, duration, warmup, i) for i, share in enumerate(shares)]
+    if procs == 1:
+        parts = [_load_process(jobs[0])]
+    else:
+        with ProcessPoolExecutor(procs) as pool:
+            parts = list(pool.map(_load_process, jobs))
+    latencies = sorted(x for part in parts for x in part['latencies'])
+    status: Dict[str, int] = {}
+    for part in parts:
+        for code, count in part['status'].items():
+            status[code] = status.get(code, 0) + count
+
+    def percentile(q: float) -> Optional[float]:
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000
+
+    total_bytes = sum(part['bytes'] for part in parts)
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'rps': len(latencies) / duration,
+        'p50_ms': percentile(0.50),
+        'p95_ms': percentile(0.95),
+        'p99_ms': percentile(0.99),
+        'bytes': total_bytes,
+        'mb_per_s': total_bytes / duration / (1024 * 1024),
+        'errors': sum(part['errors'] for part in parts),
+        'status': status,
+    }
+
+
+def run_benchmark(blog_script: Path, public_dir: Path, bench_dir: Path, modes: Sequence[str],
+                  levels: Sequence[int] = DEFAULT_CONCURRENCY, duration: float = DEFAULT_DURATION,
+                  warmup: float = DEFAULT_WARMUP, procs: int = 1) -> List[dict]:
+    """Measure every server mode at every concurrency level"""
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    paths, cum_weights = request_mix(public_dir)
+    print(f"  Request mix: {len(paths):,} URLs "
+          + ", ".join(f"{kind} {share:.0%}" for kind, share in REQUEST_MIX.items()))
+    results = []
+    for mode in modes:
+        port = free_port()
+        log_path = bench_dir / f"serve-{mode}.log"
+        print(f"\n  [{mode}] blog.py serve {port} {' '.join(SERVER_MODES[mode])}".rstrip())
+        try:
+            proc = start_server(blog_script, port, SERVER_MODES[mode], log_path)
+        except RuntimeError as e:
+            print(f"    Failed: {e}")
+            results.append({'mode': mode, 'error': str(e), 'levels': []})
+            continue
+        levels_done = []
+        try:
+            for concurrency in levels:
+                level = run_load(port, paths, cum_weights, concurrency, duration, warmup, procs)
+                levels_done.append(level)
+                _print_level(level)
+        finally:
+            stop_server(proc)
+        results.append({'mode': mode, 'levels': levels_done})
+    return results
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value:.2f}" if value is not None else "-"
+
+
+def _print_level(level: dict) -> None:
+    print(f"    c={level['concurrency']:<4} {level['rps']:>9,.0f} req/s  p50 {_ms(level['p50_ms']):>7}  "
+          f"p95 {_ms(level['p95_ms']):>7}  p99 {_ms(level['p99_ms']):>7} ms  "
+          f"{level['mb_per_s']:>7.1f} MB/s" + (f"  {level['errors']} errors" if level['errors'] else ""))
+
+
+def print_results(results: List[dict]) -> None:
+    print(f"\n  {'mode':<10}  {'conc':>5}  {'req/s':>9}  {'p50 ms':>7}  {'p95 ms':>7}  {'p99 ms':>7}  "
+          f"{'MB/s':>7}  {'errors':>6}")
+    for r in results:
+        if 'error' in r:
+            print(f"  {r['mode']:<10}  failed: {r['error']}")
+            continue
+        for level in r['levels']:
+            print(f"  {r['mode']:<10}  {level['concurrency']:>5}  {level['rps']:>9,.0f}  {_ms(level['p50_ms']):>7}  "
+                  f"{_ms(level['p95_ms']):>7}  {_ms(level['p99_ms']):>7}  {level['mb_per_s']:>7.1f}  "
+                  f"{level['errors']:>6}")
+
+
+def chart_results(results: List[dict], path: Path) -> bool:
+    """Throughput and tail latency against concurrency per mode as a PNG (requires matplotlib)"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return False
+    done = [r for r in results if r.get('levels')]
+    if not done:
+        return False
+    fig, axes = plt.subplots(1, 2, figsize=(11, 4.5))
+    for r in done:
+        levels = [level for level in r['levels'] if level['requests']]
+        c = [level['concurrency'] for level in levels]
+        axes[0].plot(c, [level['rps'] for level in levels], 'o-', label=r['mode'])
+        axes[1].plot(c, [level['p99_ms'] for level in levels], 'o-', label=r['mode'])
+    axes[0].set_title('Throughput (req/s)')
+    axes[1].set_title('p99 latency (ms)')
+    axes[1].set_yscale('log')
+    for ax in axes:
+        ax.set_xscale('log', base=2)
+        ax.set_xlabel('concurrent connections')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    fig.suptitle(f"blog.py serve load test ({datetime.now():%Y-%m-%d})")
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return True
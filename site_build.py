@@ -0,0 +1,2151 @@
+"""
+Site Build Module for Pure Tallow Blog
+
+The static site build behind `blog.py build`: SEO helpers, asset
+fingerprinting, the streaming article pipeline, listing pages, staged
+publishing with rollback, watch mode, the article store commands and the
+build benchmark.
+
+related_articles (numpy + scipy) and build_benchmark are imported where
+they are used, so commands such as `builds` and `rollback` start quickly.
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from article_store import JsonArticleStore, SqliteArticleStore, article_metadata, copy_articles
+from search_index import SEARCH_LOADER_JS, TermVectorCache, article_content_hash, build_language_index
+from site_config import (ARTICLES_DB, ARTICLES_DIR, BLOG_SCRIPT, CACHE_DIR, CONFIG, CONFIG_PATH, DATA_DIR,
+                         IMAGES_DIR, OUTPUT_DIR, SCRIPT_DIR, STORAGE_BACKEND, get_article_store)
+from site_watcher import WATCHDOG_AVAILABLE, SiteWatcher
+
+# Brotli variants for precompressed output (gzip only without it)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+# =============================================================================
+# BUILD STATIC SITE
+# =============================================================================
+
+INDEX_HTML = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-FNX57VXL9L"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){dataLayer.push(arguments);}
+      gtag('js', new Date());
+      gtag('config', 'G-FNX57VXL9L');
+    </script>
+    <link rel="icon" type="image/png" href="{{FAVICON_URL}}">
+    <title>FrenchTallowSoap | Natural Grass-Fed Beef Tallow Balms</title>
+    <meta name="description" content="Handcrafted whipped tallow balms from grass-fed beef suet. Natural skincare for dry skin, eczema, sensitive skin. Made in France.">
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@400;500;600&family=Inter:wght@300;400;500;600&display=swap" rel="stylesheet">
+    <style>
+        :root{--cream:#FAF7F2;--cream-dark:#F5F0E8;--sage:#8B9F7C;--sage-light:#A8B99A;--sage-dark:#6B7F5C;--charcoal:#2D2D2D;--warm-gray:#7A7A7A;--gold:#C4A86B;--gold-light:#E8DCC4;--white:#FFFFFF;--shadow:rgba(45,45,45,0.08);--shadow-sm:0 2px 8px rgba(45,45,45,0.06);--shadow-md:0 8px 24px rgba(45,45,45,0.1);--shadow-lg:0 16px 48px rgba(45,45,45,0.12);--border-light:1px solid var(--gold-light);--border-accent:2px solid var(--sage);--accent-gradient:linear-gradient(135deg,var(--sage-light) 0%,var(--sage) 100%);--radius-sm:8px;--radius-md:12px;--radius-lg:16px;--radius-xl:20px;--transition-fast:0.2s ease;--transition-normal:0.3s ease}
+        *{margin:0;padding:0;box-sizing:border-box}
+        html{scroll-behavior:smooth}
+        body{font-family:'Inter',sans-serif;background:var(--cream);color:var(--charcoal);line-height:1.7;font-size:16px;font-weight:400;-webkit-font-smoothing:antialiased;-moz-osx-font-smoothing:grayscale}
+        h1,h2,h3,h4,h5,h6{font-family:'Cormorant Garamond',serif;font-weight:500;line-height:1.3;color:var(--charcoal)}
+        h1{font-size:clamp(2.5rem,5vw,4rem)}
+        h2{font-size:clamp(1.75rem,3vw,2.25rem)}
+        h3{font-size:clamp(1.25rem,2vw,1.5rem)}
+        p{line-height:1.7;color:var(--charcoal)}
+        .text-muted{color:var(--warm-gray)}
+        .text-accent{color:var(--sage)}
+        .text-small{font-size:0.875rem}
+        .text-xs{font-size:0.75rem}
+        .font-serif{font-family:'Cormorant Garamond',serif}
+        .font-medium{font-weight:500}
+        .font-semibold{font-weight:600}
+        .decorative-line{width:60px;height:2px;background:var(--accent-gradient);border-radius:2px}
+        .decorative-dot{width:6px;height:6px;background:var(--sage);border-radius:50%;display:inline-block}
+        .card-elevated{background:var(--white);border-radius:var(--radius-lg);box-shadow:var(--shadow-sm);border:var(--border-light);transition:all var(--transition-normal)}
+        .card-elevated:hover{box-shadow:var(--shadow-md);transform:translateY(-4px)}
+        header{background:#fefefe;position:sticky;top:0;z-index:1000;box-shadow:0 1px 0 var(--gold-light);transition:box-shadow var(--transition-normal),background var(--transition-normal)}
+        header.scrolled{box-shadow:var(--shadow-md);background:rgba(254,254,254,0.98);backdrop-filter:blur(8px)}
+        .header-inner{max-width:1400px;margin:0 auto;padding:1rem 2rem;display:flex;justify-content:space-between;align-items:center}
+        .logo{font-family:'Cormorant Garamond',serif;font-size:1.75rem;font-weight:600;color:var(--charcoal);text-decoration:none;display:flex;align-items:center;gap:0.5rem}
+        .logo span{color:var(--sage)}
+        .logo-icon{font-size:1.5rem;margin-right:0.25rem}
+        .tagline{font-family:'Inter',sans-serif;font-size:0.7rem;font-weight:400;color:var(--warm-gray);text-transform:uppercase;letter-spacing:0.1em;margin-left:0.75rem;padding-left:0.75rem;border-left:1px solid var(--gold-light)}
+        .lang-selector{position:relative}
+        .lang-btn{display:flex;align-items:center;gap:0.5rem;padding:0.6rem 1rem;background:var(--cream);border:1px solid var(--gold-light);border-radius:8px;cursor:pointer;font-size:0.9rem;font-weight:500;transition:all var(--transition-fast)}
+        .lang-btn:hover{border-color:var(--sage);background:var(--white);box-shadow:var(--shadow-sm)}
+        .lang-btn svg{transition:transform var(--transition-fast)}
+        .lang-selector:hover .lang-btn svg{transform:translateY(1px)}
+        .lang-dropdown{position:absolute;top:calc(100% + 8px);right:0;background:var(--white);border:1px solid var(--gold-light);border-radius:12px;box-shadow:var(--shadow-lg);padding:0.5rem;display:none;min-width:200px;max-height:400px;overflow-y:auto;z-index:100;opacity:0;transform:translateY(-8px);transition:opacity var(--transition-fast),transform var(--transition-fast)}
+        .lang-dropdown.active{display:block;opacity:1;transform:translateY(0)}
+        .lang-option{padding:0.6rem 1rem;cursor:pointer;border-radius:8px;font-size:0.9rem;transition:all var(--transition-fast);display:flex;align-items:center;gap:0.5rem}
+        .lang-option:hover{background:var(--cream);padding-left:1.25rem}
+        .lang-option.selected{background:var(--sage);color:white}
+        .lang-option.selected:hover{background:var(--sage-dark);padding-left:1rem}
+        .hero{background:linear-gradient(135deg,var(--white) 0%,var(--cream-dark) 100%);padding:5rem 2rem;text-align:center;border-bottom:1px solid var(--gold-light);position:relative;overflow:hidden}
+        .hero::before{content:'';position:absolute;inset:0;background-image:radial-gradient(circle at 20% 50%,rgba(139,159,124,0.08) 0%,transparent 50%),radial-gradient(circle at 80% 20%,rgba(196,168,107,0.06) 0%,transparent 40%),radial-gradient(circle at 60% 80%,rgba(139,159,124,0.05) 0%,transparent 45%);pointer-events:none}
+        .hero::after{content:'';position:absolute;bottom:0;left:0;right:0;height:1px;background:linear-gradient(90deg,transparent,var(--gold-light),var(--sage-light),var(--gold-light),transparent)}
+        .hero-content{position:relative;z-index:1}
+        .hero h1{font-family:'Cormorant Garamond',serif;font-size:clamp(2.5rem,5vw,4rem);font-weight:500;margin-bottom:1rem}
+        .hero p{font-size:1.15rem;color:var(--warm-gray);max-width:600px;margin:0 auto 2rem;line-height:1.7}
+        .hero-badge{display:inline-flex;align-items:center;gap:0.5rem;background:var(--sage);color:white;padding:0.5rem 1.25rem;border-radius:50px;font-size:0.85rem;font-weight:500}
+        .trust-badges{display:flex;flex-wrap:wrap;justify-content:center;gap:1.5rem;margin-top:2.5rem}
+        .trust-badge{display:flex;flex-direction:column;align-items:center;gap:0.5rem;padding:1rem 1.25rem;background:var(--white);border:1px solid var(--gold-light);border-radius:var(--radius-md);min-width:120px;transition:all var(--transition-normal)}
+        .trust-badge:hover{transform:translateY(-2px);box-shadow:var(--shadow-sm);border-color:var(--sage-light)}
+        .trust-badge-icon{width:32px;height:32px;display:flex;align-items:center;justify-content:center;color:var(--sage)}
+        .trust-badge-icon svg{width:24px;height:24px}
+        .trust-badge span{font-size:0.8rem;font-weight:500;color:var(--charcoal);text-align:center;line-height:1.3}
+        @media(max-width:992px){.trust-badges{gap:1rem}.trust-badge{min-width:110px;padding:0.875rem 1rem}}
+        @media(max-width:768px){.trust-badges{gap:0.75rem;padding:0 0.5rem}.trust-badge{min-width:calc(50% - 0.5rem);flex:1 1 calc(50% - 0.5rem);max-width:calc(50% - 0.375rem);padding:0.75rem 0.75rem}.trust-badge-icon{width:28px;height:28px}.trust-badge-icon svg{width:20px;height:20px}.trust-badge span{font-size:0.7rem}}
+        @media(max-width:480px){.trust-badges{gap:0.5rem}.trust-badge{min-width:calc(50% - 0.25rem);padding:0.6rem 0.5rem}.trust-badge-icon{width:24px;height:24px}.trust-badge-icon svg{width:18px;height:18px}.trust-badge span{font-size:0.65rem}}
+        main{max-width:1400px;margin:0 auto;padding:3rem 2rem}
+        .section-title{font-family:'Cormorant Garamond',serif;font-size:2rem;font-weight:500;margin-bottom:1.5rem}
+        .products-grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(160px,1fr));gap:1.25rem;margin-bottom:4rem}
+        .product-card{background:var(--white);border-radius:var(--radius-lg);padding:1.25rem;text-align:center;cursor:pointer;transition:all var(--transition-normal);border:var(--border-light);box-shadow:var(--shadow-sm)}
+        .product-card:hover{transform:translateY(-6px);box-shadow:var(--shadow-lg);border-color:var(--sage-light)}
+        .product-image-wrapper{position:relative;overflow:hidden;border-radius:var(--radius-md);margin-bottom:0.75rem;background:var(--cream-dark);aspect-ratio:1}
+        .product-card img{width:100%;height:100%;aspect-ratio:1;object-fit:cover;border-radius:var(--radius-md);transition:transform var(--transition-normal),opacity var(--transition-normal);background:var(--cream-dark)}
+        .product-card:hover img{transform:scale(1.05)}
+        .product-overlay{position:absolute;inset:0;background:rgba(45,45,45,0.7);display:flex;align-items:center;justify-content:center;opacity:0;transition:opacity var(--transition-normal)}
+        .product-card:hover .product-overlay{opacity:1}
+        .shop-btn{background:var(--white);color:var(--charcoal);padding:0.6rem 1.25rem;border-radius:50px;font-size:0.85rem;font-weight:500;transition:all var(--transition-fast)}
+        .shop-btn:hover{background:var(--sage);color:var(--white)}
+        .product-benefits{font-size:0.75rem;color:var(--warm-gray);margin-top:0.5rem;line-height:1.4}
+        .product-card h3{font-size:0.9rem;font-weight:500}
+        .filter-bar{display:flex;gap:1rem;margin-bottom:2rem;flex-wrap:wrap;align-items:center}
+        .filter-label{font-weight:500;color:var(--warm-gray);font-size:0.9rem}
+        .filter-pills{display:flex;gap:0.5rem;flex-wrap:wrap}
+        .filter-pill{padding:0.5rem 1rem;background:var(--white);border:1px solid var(--gold-light);border-radius:50px;cursor:pointer;font-size:0.85rem;font-weight:500;transition:all 0.2s}
+        .filter-pill:hover{border-color:var(--sage)}
+        .search-input{margin-left:auto;padding:0.5rem 1rem;border:1px solid var(--gold-light);border-radius:50px;font:inherit;font-size:0.85rem;min-width:220px;background:var(--white)}
+        .search-input:focus{outline:none;border-color:var(--sage)}
+        .filter-pill.active{background:var(--sage);border-color:var(--sage);color:white}
+        .articles-header{display:flex;justify-content:space-between;align-items:center;margin-bottom:1.5rem;flex-wrap:wrap;gap:1rem}
+        .articles-count{color:var(--warm-gray);font-size:0.9rem}
+        .articles-grid{display:grid;grid-template-columns:repeat(auto-fill,minmax(340px,1fr));gap:1.5rem}
+        .article-card{background:var(--white);border-radius:16px;overflow:hidden;transition:all 0.25s;border:1px solid transparent;cursor:pointer;position:relative}
+        .article-card::before{content:'';position:absolute;left:0;top:0;bottom:0;width:4px;background:var(--accent-gradient);border-radius:16px 0 0 16px;opacity:0;transition:opacity var(--transition-normal)}
+        .article-card:hover::before{opacity:1}
+        .article-card:hover{transform:translateY(-4px);box-shadow:0 16px 40px var(--shadow);border-color:var(--gold-light)}
+        .article-card-inner{padding:1.5rem}
+        .article-meta{display:flex;gap:0.75rem;margin-bottom:0.75rem;flex-wrap:wrap}
+        .article-tag{font-size:0.75rem;font-weight:500;padding:0.25rem 0.75rem;border-radius:50px;background:var(--cream);color:var(--sage-dark)}
+        .article-tag.product{background:var(--gold-light);color:var(--charcoal)}
+        .article-card h3{font-family:'Cormorant Garamond',serif;font-size:1.35rem;font-weight:500;line-height:1.35;margin-bottom:0.75rem}
+        .article-card p{font-size:0.95rem;color:var(--warm-gray);line-height:1.6;display:-webkit-box;-webkit-line-clamp:3;-webkit-box-orient:vertical;overflow:hidden}
+        .article-card-footer{display:flex;justify-content:space-between;align-items:center;margin-top:1rem;padding-top:1rem;border-top:1px solid var(--cream-dark)}
+        .article-date{font-size:0.8rem;color:var(--warm-gray)}
+        .article-author{font-size:0.8rem;color:var(--sage-dark);font-weight:500}
+        .reading-time{font-size:0.7rem;color:var(--warm-gray);background:var(--cream-dark);padding:0.2rem 0.5rem;border-radius:50px}
+        .read-more{font-size:0.85rem;font-weight:500;color:var(--sage)}
+        .loading{text-align:center;padding:4rem 2rem;color:var(--warm-gray);display:flex;flex-direction:column;align-items:center;justify-content:center;min-height:200px}
+        .loading-spinner{width:48px;height:48px;border:3px solid var(--cream-dark);border-top-color:var(--sage);border-right-color:var(--sage-light);border-radius:50%;animation:spin 1s cubic-bezier(0.68,-0.55,0.27,1.55) infinite;margin:0 auto 1.25rem;box-shadow:0 0 0 4px rgba(139,159,124,0.1)}
+        .listing-nav{display:flex;flex-wrap:wrap;justify-content:center;gap:0.5rem 1rem;margin-top:2.5rem;font-size:0.85rem}
+        .listing-nav a{color:var(--warm-gray);text-decoration:none}.listing-nav a:hover{color:var(--sage-dark)}
+        .loading p{font-size:0.95rem;font-weight:500;color:var(--sage-dark);letter-spacing:0.02em}
+        @keyframes spin{to{transform:rotate(360deg)}}
+        .no-results{text-align:center;padding:4rem 2rem;color:var(--warm-gray)}
+        .no-results h3{font-family:'Cormorant Garamond',serif;font-size:1.5rem;margin-bottom:0.5rem;color:var(--charcoal)}
+        .load-more{text-align:center;margin-top:2rem}
+        .load-more-btn{padding:0.875rem 2rem;background:var(--sage);color:white;border:none;border-radius:8px;font-size:0.95rem;font-weight:500;cursor:pointer}
+        .load-more-btn:hover{background:var(--sage-dark)}
+        .testimonials-section{margin-bottom:4rem;padding:3rem 0;background:linear-gradient(135deg,var(--cream-dark) 0%,var(--white) 100%);border-radius:var(--radius-xl);border:var(--border-light)}
+        .testimonials-section .section-title{text-align:center;margin-bottom:2rem}
+        .testimonials-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(300px,1fr));gap:1.5rem;padding:0 1.5rem}
+        .testimonial-card{background:var(--white);border-radius:var(--radius-lg);padding:2rem;box-shadow:var(--shadow-sm);border:var(--border-light);transition:all var(--transition-normal)}
+        .testimonial-card:hover{transform:translateY(-4px);box-shadow:var(--shadow-md)}
+        .testimonial-stars{color:var(--gold);font-size:1.25rem;margin-bottom:1rem;letter-spacing:2px}
+        .testimonial-text{font-size:1rem;line-height:1.7;color:var(--charcoal);font-style:italic;margin-bottom:1rem}
+        .testimonial-author{font-size:0.875rem;font-weight:500;color:var(--sage-dark)}
+        @media(max-width:992px){.testimonials-grid{grid-template-columns:repeat(auto-fit,minmax(280px,1fr));gap:1.25rem}}
+        @media(max-width:768px){.testimonials-grid{grid-template-columns:1fr;padding:0 1rem;gap:1rem}.testimonial-card{padding:1.5rem}}
+        @media(max-width:480px){.testimonials-section{padding:2rem 0}.testimonials-grid{padding:0 0.75rem}.testimonial-card{padding:1.25rem}.testimonial-text{font-size:0.95rem}.testimonial-stars{font-size:1.1rem}}
+        .modal-overlay{position:fixed;inset:0;background:rgba(0,0,0,0.6);z-index:2000;display:none;align-items:center;justify-content:center;padding:2rem;overflow-y:auto}
+        .modal-overlay.active{display:flex}
+        .modal{background:var(--white);border-radius:20px;max-width:720px;width:100%;max-height:90vh;overflow-y:auto;position:relative;box-shadow:var(--shadow-lg)}
+        .modal-close{position:absolute;top:1.25rem;right:1.25rem;width:44px;height:44px;background:var(--cream);border:none;border-radius:50%;cursor:pointer;font-size:1.5rem;display:flex;align-items:center;justify-content:center;z-index:10;transition:all var(--transition-fast);color:var(--charcoal)}
+        .modal-close:hover{background:var(--sage);color:var(--white);transform:scale(1.05)}
+        .modal-content{padding:3rem 3.5rem;max-width:65ch;margin:0 auto}
+        .modal-content h1{font-family:'Cormorant Garamond',serif;font-size:2.25rem;font-weight:500;margin-bottom:1.25rem;line-height:1.35;color:var(--charcoal);letter-spacing:-0.01em}
+        .modal-content .article-body{font-size:1.125rem;line-height:1.85;color:var(--charcoal)}
+        .modal-content .article-body p{margin-bottom:1.75rem;text-align:left;hyphens:auto}
+        .modal-content .article-body p:first-of-type{font-size:1.2rem;color:var(--warm-gray);line-height:1.75}
+        .modal-content .article-body strong{font-weight:600;color:var(--charcoal)}
+        .modal-content .article-body em{font-style:italic;color:var(--sage-dark)}
+        .modal-product{background:var(--cream);border-radius:16px;padding:1.5rem;margin-top:2rem;display:flex;gap:1.5rem;align-items:center}
+        .modal-product img{width:100px;height:100px;aspect-ratio:1;object-fit:cover;border-radius:12px;background:var(--cream-dark);flex-shrink:0}
+        .modal-product h4{font-family:'Cormorant Garamond',serif;font-size:1.25rem;margin-bottom:0.5rem}
+        .modal-product .btn-shop{display:inline-block;margin-top:0.75rem;padding:0.6rem 1.25rem;background:var(--sage);color:white;text-decoration:none;border-radius:8px;font-size:0.9rem;font-weight:500}
+        footer{background:var(--charcoal);color:rgba(255,255,255,0.8);padding:4rem 2rem 2rem;margin-top:4rem}
+        .footer-inner{max-width:1400px;margin:0 auto;display:grid;grid-template-columns:repeat(auto-fit,minmax(200px,1fr));gap:2rem}
+        .footer-section h4{font-family:'Cormorant Garamond',serif;font-size:1.25rem;color:white;margin-bottom:1rem}
+        .footer-section a{display:block;color:rgba(255,255,255,0.7);text-decoration:none;margin-bottom:0.5rem;font-size:0.9rem}
+        .footer-section a:hover{color:var(--gold-light)}
+        .footer-bottom{text-align:center;margin-top:3rem;padding-top:2rem;border-top:1px solid rgba(255,255,255,0.1);font-size:0.85rem;display:flex;flex-direction:column;align-items:center;gap:1rem}
+        .footer-badges{display:flex;gap:1.5rem;flex-wrap:wrap;justify-content:center;margin-top:0.5rem}
+        .footer-badges span{display:flex;align-items:center;gap:0.5rem;font-size:0.85rem;color:rgba(255,255,255,0.7)}
+        .footer-brand{max-width:300px}
+        .footer-brand .brand-story{font-size:0.9rem;line-height:1.7;color:rgba(255,255,255,0.7);margin-bottom:1.5rem}
+        .social-links{display:flex;gap:1rem}
+        .social-links a{display:flex;align-items:center;justify-content:center;width:36px;height:36px;background:rgba(255,255,255,0.1);border-radius:50%;color:rgba(255,255,255,0.8);text-decoration:none;transition:all var(--transition-fast)}
+        .social-links a:hover{background:var(--sage);color:white;transform:translateY(-2px)}
+        .footer-newsletter{max-width:280px}
+        .footer-newsletter p{font-size:0.9rem;color:rgba(255,255,255,0.7);margin-bottom:1rem}
+        .newsletter-form{display:flex;flex-direction:column;gap:0.75rem}
+        .newsletter-form input{padding:0.75rem 1rem;background:rgba(255,255,255,0.1);border:1px solid rgba(255,255,255,0.2);border-radius:8px;color:white;font-size:0.9rem}
+        .newsletter-form input::placeholder{color:rgba(255,255,255,0.5)}
+        .newsletter-form input:focus{outline:none;border-color:var(--sage);background:rgba(255,255,255,0.15)}
+        .newsletter-form button{padding:0.75rem 1.5rem;background:var(--sage);color:white;border:none;border-radius:8px;font-size:0.9rem;font-weight:500;cursor:pointer;transition:all var(--transition-fast)}
+        .newsletter-form button:hover{background:var(--sage-dark)}
+        @media(max-width:992px){.footer-inner{grid-template-columns:repeat(2,1fr);gap:2rem}.footer-brand,.footer-newsletter{grid-column:span 1}}
+        @media(max-width:768px){.footer-inner{grid-template-columns:1fr;gap:2rem}.footer-brand,.footer-newsletter{max-width:100%}.footer-badges{gap:1rem}.footer-section{text-align:center}.footer-brand{text-align:center}.social-links{justify-content:center}.newsletter-form{max-width:320px;margin:0 auto}}
+        @media(max-width:480px){footer{padding:3rem 1rem 1.5rem}.footer-badges{flex-direction:column;gap:0.75rem}.footer-bottom{padding-top:1.5rem;margin-top:2rem}}
+        @media(max-width:992px){.header-inner{padding:0.875rem 1.5rem}.hero{padding:4rem 1.5rem}main{padding:2.5rem 1.5rem}.articles-grid{grid-template-columns:repeat(auto-fill,minmax(300px,1fr))}}
+        @media(max-width:768px){.header-inner{padding:0.875rem 1rem}.logo{font-size:1.5rem}.tagline{display:none}.hero{padding:3rem 1rem}main{padding:2rem 1rem}.articles-grid{grid-template-columns:1fr}.products-grid{grid-template-columns:repeat(auto-fill,minmax(140px,1fr));gap:1rem}.filter-bar{flex-direction:column;align-items:flex-start;gap:0.75rem}.filter-pills{width:100%;overflow-x:auto;flex-wrap:nowrap;padding-bottom:0.5rem;-webkit-overflow-scrolling:touch}.filter-pill{flex-shrink:0}.modal{max-width:100%;border-radius:16px}.modal-content{padding:2rem 1.5rem}.modal-content h1{font-size:1.75rem}.modal-content .article-body{font-size:1.05rem;line-height:1.75}.modal-content .article-body p:first-of-type{font-size:1.1rem}.modal-product{flex-direction:column;text-align:center}}
+        @media(max-width:480px){.hero h1{font-size:2rem}.hero p{font-size:1rem}.section-title{font-size:1.5rem}.products-grid{grid-template-columns:repeat(2,1fr);gap:0.75rem}.product-card{padding:1rem}.product-card h3{font-size:0.85rem}.product-benefits{font-size:0.7rem}.article-card-inner{padding:1.25rem}.article-card h3{font-size:1.2rem}.article-card p{font-size:0.9rem}.modal-content{padding:1.5rem 1rem}.modal-content h1{font-size:1.5rem}}
+        @media(hover:hover){.product-card:hover{transform:translateY(-6px)}.product-card:hover .product-overlay{opacity:1}.article-card:hover{transform:translateY(-4px)}.article-card:hover::before{opacity:1}.trust-badge:hover{transform:translateY(-2px)}.testimonial-card:hover{transform:translateY(-4px)}.card-elevated:hover{transform:translateY(-4px)}.social-links a:hover{transform:translateY(-2px)}}
+        @media(hover:none){.product-card{-webkit-tap-highlight-color:transparent}.product-card:active{transform:scale(0.98);box-shadow:var(--shadow-sm)}.product-overlay{display:none}.article-card{-webkit-tap-highlight-color:transparent}.article-card:active{transform:scale(0.99);box-shadow:var(--shadow-md)}.article-card::before{opacity:0.5}.trust-badge{-webkit-tap-highlight-color:transparent}.trust-badge:active{transform:scale(0.97);background:var(--cream-dark)}.testimonial-card{-webkit-tap-highlight-color:transparent}.filter-pill{-webkit-tap-highlight-color:transparent}.filter-pill:active{transform:scale(0.95)}.lang-btn{-webkit-tap-highlight-color:transparent}.lang-btn:active{background:var(--cream-dark)}.lang-option:active{background:var(--cream-dark)}.shop-btn:active{background:var(--sage);color:var(--white)}.social-links a{-webkit-tap-highlight-color:transparent}.social-links a:active{background:var(--sage);transform:scale(0.95)}.newsletter-form button:active{background:var(--sage-dark);transform:scale(0.98)}.load-more-btn:active{background:var(--sage-dark);transform:scale(0.98)}.modal-close:active{background:var(--sage);color:var(--white);transform:scale(0.95)}.btn-shop:active{background:var(--sage-dark)}}
+    </style>
+</head>
+<body>
+    <header><div class="header-inner"><a href="/" class="logo"><img src="{{LOGO_URL}}" alt="FrenchTallowSoap" style="height:60px;margin-right:10px"><span>French</span>Tallow<span>Soap</span><span class="tagline">Natural Skincare</span></a><div class="lang-selector"><button class="lang-btn" onclick="toggleLangDropdown()"><span id="currentLang">English</span><svg width="12" height="12" viewBox="0 0 12 12" fill="none"><path d="M3 4.5L6 7.5L9 4.5" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/></svg></button><div class="lang-dropdown" id="langDropdown"></div></div></div></header>
+    <section class="hero"><div class="hero-content"><h1 id="heroTitle">Ancestral Skincare,<br>Modern Results</h1><p id="heroDescription">Handcrafted whipped tallow balms made from grass-fed beef suet. Pure, natural skincare that your skin actually recognizes.</p><div class="hero-badge"><svg width="16" height="16" viewBox="0 0 16 16" fill="none"><path d="M8 1L10 5.5L15 6L11.5 9.5L12.5 14.5L8 12L3.5 14.5L4.5 9.5L1 6L6 5.5L8 1Z" fill="currentColor"/></svg><span id="heroBadge">Made in France</span></div><div class="trust-badges"><div class="trust-badge"><div class="trust-badge-icon"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 22s8-4 8-10V5l-8-3-8 3v7c0 6 8 10 8 10z"/><text x="12" y="14" text-anchor="middle" font-size="8" fill="currentColor" stroke="none">FR</text></svg></div><span id="trustBadgeFrance">Made in France</span></div><div class="trust-badge"><div class="trust-badge-icon"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2z"/><path d="M8 14s1.5 2 4 2 4-2 4-2"/><circle cx="9" cy="9" r="1" fill="currentColor"/><circle cx="15" cy="9" r="1" fill="currentColor"/><path d="M7 12c0-1 .5-2 1.5-2.5M17 12c0-1-.5-2-1.5-2.5"/></svg></div><span id="trustBadgeGrassFed">100% Grass-Fed</span></div><div class="trust-badge"><div class="trust-badge-icon"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M12 2L2 7l10 5 10-5-10-5z"/><path d="M2 17l10 5 10-5"/><path d="M2 12l10 5 10-5"/><circle cx="12" cy="12" r="3" fill="none"/></svg></div><span id="trustBadgeNatural">Natural Ingredients</span></div><div class="trust-badge"><div class="trust-badge-icon"><svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="2" y="7" width="20" height="14" rx="2"/><path d="M16 7V5a4 4 0 0 0-8 0v2"/><path d="M12 14v3"/><circle cx="12" cy="14" r="1" fill="currentColor"/></svg></div><span id="trustBadgeShipping">EU Shipping</span></div></div></div></section>
+    <main><section class="products-section"><h2 class="section-title" id="productsTitle">Our Products</h2><div class="products-grid" id="productsGrid"></div></section><section class="testimonials-section"><h2 class="section-title" id="testimonialsTitle">What Our Customers Say</h2><div class="testimonials-grid"><div class="testimonial-card"><div class="testimonial-stars">★★★★★</div><p class="testimonial-text" id="testimonial1Text">"This tallow balm has completely transformed my dry, winter-damaged skin. I've tried countless products over the years, but nothing compares to the deep, lasting moisture this provides."</p><p class="testimonial-author" id="testimonial1Author">— Marie L., France</p></div><div class="testimonial-card"><div class="testimonial-stars">★★★★★</div><p class="testimonial-text" id="testimonial2Text">"As someone with sensitive skin and eczema, finding products that don't irritate is a challenge. This grass-fed tallow balm is gentle, effective, and the lavender scent helps me relax before bed."</p><p class="testimonial-author" id="testimonial2Author">— Sophie K., Germany</p></div><div class="testimonial-card"><div class="testimonial-stars">★★★★★</div><p class="testimonial-text" id="testimonial3Text">"I was skeptical about using tallow on my face, but the results speak for themselves. My skin has never looked better, and I love that it's made with simple, natural ingredients."</p><p class="testimonial-author" id="testimonial3Author">— Anna M., Netherlands</p></div></div></section><section class="articles-section"><div class="articles-header"><h2 class="section-title" id="articlesTitle">Latest Articles</h2><span class="articles-count" id="articlesCount"></span></div><div class="filter-bar"><span class="filter-label" id="filterLabel">Filter:</span><div class="filter-pills" id="filterPills"></div><input type="search" class="search-input" id="searchInput" placeholder="Search..." oninput="onSearchInput(this.value)"></div><div id="articlesContainer"><div class="loading"><div class="loading-spinner"></div><p>Loading...</p></div></div><div class="load-more" id="loadMore" style="display:none"><button class="load-more-btn" onclick="loadMoreArticles()" id="loadMoreBtn">Load More</button></div>{{LISTING_NAV}}</section></main>
+    <div class="modal-overlay" id="modalOverlay" onclick="closeModal(event)"><div class="modal" onclick="event.stopPropagation()"><button class="modal-close" onclick="closeModal()">&times;</button><div class="modal-content" id="modalContent"></div></div></div>
+    <footer><div class="footer-inner"><div class="footer-brand"><h4>FrenchTallowSoap</h4><p class="brand-story" id="footerBrandStory">Handcrafted in the heart of France, our tallow balms continue a centuries-old tradition of natural skincare. We source only grass-fed beef suet to create products that your skin truly recognizes and absorbs.</p><div class="social-links"><a href="https://www.etsy.com/shop/FrenchTallowSoap" target="_blank" rel="noopener" aria-label="Etsy Shop"><svg width="18" height="18" viewBox="0 0 24 24" fill="currentColor"><path d="M8.559 3.89c0-.31.253-.561.561-.561h.561c.31 0 .561.253.561.561v2.244h5.049V3.89c0-.31.253-.561.561-.561h.561c.31 0 .561.253.561.561v2.244h1.683c.31 0 .561.253.561.561v.561c0 .31-.253.561-.561.561h-1.683v7.854c0 .31.253.561.561.561h1.122c.31 0 .561.253.561.561v.561c0 .31-.253.561-.561.561h-1.122c-1.236 0-2.244-1.008-2.244-2.244V7.817h-5.049v7.854c0 .31.253.561.561.561h1.122c.31 0 .561.253.561.561v.561c0 .31-.253.561-.561.561H9.12c-1.236 0-2.244-1.008-2.244-2.244V7.817H5.193c-.31 0-.561-.253-.561-.561v-.561c0-.31.253-.561.561-.561h1.683V3.89z"/></svg></a><a href="mailto:contact@frenchtallowsoap.com" aria-label="Email"><svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="2" y="4" width="20" height="16" rx="2"/><path d="M22 6l-10 7L2 6"/></svg></a><a href="https://instagram.com" target="_blank" rel="noopener" aria-label="Instagram"><svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><rect x="2" y="2" width="20" height="20" rx="5"/><circle cx="12" cy="12" r="4"/><circle cx="18" cy="6" r="1" fill="currentColor"/></svg></a></div></div><div class="footer-section"><h4 id="footerProductsTitle">Products</h4><div id="footerProducts"></div></div><div class="footer-section"><h4 id="footerSupportTitle">Support</h4><a href="https://www.etsy.com/shop/FrenchTallowSoap" target="_blank" rel="noopener" id="footerShipping">Shipping Info</a><a href="https://www.etsy.com/shop/FrenchTallowSoap" target="_blank" rel="noopener" id="footerReturns">Returns Policy</a><a href="mailto:contact@frenchtallowsoap.com" id="footerContact">Contact Us</a><a href="https://www.etsy.com/shop/FrenchTallowSoap" target="_blank" rel="noopener" id="footerFAQ">FAQ</a></div><div class="footer-newsletter"><h4 id="footerNewsletterTitle">Stay Updated</h4><p id="footerNewsletterDesc">Get skincare tips and exclusive offers</p><form class="newsletter-form" onsubmit="event.preventDefault();window.open('https://www.etsy.com/shop/FrenchTallowSoap','_blank')"><input type="email" placeholder="Your email" id="footerNewsletterPlaceholder" required><button type="submit" id="footerNewsletterBtn">Subscribe</button></form></div></div><div class="footer-bottom"><p>&copy; 2026 FrenchTallowSoap. <span id="footerRights">All rights reserved.</span></p><div class="footer-badges"><span>🇫🇷 <span id="footerBadgeFrance">Made in France</span></span><span>🌿 <span id="footerBadgeNatural">100% Natural</span></span><span>🐄 <span id="footerBadgeGrassFed">Grass-Fed</span></span></div></div></footer>
+    <script src="{{SEARCH_JS_URL}}" defer></script>
+    <script>
+const CONFIG={{CONFIG_JSON}};
+const LISTING_URLS={{LISTING_URLS}};
+let articles=[],filteredArticles=[],currentLang=localStorage.getItem('lang')||'en',currentProduct=null,displayedCount=0;
+const ARTICLES_PER_PAGE=12;
+let searchQuery='',searchTimer=null;
+const t=k=>CONFIG.i18n?.[currentLang]?.[k]||CONFIG.i18n?.['en']?.[k]||k;
+document.addEventListener('DOMContentLoaded',()=>{renderProducts();renderLanguages();setLanguage(currentLang)});
+async function loadArticles(){const lang=currentLang;try{const url=LISTING_URLS[lang],list=url?await(await fetch(url)).json():[];if(lang!==currentLang)return;articles=list;filterAndRender()}catch(e){document.getElementById('articlesContainer').innerHTML='<div class="no-results"><h3>'+t('no_articles_yet')+'</h3><p>'+t('articles_appear')+'</p></div>'}}
+function filterAndRender(){if(searchQuery){runSearch();return}filteredArticles=articles.filter(a=>!currentProduct||a.product===currentProduct);filteredArticles.sort((a,b)=>new Date(b.generated_at)-new Date(a.generated_at));displayedCount=0;document.getElementById('articlesContainer').innerHTML='';if(filteredArticles.length===0){document.getElementById('articlesContainer').innerHTML='<div class="no-results"><h3>'+t('no_articles')+'</h3><p>'+t('try_different')+'</p></div>';document.getElementById('articlesCount').textContent='';document.getElementById('loadMore').style.display='none'}else{loadMoreArticles()}}
+function onSearchInput(v){clearTimeout(searchTimer);searchTimer=setTimeout(()=>{searchQuery=v.trim();filterAndRender()},150)}
+async function runSearch(){const q=searchQuery,c=document.getElementById('articlesContainer');if(!window.TallowSearch)return;const results=(await TallowSearch.search(currentLang,q,100)).filter(r=>!currentProduct||r.product===currentProduct);if(q!==searchQuery)return;c.innerHTML='';document.getElementById('loadMore').style.display='none';document.getElementById('articlesCount').textContent=results.length+' '+t('articles_count');if(!results.length){c.innerHTML='<div class="no-results"><h3>'+t('no_articles')+'</h3><p>'+t('try_different')+'</p></div>';return}results.forEach(r=>{const d=document.createElement('div');d.className='article-card';d.onclick=()=>{location.href='/articles/'+r.slug+'/'};const pn=CONFIG.products[r.product]?.name.split(' - ')[1]||r.product;d.innerHTML='<div class="article-card-inner"><div class="article-meta"><span class="article-tag product">'+pn+'</span><span class="article-tag">'+formatAngle(r.angle)+'</span></div><h3>'+r.title+'</h3><div class="article-card-footer"><span class="article-author">'+t('author_name')+'</span><span class="article-date">'+new Date(r.date).toLocaleDateString()+'</span></div></div>';c.appendChild(d)})}
+function loadMoreArticles(){const c=document.getElementById('articlesContainer'),toShow=filteredArticles.slice(displayedCount,displayedCount+ARTICLES_PER_PAGE);toShow.forEach(a=>{const d=document.createElement('div');d.className='article-card';d.onclick=()=>{location.href='/articles/'+a.slug+'/'};const pn=CONFIG.products[a.product]?.name.split(' - ')[1]||a.product,ex=a.excerpt,dt=new Date(a.generated_at).toLocaleDateString();const readingTime=a.minutes;d.innerHTML='<div class="article-card-inner"><div class="article-meta"><span class="article-tag product">'+pn+'</span><span class="article-tag">'+formatAngle(a.angle)+'</span><span class="reading-time">'+readingTime+' '+t('reading_time')+'</span></div><h3>'+a.title+'</h3><p>'+ex+'</p><div class="article-card-footer"><span class="article-author">'+t('author_name')+'</span><span class="article-date">'+dt+'</span></div></div>';c.appendChild(d)});displayedCount+=toShow.length;document.getElementById('articlesCount').textContent=filteredArticles.length+' '+t('articles_count');document.getElementById('loadMore').style.display=displayedCount<filteredArticles.length?'block':'none'}
+function formatAngle(a){const k={problem_solution:'angle_solution',ingredient_story:'angle_ingredients',vs_commercial:'angle_comparison',seasonal:'angle_seasonal',lifestyle:'angle_lifestyle',myth_busting:'angle_myths',scent_focus:'angle_aromatherapy',skin_type:'angle_skin_guide',routine:'angle_routine',heritage:'angle_heritage'};return t(k[a])||a}
+function closeModal(e){if(!e||e.target===document.getElementById('modalOverlay')){document.getElementById('modalOverlay').classList.remove('active');document.body.style.overflow=''}}
+function renderProducts(){const g=document.getElementById('productsGrid'),f=document.getElementById('footerProducts');Object.entries(CONFIG.products).forEach(([k,p])=>{const c=document.createElement('div');c.className='product-card';c.onclick=()=>window.open(p.link,'_blank');const s=p.name.split(' - ')[1]||k;const benefits=p.scent_benefits?p.scent_benefits.split(',').slice(0,3).map(b=>b.trim()).join(' • '):'Natural Tallow Balm';c.innerHTML='<div class="product-image-wrapper"><img src="'+p.image_url+'" alt="'+p.name+'"><div class="product-overlay"><span class="shop-btn">'+t('shop_on_etsy')+'</span></div></div><h3>'+s+'</h3><p class="product-benefits">'+benefits+'</p>';g.appendChild(c);const l=document.createElement('a');l.href=p.link;l.target='_blank';l.textContent=s;f.appendChild(l)});renderFilterPills()}
+function renderFilterPills(){const c=document.getElementById('filterPills');c.innerHTML='<span class="filter-pill active" onclick="selectProduct(null,this)">'+t('filter_all')+'</span>';Object.entries(CONFIG.products).forEach(([k,p])=>{const s=p.name.split(' - ')[1]||k,pill=document.createElement('span');pill.className='filter-pill';pill.textContent=s;pill.onclick=()=>selectProduct(k,pill);c.appendChild(pill)})}
+function selectProduct(pk,el){currentProduct=pk;document.querySelectorAll('.filter-pill').forEach(p=>p.classList.remove('active'));if(el)el.classList.add('active');filterAndRender()}
+function renderLanguages(){const d=document.getElementById('langDropdown');Object.entries(CONFIG.languages).forEach(([c,l])=>{const o=document.createElement('div');o.className='lang-option';o.textContent=l.name;o.onclick=()=>setLanguage(c);d.appendChild(o)})}
+function setLanguage(c){currentLang=c;localStorage.setItem('lang',c);document.getElementById('currentLang').textContent=CONFIG.languages[c]?.name||c;document.querySelectorAll('.lang-option').forEach(o=>o.classList.toggle('selected',o.textContent===CONFIG.languages[c]?.name));document.getElementById('langDropdown').classList.remove('active');translateUI();articles=[];loadArticles()}
+function translateUI(){document.getElementById('heroTitle').innerHTML=t('hero_tagline').replace(', ','<br>');document.getElementById('heroDescription').textContent=t('hero_description');document.getElementById('heroBadge').textContent=t('hero_badge');document.getElementById('productsTitle').textContent=t('products_title');document.getElementById('articlesTitle').textContent=t('articles_title');document.getElementById('filterLabel').textContent=t('filter_label');document.getElementById('loadMoreBtn').textContent=t('load_more');document.getElementById('footerProductsTitle').textContent=t('footer_products');document.getElementById('footerSupportTitle').textContent=t('footer_support');document.getElementById('footerShipping').textContent=t('footer_shipping');document.getElementById('footerReturns').textContent=t('footer_returns');document.getElementById('footerContact').textContent=t('footer_contact');document.getElementById('footerFAQ').textContent=t('footer_faq');document.getElementById('footerBrandStory').textContent=t('footer_brand_story');document.getElementById('footerNewsletterTitle').textContent=t('footer_newsletter_title');document.getElementById('footerNewsletterDesc').textContent=t('footer_newsletter_desc');document.getElementById('footerNewsletterPlaceholder').placeholder=t('footer_newsletter_placeholder');document.getElementById('footerNewsletterBtn').textContent=t('footer_newsletter_btn');document.getElementById('footerRights').textContent=t('footer_rights');document.getElementById('footerBadgeFrance').textContent=t('trust_badge_france');document.getElementById('footerBadgeNatural').textContent=t('trust_badge_natural');document.getElementById('footerBadgeGrassFed').textContent=t('trust_badge_grassfed');document.getElementById('trustBadgeFrance').textContent=t('trust_badge_france');document.getElementById('trustBadgeGrassFed').textContent=t('trust_badge_grassfed');document.getElementById('trustBadgeNatural').textContent=t('trust_badge_natural');document.getElementById('trustBadgeShipping').textContent=t('trust_badge_shipping');document.getElementById('testimonialsTitle').textContent=t('testimonials_title');document.getElementById('testimonial1Text').textContent=t('testimonial1_text');document.getElementById('testimonial1Author').textContent=t('testimonial1_author');document.getElementById('testimonial2Text').textContent=t('testimonial2_text');document.getElementById('testimonial2Author').textContent=t('testimonial2_author');document.getElementById('testimonial3Text').textContent=t('testimonial3_text');document.getElementById('testimonial3Author').textContent=t('testimonial3_author');renderFilterPills()}
+function toggleLangDropdown(){document.getElementById('langDropdown').classList.toggle('active')}
+document.addEventListener('click',e=>{if(!e.target.closest('.lang-selector'))document.getElementById('langDropdown').classList.remove('active')});
+window.addEventListener('scroll',()=>{const header=document.querySelector('header');if(window.scrollY>20){header.classList.add('scrolled')}else{header.classList.remove('scrolled')}});
+    </script>
+</body>
+</html>'''
+
+
+ARTICLE_HTML = '''<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-FNX57VXL9L"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){{dataLayer.push(arguments);}}
+      gtag('js', new Date());
+      gtag('config', 'G-FNX57VXL9L');
+    </script>
+    <link rel="icon" type="image/png" href="{favicon_url}">
+    <title>{title} | FrenchTallowSoap</title>
+    <meta name="description" content="{description}">
+    <link rel="canonical" href="{base_url}/articles/{slug}/">
+    
+    <!-- Open Graph / Facebook -->
+    <meta property="og:type" content="article">
+    <meta property="og:url" content="{base_url}/articles/{slug}/">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:image" content="{base_url}{product_image_url}">
+    <meta property="og:site_name" content="FrenchTallowSoap">
+    <meta property="og:locale" content="{og_locale}">
+    <meta property="article:published_time" content="{iso_date}">
+    <meta property="article:author" content="FrenchTallowSoap Team">
+    
+    <!-- Twitter Card -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{title}">
+    <meta name="twitter:description" content="{description}">
+    <meta name="twitter:image" content="{base_url}{product_image_url}">
+    
+    <!-- Hreflang tags for multilingual SEO -->
+    {hreflang_tags}
+    
+    <!-- JSON-LD Structured Data -->
+    <script type="application/ld+json">
+    {{
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": "{title_escaped}",
+        "description": "{description_escaped}",
+        "image": "{base_url}{product_image_url}",
+        "datePublished": "{iso_date}",
+        "dateModified": "{iso_date}",
+        "author": {{
+            "@type": "Organization",
+            "name": "FrenchTallowSoap",
+            "url": "{base_url}"
+        }},
+        "publisher": {{
+            "@type": "Organization",
+            "name": "FrenchTallowSoap",
+            "url": "{base_url}",
+            "logo": {{
+                "@type": "ImageObject",
+                "url": "{base_url}{logo_url}"
+            }}
+        }},
+        "mainEntityOfPage": {{
+            "@type": "WebPage",
+            "@id": "{base_url}/articles/{slug}/"
+        }},
+        "about": {{
+            "@type": "Product",
+            "name": "{product_name_escaped}",
+            "description": "Grass-fed whipped tallow balm - natural skincare made in France",
+            "image": "{base_url}{product_image_url}",
+            "brand": {{
+                "@type": "Brand",
+                "name": "FrenchTallowSoap"
+            }},
+            "offers": {{
+                "@type": "Offer",
+                "url": "{product_link}",
+                "price": "{product_price}",
+                "priceCurrency": "EUR",
+                "priceValidUntil": "{price_valid_until}",
+                "availability": "https://schema.org/InStock",
+                "itemCondition": "https://schema.org/NewCondition",
+                "seller": {{
+                    "@type": "Organization",
+                    "name": "FrenchTallowSoap"
+                }},
+                "shippingDetails": {{
+                    "@type": "OfferShippingDetails",
+                    "shippingRate": {{
+                        "@type": "MonetaryAmount",
+                        "value": "0",
+                        "currency": "EUR"
+                    }},
+                    "shippingDestination": {{
+                        "@type": "DefinedRegion",
+                        "addressCountry": "EU"
+                    }},
+                    "deliveryTime": {{
+                        "@type": "ShippingDeliveryTime",
+                        "handlingTime": {{
+                            "@type": "QuantitativeValue",
+                            "minValue": 1,
+                            "maxValue": 3,
+                            "unitCode": "DAY"
+                        }},
+                        "transitTime": {{
+                            "@type": "QuantitativeValue",
+                            "minValue": 5,
+                            "maxValue": 10,
+                            "unitCode": "DAY"
+                        }}
+                    }}
+                }},
+                "hasMerchantReturnPolicy": {{
+                    "@type": "MerchantReturnPolicy",
+                    "applicableCountry": "EU",
+                    "returnPolicyCategory": "https://schema.org/MerchantReturnFiniteReturnWindow",
+                    "merchantReturnDays": 30,
+                    "returnMethod": "https://schema.org/ReturnByMail",
+                    "returnFees": "https://schema.org/FreeReturn"
+                }}
+            }}
+        }}
+    }}
+    </script>
+    {faq_schema}
+    
+    <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@400;500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">
+    <style>
+        :root{{--cream:#FAF7F2;--sage:#8B9F7C;--sage-dark:#6B7F5C;--charcoal:#2D2D2D;--warm-gray:#7A7A7A;--gold-light:#E8DCC4;--white:#FFFFFF}}
+        *{{margin:0;padding:0;box-sizing:border-box}}
+        body{{font-family:'Inter',sans-serif;background:var(--cream);color:var(--charcoal);line-height:1.7}}
+        header{{background:#fefefe;padding:1rem 2rem;border-bottom:1px solid var(--gold-light)}}
+        .logo{{font-family:'Cormorant Garamond',serif;font-size:1.5rem;font-weight:600;color:var(--charcoal);text-decoration:none}}
+        .logo span{{color:var(--sage)}}
+        main{{max-width:720px;margin:0 auto;padding:3rem 2rem}}
+        article{{background:var(--white);border-radius:16px;padding:3rem}}
+        h1{{font-family:'Cormorant Garamond',serif;font-size:2.25rem;font-weight:500;line-height:1.3;margin-bottom:1.5rem}}
+        .meta{{color:var(--warm-gray);font-size:0.9rem;margin-bottom:2rem;padding-bottom:1.5rem;border-bottom:1px solid var(--gold-light)}}
+        .content{{font-size:1.1rem}}.content p{{margin-bottom:1.5rem}}
+        .content h2{{font-family:'Cormorant Garamond',serif;font-size:1.5rem;margin:2rem 0 1rem}}
+        .product-cta{{background:var(--cream);border-radius:12px;padding:1.5rem;margin-top:2rem;display:flex;gap:1.5rem;align-items:center}}
+        .product-cta img{{width:100px;height:100px;aspect-ratio:1;object-fit:cover;border-radius:10px;background:var(--cream);flex-shrink:0}}
+        .product-cta h3{{font-family:'Cormorant Garamond',serif;font-size:1.2rem;margin-bottom:0.5rem}}
+        .btn{{display:inline-block;margin-top:0.5rem;padding:0.6rem 1.25rem;background:var(--sage);color:white;text-decoration:none;border-radius:6px;font-size:0.9rem}}
+        .btn:hover{{background:var(--sage-dark)}}
+        .back-link{{display:inline-block;margin-bottom:1.5rem;color:var(--sage);text-decoration:none;font-size:0.9rem}}
+        .related{{background:var(--white);border-radius:16px;padding:2rem 3rem;margin-top:2rem}}
+        .related h2{{font-family:'Cormorant Garamond',serif;font-size:1.4rem;font-weight:500;margin-bottom:1rem}}
+        .related ul{{list-style:none}}.related li{{padding:0.5rem 0;border-bottom:1px solid var(--gold-light)}}.related li:last-child{{border-bottom:none}}
+        .related a{{color:var(--charcoal);text-decoration:none}}.related a:hover{{color:var(--sage-dark)}}
+        @media(max-width:600px){{article{{padding:1.5rem}}.product-cta{{flex-direction:column;text-align:center}}}}
+    </style>
+</head>
+<body>
+    <header><a href="/" class="logo"><img src="{logo_url}" alt="FrenchTallowSoap" style="height:60px;margin-right:10px"><span>French</span>Tallow<span>Soap</span></a></header>
+    <main>
+        <a href="/" class="back-link">← Back to all articles</a>
+        <article>
+            <h1>{title}</h1>
+            <div class="meta">{date} · {product_scent}</div>
+            <div class="content">{body}</div>
+            <div class="product-cta">
+                <img src="{product_image_url}" alt="{product_name}">
+                <div>
+                    <h3>{product_name}</h3>
+                    <p style="color:var(--warm-gray);font-size:0.9rem">Grass-fed whipped tallow balm</p>
+                    <a href="{product_link}" class="btn" target="_blank" rel="noopener">Shop on Etsy</a>
+                </div>
+            </div>
+        </article>
+        {related_links}
+    </main>
+</body>
+</html>'''
+
+LISTING_HTML = '''<!DOCTYPE html>
+<html lang="{lang}">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <!-- Google tag (gtag.js) -->
+    <script async src="https://www.googletagmanager.com/gtag/js?id=G-FNX57VXL9L"></script>
+    <script>
+      window.dataLayer = window.dataLayer || [];
+      function gtag(){{dataLayer.push(arguments);}}
+      gtag('js', new Date());
+      gtag('config', 'G-FNX57VXL9L');
+    </script>
+    <link rel="icon" type="image/png" href="{favicon_url}">
+    <title>{title} | FrenchTallowSoap</title>
+    <meta name="description" content="{description}">
+    <link rel="canonical" href="{base_url}{url}">
+    {pagination_links}
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{base_url}{url}">
+    <meta property="og:title" content="{title}">
+    <meta property="og:description" content="{description}">
+    <meta property="og:site_name" content="FrenchTallowSoap">
+    <meta property="og:locale" content="{og_locale}">
+    <link href="https://fonts.googleapis.com/css2?family=Cormorant+Garamond:wght@400;500;600&family=Inter:wght@300;400;500&display=swap" rel="stylesheet">
+    <style>
+        :root{{--cream:#FAF7F2;--sage:#8B9F7C;--sage-dark:#6B7F5C;--charcoal:#2D2D2D;--warm-gray:#7A7A7A;--gold-light:#E8DCC4;--white:#FFFFFF}}
+        *{{margin:0;padding:0;box-sizing:border-box}}
+        body{{font-family:'Inter',sans-serif;background:var(--cream);color:var(--charcoal);line-height:1.7}}
+        header{{background:#fefefe;padding:1rem 2rem;border-bottom:1px solid var(--gold-light)}}
+        .logo{{font-family:'Cormorant Garamond',serif;font-size:1.5rem;font-weight:600;color:var(--charcoal);text-decoration:none}}
+        .logo span{{color:var(--sage)}}
+        main{{max-width:960px;margin:0 auto;padding:3rem 2rem}}
+        h1{{font-family:'Cormorant Garamond',serif;font-size:2.25rem;font-weight:500;line-height:1.3;margin-bottom:0.5rem}}
+        .count{{color:var(--warm-gray);font-size:0.9rem;margin-bottom:1.5rem}}
+        .filters{{display:flex;flex-wrap:wrap;gap:0.5rem;margin-bottom:2rem}}
+        .filters a{{padding:0.35rem 0.9rem;border-radius:999px;background:var(--white);border:1px solid var(--gold-light);color:var(--charcoal);text-decoration:none;font-size:0.85rem}}
+        .filters a.active,.filters a:hover{{background:var(--sage);border-color:var(--sage);color:var(--white)}}
+        .cards{{display:grid;grid-template-columns:repeat(auto-fill,minmax(280px,1fr));gap:1.25rem}}
+        .card{{display:block;background:var(--white);border-radius:16px;padding:1.5rem;color:var(--charcoal);text-decoration:none;border:1px solid transparent}}
+        .card:hover{{border-color:var(--gold-light)}}
+        .card h2{{font-family:'Cormorant Garamond',serif;font-size:1.3rem;font-weight:500;line-height:1.35;margin:0.5rem 0}}
+        .tag{{display:inline-block;font-size:0.75rem;color:var(--sage-dark);background:var(--cream);border-radius:999px;padding:0.15rem 0.6rem;margin-right:0.35rem}}
+        .date{{color:var(--warm-gray);font-size:0.85rem}}
+        .pagination{{display:flex;flex-wrap:wrap;justify-content:center;gap:0.4rem;margin-top:2.5rem}}
+        .pagination a,.pagination span{{min-width:2.4rem;padding:0.4rem 0.75rem;text-align:center;border-radius:8px;background:var(--white);color:var(--charcoal);text-decoration:none;font-size:0.9rem}}
+        .pagination span{{background:var(--sage);color:var(--white)}}
+        .pagination .gap{{background:none;color:var(--warm-gray)}}
+        @media(max-width:600px){{main{{padding:2rem 1rem}}h1{{font-size:1.8rem}}}}
+    </style>
+</head>
+<body>
+    <header><a href="/" class="logo"><img src="{logo_url}" alt="FrenchTallowSoap" style="height:60px;margin-right:10px"><span>French</span>Tallow<span>Soap</span></a></header>
+    <main>
+        <h1>{heading}</h1>
+        <div class="count">{count}</div>
+        {filters}
+        <div class="cards">
+{cards}
+        </div>
+        {pagination}
+    </main>
+</body>
+</html>'''
+
+def markdown_to_html(text):
+    text = re.sub(r'^### (.+)$', r'<h3>\1</h3>', text, flags=re.MULTILINE)
+    text = re.sub(r'^## (.+)$', r'<h2>\1</h2>', text, flags=re.MULTILINE)
+    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'\*(.+?)\*', r'<em>\1</em>', text)
+    paragraphs = text.split('\n\n')
+    html = []
+    for p in paragraphs:
+        p = p.strip()
+        if p and not p.startswith('<h'):
+            html.append(f'<p>{p}</p>')
+        else:
+            html.append(p)
+    return '\n\n'.join(html)
+
+# =============================================================================
+# SEO HELPER FUNCTIONS
+# =============================================================================
+
+# Language to Open Graph locale mapping
+OG_LOCALE_MAP = {
+    'en': 'en_US', 'de': 'de_DE', 'fr': 'fr_FR', 'es': 'es_ES', 'it': 'it_IT',
+    'pt': 'pt_PT', 'nl': 'nl_NL', 'pl': 'pl_PL', 'sv': 'sv_SE', 'da': 'da_DK',
+    'fi': 'fi_FI', 'el': 'el_GR', 'cs': 'cs_CZ', 'ro': 'ro_RO', 'hu': 'hu_HU',
+    'sk': 'sk_SK', 'bg': 'bg_BG', 'hr': 'hr_HR', 'sl': 'sl_SI', 'lt': 'lt_LT',
+    'lv': 'lv_LV', 'et': 'et_EE', 'mt': 'mt_MT', 'ga': 'ga_IE'
+}
+
+def escape_json_string(s):
+    """Escape string for use in JSON-LD"""
+    if not s:
+        return ''
+    return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', ' ').replace('\r', '')
+
+def extract_faq_from_body(body):
+    """Extract FAQ questions and answers from article body for FAQ schema"""
+    faqs = []
+    # Look for Q&A patterns like **Question?** followed by answer
+    qa_pattern = r'\*\*([^*]+\?)\*\*\s*\n+([^\n*#]+(?:\n[^\n*#]+)*)'
+    matches = re.findall(qa_pattern, body)
+    
+    for question, answer in matches[:5]:  # Limit to 5 FAQs
+        question = question.strip()
+        answer = answer.strip().replace('\n', ' ')
+        if len(answer) > 20:  # Only include if answer is substantial
+            faqs.append({'question': question, 'answer': answer[:500]})
+    
+    return faqs
+
+def generate_faq_schema(faqs, base_url):
+    """Generate FAQ JSON-LD schema"""
+    if not faqs:
+        return ''
+    
+    faq_items = []
+    for faq in faqs:
+        faq_items.append(f'''        {{
+            "@type": "Question",
+            "name": "{escape_json_string(faq['question'])}",
+            "acceptedAnswer": {{
+                "@type": "Answer",
+                "text": "{escape_json_string(faq['answer'])}"
+            }}
+        }}''')
+    
+    return f'''<script type="application/ld+json">
+    {{
+        "@context": "https://schema.org",
+        "@type": "FAQPage",
+        "mainEntity": [
+{','.join(faq_items)}
+        ]
+    }}
+    </script>'''
+
+# Bump when a rule below changes; `python blog.py migrate` then recomputes stored fields
+DERIVED_FIELDS_VERSION = 1
+DERIVED_FIELDS = ('description', 'faqs', 'faq_schema', 'iso_date', 'product_scent',
+                  'word_count', 'reading_time', 'content_hash', 'derived_version')
+WORDS_PER_MINUTE = 200
+
+def compute_derived_fields(article):
+    """
+    Fields derived from an article's own content, stored with it at save time
+    so the build does not recompute them (see DERIVED_FIELDS_VERSION).
+    """
+    body = article.get('body', '')
+    faqs = extract_faq_from_body(body)
+    word_count = len(body.split())
+    generated_at = article.get('generated_at', '')
+    return {
+        'description': body[:155].replace('"', '').replace('\n', ' '),
+        'faqs': faqs,
+        'faq_schema': generate_faq_schema(faqs, ''),
+        'iso_date': generated_at[:10] + 'T00:00:00Z' if generated_at else datetime.now().strftime('%Y-%m-%dT00:00:00Z'),
+        'product_scent': product_scent(article.get('product', '')),
+        'word_count': word_count,
+        'reading_time': max(1, -(-word_count // WORDS_PER_MINUTE)),
+        'content_hash': article_content_hash(article.get('title', ''), body),
+        'derived_version': DERIVED_FIELDS_VERSION,
+    }
+
+def generate_hreflang_tags(slug, product, angle, all_articles, base_url):
+    """Generate hreflang tags for multilingual SEO"""
+    # Find all language versions of similar articles (same product and angle)
+    related_articles = [a for a in all_articles if a['product'] == product and a['angle'] == angle]
+    
+    if len(related_articles) <= 1:
+        return ''
+    
+    tags = []
+    for article in related_articles:
+        lang = article['language']
+        article_slug = article['slug']
+        tags.append(f'<link rel="alternate" hreflang="{lang}" href="{base_url}/articles/{article_slug}/">')
+    
+    # Add x-default pointing to English version
+    en_article = next((a for a in related_articles if a['language'] == 'en'), None)
+    if en_article:
+        tags.append(f'<link rel="alternate" hreflang="x-default" href="{base_url}/articles/{en_article["slug"]}/">')
+    
+    return '\n    '.join(tags)
+
+def generate_robots_txt(base_url):
+    """Generate robots.txt content"""
+    return f"""# robots.txt for FrenchTallowSoap
+# Generated: {datetime.now().strftime('%Y-%m-%d')}
+
+User-agent: *
+Allow: /
+
+# Sitemap location
+Sitemap: {base_url}/sitemap.xml
+
+# Crawl-delay (optional, be nice to servers)
+Crawl-delay: 1
+"""
+
+def generate_sitemap_xml(articles, base_url, listings=()):
+    """Generate sitemap.xml content (listings: first page of each listing page)"""
+    urls = []
+    
+    # Homepage
+    urls.append(f"""  <url>
+    <loc>{base_url}/</loc>
+    <lastmod>{datetime.now().strftime('%Y-%m-%d')}</lastmod>
+    <changefreq>daily</changefreq>
+    <priority>1.0</priority>
+  </url>""")
+    
+    # Listing pages
+    for listing in listings:
+        lastmod = listing['records'][0].get('generated_at', '')[:10] or datetime.now().strftime('%Y-%m-%d')
+        urls.append(f"""  <url>
+    <loc>{base_url}/{listing['path']}/</loc>
+    <lastmod>{lastmod}</lastmod>
+    <changefreq>daily</changefreq>
+    <priority>0.6</priority>
+  </url>""")
+    
+    # Article pages
+    for article in articles:
+        lastmod = article.get('generated_at', '')[:10] or datetime.now().strftime('%Y-%m-%d')
+        urls.append(f"""  <url>
+    <loc>{base_url}/articles/{article['slug']}/</loc>
+    <lastmod>{lastmod}</lastmod>
+    <changefreq>monthly</changefreq>
+    <priority>0.8</priority>
+  </url>""")
+    
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:xhtml="http://www.w3.org/1999/xhtml">
+{chr(10).join(urls)}
+</urlset>"""
+
+# =============================================================================
+# ASSET FINGERPRINTING & CACHE HEADERS
+# =============================================================================
+
+# Content-addressed copies live here and are safe to cache forever
+HASHED_ASSETS_DIR = "static"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+HTML_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+ASSET_CACHE_CONTROL = "public, max-age=86400, must-revalidate"
+
+def content_hash(data, length=12):
+    """Short hex digest used in fingerprinted file names"""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+def hashed_asset_name(filename, digest):
+    """logo.png + digest -> logo.<digest>.png"""
+    stem, dot, ext = filename.rpartition('.')
+    return f"{stem}.{digest}.{ext}" if dot else f"{filename}.{digest}"
+
+def write_hashed_asset(data, filename, out):
+    """Write bytes under a content-addressed name, return its URL path"""
+    hashed_name = hashed_asset_name(filename, content_hash(data))
+    out.write_bytes(f"{HASHED_ASSETS_DIR}/{hashed_name}", data)
+    return f"/{HASHED_ASSETS_DIR}/{hashed_name}"
+
+def copy_hashed_asset(rel_path, out, length=12):
+    """Fingerprint a file already in the build (e.g. a streamed manifest) without reading it into memory"""
+    digest = out.files[rel_path]['sha256']
+    hashed_name = hashed_asset_name(rel_path.rsplit('/', 1)[-1], digest[:length])
+    out.link_file(rel_path, f"{HASHED_ASSETS_DIR}/{hashed_name}")
+    return f"/{HASHED_ASSETS_DIR}/{hashed_name}"
+
+def fingerprint_assets(out):
+    """
+    Create fingerprinted copies of the static assets already in the build.
+
+    The original files are left in place so existing external links keep working.
+
+    Returns: dict mapping original URL path -> fingerprinted URL path
+    """
+    asset_map = {}
+    for rel_path in sorted(out.files):
+        is_image = rel_path.startswith("assets/images/") and rel_path.endswith(".png")
+        if rel_path != "favicon.png" and not is_image:
+            continue
+        data = (out.root / rel_path).read_bytes()
+        asset_map['/' + rel_path] = write_hashed_asset(data, rel_path.rsplit('/', 1)[-1], out)
+    return asset_map
+
+def asset_url(asset_map, url):
+    """Fingerprinted URL for an asset, falling back to the original path"""
+    return asset_map.get(url, url)
+
+def generate_headers_file(languages=()):
+    """Generate Cloudflare Pages _headers content (languages: listing page prefixes)"""
+    listing_rules = ''.join(f"""
+/{lang}/*
+  Cache-Control: {HTML_CACHE_CONTROL}
+""" for lang in languages)
+    return f"""# _headers for FrenchTallowSoap (Cloudflare Pages)
+# Generated: {datetime.now().strftime('%Y-%m-%d')}
+
+# Fingerprinted assets never change under the same URL
+/{HASHED_ASSETS_DIR}/*
+  Cache-Control: {IMMUTABLE_CACHE_CONTROL}
+
+# HTML and data: short TTL, then revalidate
+/
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/index.html
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/articles/*
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/data/*
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/search/*
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/sitemap.xml
+  Cache-Control: {HTML_CACHE_CONTROL}
+
+/robots.txt
+  Cache-Control: {HTML_CACHE_CONTROL}
+{listing_rules}
+# Un-fingerprinted originals kept for external links
+/assets/*
+  Cache-Control: {ASSET_CACHE_CONTROL}
+
+/favicon.png
+  Cache-Control: {ASSET_CACHE_CONTROL}
+"""
+
+def collect_articles():
+    """Every article, oldest first, as Article records (a.body reads it from the store)"""
+    return collect_article_metadata()
+
+def metadata_order(a):
+    """Sort key of the build order (the SQLite store's order; directory order is arbitrary)"""
+    return (a.get('generated_at', ''), a['slug'])
+
+def collect_article_metadata():
+    """Lightweight records (no bodies) for every article, oldest first"""
+    return sorted(get_article_store().load_metadata(), key=metadata_order)
+
+# =============================================================================
+# BUILD INSTRUMENTATION
+# =============================================================================
+# Phase timings, per-article step timings and counters for one build, saved
+# to build-stats.json. Steps are timed with bare perf_counter() laps so the
+# article loop pays well under a microsecond per step.
+
+BUILD_STATS_FILE = DATA_DIR / "build-stats.json"
+BUILD_PROFILE_FILE = DATA_DIR / "build-profile.prof"
+
+class StepClock:
+    """Lap timer for one pipeline stage: start() per item, lap(step) after each step"""
+
+    __slots__ = ('steps', 'last')
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.last = 0.0
+
+    def start(self):
+        self.last = time.perf_counter()
+
+    def lap(self, step):
+        now = time.perf_counter()
+        entry = self.steps.get(step)
+        if entry is None:
+            self.steps[step] = entry = [0.0, 0]
+        entry[0] += now - self.last
+        entry[1] += 1
+        self.last = now
+
+class BuildStats:
+    """Timings and counters of one build"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.steps = {}
+        self.counters = {}
+        self._phase = None
+        self._phase_started = 0.0
+
+    def phase(self, name):
+        """Start timing a phase (ends the previous one)"""
+        self.end_phase()
+        self._phase = name
+        self._phase_started = time.perf_counter()
+
+    def end_phase(self):
+        if self._phase is not None:
+            self.phases[self._phase] = time.perf_counter() - self._phase_started
+            self._phase = None
+
+    def clock(self):
+        return StepClock(self.steps)
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self, out=None):
+        self.end_phase()
+        data = {
+            'created_at': datetime.now().isoformat(),
+            'total_seconds': round(time.perf_counter() - self.started, 4),
+            'phases': {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            'steps': {
+                name: {'seconds': round(seconds, 4), 'calls': calls,
+                       'avg_us': round(seconds / calls * 1e6, 2) if calls else 0}
+                for name, (seconds, calls) in self.steps.items()
+            },
+            'counters': dict(self.counters),
+            'peak_memory_mb': peak_memory_mb(),
+        }
+        if out is not None:
+            sections = {}
+            for rel_path, entry in out.files.items():
+                top = rel_path.split('/', 1)[0] if '/' in rel_path else '.'
+                section = sections.setdefault('listings' if top in CONFIG['languages'] else top, {'files': 0, 'bytes': 0})
+                section['files'] += 1
+                section['bytes'] += entry['size']
+            data['build'] = out.root.name
+            data['output'] = {
+                'files': len(out.files),
+                'bytes': sum(entry['size'] for entry in out.files.values()),
+                'written': out.written,
+                'written_bytes': out.written_bytes,
+                'linked': out.linked,
+                'sections': dict(sorted(sections.items())),
+            }
+        return data
+
+    def save(self, out=None, path=BUILD_STATS_FILE):
+        data = self.to_dict(out)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return data
+
+    def print_summary(self):
+        self.end_phase()
+        print("\n  Timings:")
+        for name, seconds in self.phases.items():
+            print(f"    {name:<22} {seconds:8.2f}s")
+        if self.steps:
+            print("  Steps (total / per call):")
+            for name, (seconds, calls) in sorted(self.steps.items(), key=lambda kv: -kv[1][0]):
+                print(f"    {name:<22} {seconds:8.2f}s  {seconds / calls * 1e6:8.1f}us x {calls}")
+
+# =============================================================================
+# STREAMING BUILD PIPELINE (read -> derive -> render -> write)
+# =============================================================================
+# Only metadata records stay in memory; each body is loaded from the store,
+# turned into a page and a manifest entry, and dropped before the next one.
+
+def group_by_translation(metadata):
+    """(product, angle) -> metadata records, the groups hreflang tags link together"""
+    groups = {}
+    for a in metadata:
+        groups.setdefault((a['product'], a['angle']), []).append(a)
+    return groups
+
+def index_corpus(store, metadata, out, stats, related_k=5):
+    """
+    Per-language corpus pass: search index shards and related-article graph.
+
+    Term vectors come from a per-language TermVectorCache, so only new or
+    edited articles are tokenized; one language is held in memory at a time.
+
+    Returns: slug -> related metadata records ({} without numpy/scipy)
+    """
+    by_language = {}
+    for a in metadata:
+        by_language.setdefault(a['language'], []).append(a)
+    from related_articles import RELATED_AVAILABLE, related_from_vectors
+    related = {}
+    clock = stats.clock()
+    for lang, records in by_language.items():
+        cache = TermVectorCache(CACHE_DIR / "terms" / f"{lang}.pickle")
+        vectors = language_vectors(store, records, cache, clock)
+        clock.start()
+        for rel_path, text in build_language_index(lang, records, vectors):
+            out.write_text(rel_path, text)
+            stats.count('search_files')
+        clock.lap('search_index')
+        if RELATED_AVAILABLE:
+            related.update(related_from_vectors(records, vectors, k=related_k))
+            clock.lap('related_articles')
+        cache.save()
+        stats.count('term_cache_hits', cache.hits)
+        stats.count('term_cache_misses', cache.misses)
+    return related
+
+def language_vectors(store, records, cache, clock):
+    """Weighted term vectors of one language's records, in order (from the TermVectorCache when unchanged)"""
+    vectors = []
+    for a in records:
+        clock.start()
+        body = store.get_body(a['slug'])
+        clock.lap('index_read')
+        digest = article_content_hash(a.get('title', ''), body)
+        vectors.append(cache.get(digest, a.get('title', ''), body))
+        clock.lap('term_vectors')
+    return vectors
+
+def generate_related_links(related, lang):
+    """Related-articles block for an article page"""
+    if not related:
+        return ''
+    heading = CONFIG.get('i18n', {}).get(lang, {}).get('related_articles', 'Related articles')
+    items = ''.join(f'<li><a href="/articles/{a["slug"]}/">{a["title"]}</a></li>' for a in related)
+    return f'<nav class="related" aria-label="{heading}"><h2>{heading}</h2><ul>{items}</ul></nav>'
+
+# Read with the body for each page: the stored derived fields the template needs
+ARTICLE_PAGE_FIELDS = ('body', 'description', 'faq_schema', 'iso_date', 'product_scent')
+
+def read_article_bodies(store, metadata, stats):
+    """Read stage: pair each metadata record with its body and stored page fields, one at a time"""
+    clock = stats.clock()
+    for a in metadata:
+        clock.start()
+        fields = store.get_fields(a['slug'], ARTICLE_PAGE_FIELDS)
+        clock.lap('read')
+        yield a, fields
+
+def derive_article_fields(items, translation_groups, related, base_url, stats):
+    """
+    Derive stage: corpus-dependent SEO fields (hreflang, related links).
+
+    Content-derived fields come from the article record. Records saved before
+    DERIVED_FIELDS_VERSION, or edited by hand since (content_hash no longer
+    matches), get them computed here (run `migrate` to store them).
+    """
+    clock = stats.clock()
+    for a, fields in items:
+        clock.start()
+        body = fields.get('body', '')
+        stale = (a.get('derived_version') != DERIVED_FIELDS_VERSION
+                 or a.get('content_hash') != article_content_hash(a.get('title', ''), body))
+        clock.lap('content_check')
+        if stale:
+            fields = compute_derived_fields({**a, 'body': body})
+            stats.count('derived_computed')
+            clock.lap('derive_fields')
+        group = translation_groups.get((a['product'], a['angle']), [])
+        hreflang_tags = generate_hreflang_tags(a['slug'], a['product'], a['angle'], group, base_url)
+        clock.lap('hreflang')
+        related_links = generate_related_links(related.get(a['slug'], []), a['language'])
+        clock.lap('related_links')
+        yield a, body, {
+            'description': fields['description'],
+            'hreflang_tags': hreflang_tags,
+            'faq_schema': fields['faq_schema'],
+            'related_links': related_links,
+            'og_locale': OG_LOCALE_MAP.get(a['language'], 'en_US'),
+            'iso_date': fields['iso_date'],
+            'product_scent': fields['product_scent'],
+        }
+
+def render_article_pages(items, asset_map, base_url, stats):
+    """Render stage: fill ARTICLE_HTML for each article"""
+    favicon_url = asset_url(asset_map, '/favicon.png')
+    logo_url = asset_url(asset_map, '/assets/images/logo.png')
+    merchant = CONFIG.get('merchant', {})
+    clock = stats.clock()
+    for a, body, derived in items:
+        clock.start()
+        product = CONFIG['products'].get(a['product'], {})
+        body_html = markdown_to_html(body)
+        clock.lap('markdown')
+        page = ARTICLE_HTML.format(
+            lang=a['language'],
+            title=a['title'],
+            description=derived['description'],
+            slug=a['slug'],
+            date=a['generated_at'][:10],
+            product_scent=derived['product_scent'],
+            body=body_html,
+            product_image_url=asset_url(asset_map, f"/assets/images/{product.get('image', '')}"),
+            product_name=product.get('name', ''),
+            product_link=product.get('link', '#'),
+            favicon_url=favicon_url,
+            logo_url=logo_url,
+            # New SEO parameters
+            base_url=base_url,
+            og_locale=derived['og_locale'],
+            iso_date=derived['iso_date'],
+            hreflang_tags=derived['hreflang_tags'],
+            faq_schema=derived['faq_schema'],
+            related_links=derived['related_links'],
+            title_escaped=escape_json_string(a['title']),
+            description_escaped=escape_json_string(derived['description']),
+            product_name_escaped=escape_json_string(product.get('name', '')),
+            # Product structured data parameters
+            product_price=product.get('price', 21.00),
+            price_valid_until=merchant.get('price_valid_until', '2026-12-31')
+        )
+        clock.lap('format')
+        yield a, body, page
+
+def manifest_entry(a, body):
+    """One article of data/articles.json, as JSON text"""
+    return json.dumps({
+        "slug": a['slug'], "title": a['title'], "body": body,
+        "product": a['product'], "product_name": a.get('product_name', ''),
+        "product_link": a.get('product_link', ''), "product_image": a.get('product_image', ''),
+        "language": a['language'], "angle": a['angle'], "generated_at": a['generated_at']
+    }, ensure_ascii=False)
+
+# Homepage listing of one language: data/articles.json without bodies
+LISTING_MANIFEST = "data/articles-{lang}.json"
+EXCERPT_CHARS = 180
+
+def listing_entry(a, body):
+    """One article of a homepage listing manifest (excerpt and reading time instead of the body)"""
+    return json.dumps({
+        "slug": a['slug'], "title": a['title'], "product": a['product'], "angle": a['angle'],
+        "generated_at": a['generated_at'], "excerpt": re.sub(r'[#*]', '', body[:EXCERPT_CHARS]) + '...',
+        "minutes": max(1, math.ceil(len(body.split()) / 200))
+    }, ensure_ascii=False)
+
+def write_listing_manifests(out, entries, asset_map):
+    """
+    Write and fingerprint the listing manifest of every language.
+
+    Args:
+        entries: language -> listing_entry texts, newest first
+
+    Returns: URL paths of the listing manifests this replaced (to remove)
+    """
+    old_urls = {url for key, url in asset_map.items() if key.startswith('/' + LISTING_MANIFEST.split('{')[0])}
+    for key in [k for k in asset_map if asset_map[k] in old_urls]:
+        del asset_map[key]
+    for lang, items in sorted(entries.items()):
+        rel_path = LISTING_MANIFEST.format(lang=lang)
+        out.write_text(rel_path, '[' + ', '.join(items) + ']')
+        asset_map['/' + rel_path] = copy_hashed_asset(rel_path, out)
+    return old_urls - set(asset_map.values())
+
+def write_article_pages(items, out, manifest_rel_path, stats, listing_entries=None):
+    """
+    Write stage: each page to articles/<slug>/index.html, and its manifest
+    entry appended to the articles.json array as it goes. listing_entries
+    (language -> list) collects the homepage listing entries.
+
+    Returns: (pages written, bytes written)
+    """
+    count = 0
+    total_bytes = 0
+    clock = stats.clock()
+    with out.open_stream(manifest_rel_path) as manifest:
+        manifest.write('[')
+        for a, body, page in items:
+            clock.start()
+            data = page.encode('utf-8')
+            out.write_bytes(f"articles/{a['slug']}/index.html", data)
+            clock.lap('write')
+            if count:
+                manifest.write(', ')
+            manifest.write(manifest_entry(a, body))
+            if listing_entries is not None:
+                listing_entries.setdefault(a['language'], []).append(listing_entry(a, body))
+            clock.lap('manifest')
+            count += 1
+            total_bytes += len(data)
+        manifest.write(']')
+    out.add_file(manifest_rel_path)
+    stats.count('article_pages', count)
+    stats.count('article_bytes', total_bytes)
+    return count, total_bytes
+
+# =============================================================================
+# LISTING PAGES
+# =============================================================================
+# Static, paginated article lists per language, language x product and
+# language x angle. Each listing gets a signature over everything its pages
+# show; a listing whose signature matches the previous build is hard-linked
+# from it without being rendered again.
+
+LISTING_PAGE_SIZE = CONFIG.get('build', {}).get('listing_page_size', 24)
+# Bump when the listing markup changes so every listing is rendered again
+LISTING_VERSION = 1
+
+# Angle -> i18n key (same mapping as formatAngle() in INDEX_HTML)
+ANGLE_I18N_KEYS = {
+    'problem_solution': 'angle_solution', 'ingredient_story': 'angle_ingredients',
+    'vs_commercial': 'angle_comparison', 'seasonal': 'angle_seasonal',
+    'lifestyle': 'angle_lifestyle', 'myth_busting': 'angle_myths',
+    'scent_focus': 'angle_aromatherapy', 'skin_type': 'angle_skin_guide',
+    'routine': 'angle_routine', 'heritage': 'angle_heritage'
+}
+
+def i18n_text(lang, key, default=''):
+    """UI string for a language, falling back to English, then to default"""
+    strings = CONFIG.get('i18n', {})
+    return strings.get(lang, {}).get(key) or strings.get('en', {}).get(key) or default
+
+def product_scent(product_key):
+    return CONFIG['products'].get(product_key, {}).get('name', product_key).split(' - ')[-1]
+
+def angle_label(lang, angle):
+    return i18n_text(lang, ANGLE_I18N_KEYS.get(angle, ''), angle)
+
+def listing_page_url(path, page):
+    return f"/{path}/" if page == 1 else f"/{path}/page/{page}/"
+
+def listing_page_file(path, page):
+    return f"{path}/index.html" if page == 1 else f"{path}/page/{page}/index.html"
+
+def listing_groups(metadata):
+    """
+    Every listing of the site, records newest first.
+
+    Yields dicts with path (<lang>, <lang>/product/<product> or
+    <lang>/angle/<angle>), lang, product, angle, records and filters (the
+    (url, label) links shared by all listings of the language).
+    """
+    by_language = {}
+    for a in metadata:
+        by_language.setdefault(a['language'], []).append(a)
+    for lang in sorted(by_language):
+        records = sorted(by_language[lang], key=lambda a: (a.get('generated_at', ''), a['slug']), reverse=True)
+        by_product, by_angle = {}, {}
+        for a in records:
+            by_product.setdefault(a['product'], []).append(a)
+            by_angle.setdefault(a['angle'], []).append(a)
+        filters = [(listing_page_url(lang, 1), i18n_text(lang, 'filter_all', 'All'))]
+        filters += [(listing_page_url(f"{lang}/product/{p.replace('_', '-')}", 1), product_scent(p))
+                    for p in sorted(by_product)]
+        filters += [(listing_page_url(f"{lang}/angle/{a.replace('_', '-')}", 1), angle_label(lang, a))
+                    for a in sorted(by_angle)]
+        listing = {'lang': lang, 'filters': filters}
+        yield {**listing, 'path': lang, 'product': None, 'angle': None, 'records': records}
+        for product in sorted(by_product):
+            yield {**listing, 'path': f"{lang}/product/{product.replace('_', '-')}",
+                   'product': product, 'angle': None, 'records': by_product[product]}
+        for angle in sorted(by_angle):
+            yield {**listing, 'path': f"{lang}/angle/{angle.replace('_', '-')}",
+                   'product': None, 'angle': angle, 'records': by_angle[angle]}
+
+def listing_signature(listing, environment):
+    """Hash of everything a listing's pages are rendered from"""
+    digest = hashlib.sha256(environment.encode('utf-8'))
+    digest.update(json.dumps(listing['filters'], ensure_ascii=False).encode('utf-8'))
+    for a in listing['records']:
+        digest.update(f"\0{a['slug']}\t{a['title']}\t{a['product']}\t{a['angle']}\t{a.get('generated_at', '')[:10]}".encode('utf-8'))
+    return digest.hexdigest()
+
+def listing_card(a, lang):
+    return (f'            <a class="card" href="/articles/{a["slug"]}/">'
+            f'<span class="tag">{product_scent(a["product"])}</span><span class="tag">{angle_label(lang, a["angle"])}</span>'
+            f'<h2>{a["title"]}</h2><span class="date">{a.get("generated_at", "")[:10]}</span></a>')
+
+def listing_pagination(path, page, pages):
+    """Page links: first, last, and two pages either side of the current one"""
+    if pages <= 1:
+        return ''
+    links = []
+    if page > 1:
+        links.append(f'<a href="{listing_page_url(path, page - 1)}" rel="prev">&larr;</a>')
+    shown = sorted({1, pages, *range(max(1, page - 2), min(pages, page + 2) + 1)})
+    previous = 0
+    for n in shown:
+        if n - previous > 1:
+            links.append('<span class="gap">&hellip;</span>')
+        links.append(f'<span>{n}</span>' if n == page else f'<a href="{listing_page_url(path, n)}">{n}</a>')
+        previous = n
+    if page < pages:
+        links.append(f'<a href="{listing_page_url(path, page + 1)}" rel="next">&rarr;</a>')
+    return f'<nav class="pagination">{"".join(links)}</nav>'
+
+def render_listing_pages(listing, favicon_url, logo_url, base_url):
+    """(relative path, html) for every page of one listing"""
+    lang, path, records = listing['lang'], listing['path'], listing['records']
+    articles_title = i18n_text(lang, 'articles_title', 'Latest Articles')
+    if listing['product']:
+        heading = f"{product_scent(listing['product'])} — {articles_title}"
+    elif listing['angle']:
+        heading = f"{angle_label(lang, listing['angle'])} — {articles_title}"
+    else:
+        heading = articles_title
+    language_name = CONFIG['languages'].get(lang, {}).get('name', lang)
+    count = f"{len(records)} {i18n_text(lang, 'articles_count', 'articles')}"
+    first_url = listing_page_url(path, 1)
+    filters = ''.join(
+        f'<a href="{url}" class="active">{label}</a>' if url == first_url else f'<a href="{url}">{label}</a>'
+        for url, label in listing['filters']
+    )
+    pages = max(1, -(-len(records) // LISTING_PAGE_SIZE))
+    for page in range(1, pages + 1):
+        chunk = records[(page - 1) * LISTING_PAGE_SIZE:page * LISTING_PAGE_SIZE]
+        title = heading if page == 1 else f"{heading} ({page}/{pages})"
+        head_links = []
+        if page > 1:
+            head_links.append(f'<link rel="prev" href="{base_url}{listing_page_url(path, page - 1)}">')
+        if page < pages:
+            head_links.append(f'<link rel="next" href="{base_url}{listing_page_url(path, page + 1)}">')
+        yield listing_page_file(path, page), LISTING_HTML.format(
+            lang=lang,
+            title=title,
+            description=f"{heading} · {language_name} · {count}".replace('"', ''),
+            url=listing_page_url(path, page),
+            base_url=base_url,
+            og_locale=OG_LOCALE_MAP.get(lang, 'en_US'),
+            pagination_links='\n    '.join(head_links),
+            favicon_url=favicon_url,
+            logo_url=logo_url,
+            heading=title,
+            count=count,
+            filters=f'<nav class="filters">{filters}</nav>',
+            cards='\n'.join(listing_card(a, lang) for a in chunk),
+            pagination=listing_pagination(path, page, pages),
+        )
+
+def generate_listing_nav(listings):
+    """Plain links to each language's listing, so crawlers reach articles without JavaScript"""
+    links = ''.join(
+        f'<a href="{listing_page_url(l["path"], 1)}" hreflang="{l["lang"]}">'
+        f'{CONFIG["languages"].get(l["lang"], {}).get("name", l["lang"])}</a>'
+        for l in listings if l['product'] is None and l['angle'] is None
+    )
+    return f'<nav class="listing-nav" aria-label="Articles by language">{links}</nav>' if links else ''
+
+def build_listing_pages(out, listings, asset_map, base_url):
+    """
+    Write all listing pages, reusing unchanged listings from the previous build.
+
+    Returns: (listings rendered, listings reused, pages in total)
+    """
+    favicon_url = asset_url(asset_map, '/favicon.png')
+    logo_url = asset_url(asset_map, '/assets/images/logo.png')
+    template_hash = content_hash(LISTING_HTML.encode('utf-8'))
+    environments = {}
+    rendered = reused = pages = 0
+    for listing in listings:
+        lang = listing['lang']
+        if lang not in environments:
+            environments[lang] = json.dumps([
+                LISTING_VERSION, LISTING_PAGE_SIZE, template_hash, favicon_url, logo_url, base_url,
+                CONFIG['languages'].get(lang, {}), CONFIG.get('i18n', {}).get(lang, {}),
+                CONFIG.get('i18n', {}).get('en', {}),
+                {key: p.get('name', '') for key, p in CONFIG['products'].items()},
+            ], ensure_ascii=False, sort_keys=True)
+        signature = listing_signature(listing, environments[lang])
+        previous = out.previous_listings.get(listing['path'])
+        if previous and previous.get('signature') == signature and out.reuse_previous(previous['files']):
+            files = previous['files']
+            reused += 1
+        else:
+            files = []
+            for rel_path, html in render_listing_pages(listing, favicon_url, logo_url, base_url):
+                out.write_text(rel_path, html)
+                files.append(rel_path)
+            rendered += 1
+        out.listings[listing['path']] = {'signature': signature, 'files': files}
+        pages += len(files)
+    return rendered, reused, pages
+
+def peak_memory_mb():
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def cmd_import_articles():
+    """Import articles/*.json into the SQLite article store"""
+    json_store = JsonArticleStore(ARTICLES_DIR)
+    with SqliteArticleStore(ARTICLES_DB) as db_store:
+        before = db_store.count()
+        copied = copy_articles(json_store, db_store)
+        after = db_store.count()
+    print(f"Imported {copied} articles into {ARTICLES_DB} ({after - before} new, {after} total)")
+    if STORAGE_BACKEND != 'sqlite':
+        print('Set "storage": {"backend": "sqlite"} in config.json to use it')
+
+def cmd_migrate(force=False, batch_size=500):
+    """Store current derived fields on every article whose stored ones are missing, outdated or stale"""
+    store = get_article_store()
+    checked = updated = 0
+    batch = []
+    for article in store.iter_articles():
+        checked += 1
+        derived = compute_derived_fields(article)
+        if force or any(article.get(key) != value for key, value in derived.items()):
+            article.update(derived)
+            batch.append(article)
+            if len(batch) >= batch_size:
+                updated += store.put_many(batch)
+                batch = []
+    if batch:
+        updated += store.put_many(batch)
+    print(f"Checked {checked} articles, updated {updated} (derived fields version {DERIVED_FIELDS_VERSION})")
+
+def cmd_export_articles(export_dir=None):
+    """
+    Mirror the article store as JSON files (the layout the Astro site loads):
+    new and changed articles are written, files of articles no longer in the
+    store are removed.
+    """
+    export_dir = Path(export_dir) if export_dir else ARTICLES_DIR
+    src = get_article_store()
+    if isinstance(src, JsonArticleStore) and src.articles_dir.resolve() == export_dir.resolve():
+        print(f"Articles are already stored as JSON in {export_dir}")
+        return
+    dst = JsonArticleStore(export_dir)
+    stale = set(dst.slugs())
+    added = updated = total = 0
+    for article in src.iter_articles():
+        slug = article['slug']
+        total += 1
+        if slug not in stale:
+            dst.put(article)
+            added += 1
+            continue
+        stale.discard(slug)
+        if dst.get(slug) != article:
+            dst.put(article)
+            updated += 1
+    for slug in stale:
+        dst.delete(slug)
+    print(f"Exported to {export_dir}: {added} new, {updated} updated, {len(stale)} removed ({total} total)")
+
+# =============================================================================
+# STAGED PUBLISHING
+# =============================================================================
+# Each build is written to .builds/<build-id>/ and published by atomically
+# repointing the public symlink at it. The last few builds are kept for
+# rollback and as hard-link sources for files that did not change.
+
+BUILDS_DIR = DATA_DIR / ".builds"
+# Build public/ holds a copy of, when it cannot be a symlink (see publish_copy)
+PUBLISHED_COPY_FILE = BUILDS_DIR / "published-copy"
+KEEP_BUILDS = CONFIG.get('build', {}).get('keep_builds', 5)
+# .gz/.br copies of text files for origins that serve precompressed variants (serve, static_server.py)
+PRECOMPRESS = CONFIG.get('build', {}).get('precompress', False)
+PRECOMPRESS_SUFFIXES = ('.html', '.json', '.js', '.xml', '.txt')
+PRECOMPRESS_MIN_BYTES = 1024
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BuildOutput:
+    """
+    Writes one build into its staging directory.
+
+    Files whose sha256 matches the previous build are hard-linked from it
+    instead of being written again. The hash and size of every file end up
+    in files, which is saved as the build manifest together with listings
+    (listing path -> signature and files, see build_listing_pages).
+    """
+
+    def __init__(self, root, previous_root=None, previous_manifest=None):
+        self.root = Path(root)
+        self.previous_root = Path(previous_root) if previous_root else None
+        previous_manifest = previous_manifest or {}
+        self.previous_files = previous_manifest.get('files', {})
+        self.previous_listings = previous_manifest.get('listings', {})
+        self.files = {}
+        self.listings = {}
+        self.written = 0
+        self.written_bytes = 0
+        self.linked = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._dirs = {self.root}
+
+    def _link_previous(self, rel_path, digest, dst):
+        previous = self.previous_files.get(rel_path)
+        if self.previous_root is None or not previous or previous['sha256'] != digest:
+            return False
+        try:
+            os.link(self.previous_root / rel_path, dst)
+        except OSError:
+            return False
+        return True
+
+    def write_bytes(self, rel_path, data):
+        dst = self.root / rel_path
+        if dst.parent not in self._dirs:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(dst.parent)
+        digest = hashlib.sha256(data).hexdigest()
+        if self._link_previous(rel_path, digest, dst):
+            self.linked += 1
+        else:
+            with open(dst, 'wb') as f:
+                f.write(data)
+            self.written += 1
+            self.written_bytes += len(data)
+        self.files[rel_path] = {'sha256': digest, 'size': len(data)}
+        return dst
+
+    def write_text(self, rel_path, text):
+        return self.write_bytes(rel_path, text.encode('utf-8'))
+
+    def copy_file(self, rel_path, src):
+        return self.write_bytes(rel_path, Path(src).read_bytes())
+
+    def open_stream(self, rel_path):
+        """
+        Open a file for streaming straight into the build (register it with add_file after).
+
+        Any existing file is unlinked first: it may be a hard link shared with older builds.
+        """
+        dst = self.root / rel_path
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.unlink(missing_ok=True)
+        return open(dst, 'w', encoding='utf-8')
+
+    def add_file(self, rel_path):
+        """Register a file that was streamed straight into the staging directory"""
+        dst = self.root / rel_path
+        digest = file_sha256(dst)
+        tmp = dst.with_name(dst.name + '.link')
+        if self._link_previous(rel_path, digest, tmp):
+            os.replace(tmp, dst)
+            self.linked += 1
+        else:
+            self.written += 1
+            self.written_bytes += dst.stat().st_size
+        self.files[rel_path] = {'sha256': digest, 'size': dst.stat().st_size}
+        return dst
+
+    def reuse_previous(self, rel_paths):
+        """Hard-link files unchanged from the previous build without producing them (all or nothing)"""
+        if self.previous_root is None or not all(p in self.previous_files for p in rel_paths):
+            return False
+        linked = []
+        for rel_path in rel_paths:
+            dst = self.root / rel_path
+            if dst.parent not in self._dirs:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                self._dirs.add(dst.parent)
+            try:
+                os.link(self.previous_root / rel_path, dst)
+            except OSError:
+                # Never leave links behind: a later write would go into the previous build's inode
+                for path in linked:
+                    path.unlink()
+                return False
+            linked.append(dst)
+        for rel_path in rel_paths:
+            self.files[rel_path] = dict(self.previous_files[rel_path])
+        self.linked += len(rel_paths)
+        return True
+
+    def link_file(self, src_rel_path, dst_rel_path):
+        """Give an existing build file a second name (hard link, copy as fallback)"""
+        src = self.root / src_rel_path
+        dst = self.root / dst_rel_path
+        if self.files.get(dst_rel_path, {}).get('sha256') == self.files[src_rel_path]['sha256'] and dst.exists():
+            return dst
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.unlink(missing_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+        self.files[dst_rel_path] = dict(self.files[src_rel_path])
+        return dst
+
+def precompress_outputs(out):
+    """
+    Write .gz (and .br with brotli installed) next to every compressible build file.
+
+    A variant records the sha256 of its source; variants of unchanged files
+    are linked from the previous build.
+
+    Returns: (variants compressed, variants reused)
+    """
+    encoders = [('.gz', lambda data: gzip.compress(data, 9, mtime=0))]
+    if BROTLI_AVAILABLE:
+        encoders.append(('.br', lambda data: brotli.compress(data, quality=9)))
+    compressed = reused = 0
+    # (source sha256, suffix) -> variant already in place (fingerprinted copies share one)
+    done = {}
+    for rel_path, entry in list(out.files.items()):
+        if not rel_path.endswith(PRECOMPRESS_SUFFIXES) or entry['size'] < PRECOMPRESS_MIN_BYTES:
+            continue
+        data = None
+        for suffix, encode in encoders:
+            variant = rel_path + suffix
+            key = (entry['sha256'], suffix)
+            previous = out.previous_files.get(variant)
+            if previous and previous.get('source') == entry['sha256'] and out.reuse_previous([variant]):
+                reused += 1
+            elif key in done:
+                out.link_file(done[key], variant)
+            else:
+                if data is None:
+                    data = (out.root / rel_path).read_bytes()
+                out.write_bytes(variant, encode(data))
+                out.files[variant]['source'] = entry['sha256']
+                compressed += 1
+            done.setdefault(key, variant)
+    return compressed, reused
+
+def build_manifest_path(build_dir):
+    return build_dir.with_name(build_dir.name + '.manifest.json')
+
+def load_build_manifest(build_dir):
+    """Manifest recorded for a build: files, listings ({} if unknown)"""
+    try:
+        with open(build_manifest_path(build_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def list_builds():
+    """Completed build directories, oldest first"""
+    if not BUILDS_DIR.exists():
+        return []
+    return sorted(p for p in BUILDS_DIR.iterdir() if p.is_dir() and build_manifest_path(p).exists())
+
+def current_build():
+    """The build public/ points at or is a copy of (None if public/ is not a staged build)"""
+    if OUTPUT_DIR.is_symlink():
+        return OUTPUT_DIR.resolve()
+    if OUTPUT_DIR.is_dir() and PUBLISHED_COPY_FILE.exists():
+        build_dir = BUILDS_DIR / PUBLISHED_COPY_FILE.read_text(encoding='utf-8').strip()
+        if build_dir.is_dir():
+            return build_dir
+    return None
+
+def start_build():
+    """Create a fresh staging directory, linked against the currently published build"""
+    build_id = datetime.now().strftime('%Y%m%d-%H%M%S')
+    build_dir = BUILDS_DIR / build_id
+    suffix = 1
+    while build_dir.exists():
+        suffix += 1
+        build_dir = BUILDS_DIR / f"{build_id}-{suffix}"
+    previous = current_build()
+    if previous is None and OUTPUT_DIR.is_dir():
+        previous = OUTPUT_DIR
+    previous_manifest = load_build_manifest(previous) if previous is not None else {}
+    return BuildOutput(build_dir, previous, previous_manifest)
+
+def finish_build(out):
+    with open(build_manifest_path(out.root), 'w', encoding='utf-8') as f:
+        # dumps() runs the C encoder; dump() would stream through the pure-Python one
+        f.write(json.dumps({'build': out.root.name, 'created_at': datetime.now().isoformat(),
+                            'files': out.files, 'listings': out.listings}))
+
+def keep_legacy_output():
+    """Move a public/ directory that is not a staged build into BUILDS_DIR as an extra rollback target"""
+    legacy_id = datetime.fromtimestamp(OUTPUT_DIR.stat().st_mtime).strftime('%Y%m%d-%H%M%S')
+    legacy = BUILDS_DIR / f"{legacy_id}-legacy"
+    OUTPUT_DIR.rename(legacy)
+    with open(build_manifest_path(legacy), 'w', encoding='utf-8') as f:
+        json.dump({'build': legacy.name, 'created_at': datetime.now().isoformat(), 'files': {}}, f)
+    print(f"  Moved existing {OUTPUT_DIR.name}/ to {legacy}")
+
+def link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def publish_copy(build_dir):
+    """
+    public/ as a directory holding build_dir's files, for hosts without symlinks.
+
+    The copy is hard-linked from the build in a sibling directory and swapped
+    in with two renames, so public/ is never half-written; it is only missing
+    for the instant between the renames (directories cannot be replaced
+    atomically).
+    """
+    staging = OUTPUT_DIR.with_name(OUTPUT_DIR.name + '.staging')
+    retired = OUTPUT_DIR.with_name(OUTPUT_DIR.name + '.retired')
+    for leftover in (staging, retired):
+        shutil.rmtree(leftover, ignore_errors=True)
+    shutil.copytree(build_dir, staging, copy_function=link_or_copy)
+    if OUTPUT_DIR.is_dir() and current_build() is None:
+        keep_legacy_output()
+    elif OUTPUT_DIR.exists():
+        OUTPUT_DIR.rename(retired)
+    staging.rename(OUTPUT_DIR)
+    PUBLISHED_COPY_FILE.write_text(build_dir.name, encoding='utf-8')
+    shutil.rmtree(retired, ignore_errors=True)
+
+def publish_build(build_dir):
+    """Atomically point public/ at build_dir (see publish_copy without symlink support)"""
+    tmp_link = OUTPUT_DIR.with_name(OUTPUT_DIR.name + '.swap')
+    if tmp_link.is_symlink() or tmp_link.exists():
+        tmp_link.unlink()
+    try:
+        os.symlink(os.path.relpath(build_dir, OUTPUT_DIR.parent), tmp_link, target_is_directory=True)
+    except OSError:
+        # No symlink support (e.g. Windows without developer mode)
+        publish_copy(build_dir)
+        print(f"  Symlinks unavailable - hard-linked build into {OUTPUT_DIR} "
+              f"(swapped by rename: not atomic, {OUTPUT_DIR.name}/ is briefly absent)")
+        return
+    retired = None
+    if OUTPUT_DIR.exists() and not OUTPUT_DIR.is_symlink():
+        if current_build() is None:
+            # First staged build: keep the old directory as an extra rollback target
+            keep_legacy_output()
+        else:
+            retired = OUTPUT_DIR.with_name(OUTPUT_DIR.name + '.retired')
+            shutil.rmtree(retired, ignore_errors=True)
+            OUTPUT_DIR.rename(retired)
+    os.replace(tmp_link, OUTPUT_DIR)
+    PUBLISHED_COPY_FILE.unlink(missing_ok=True)
+    if retired is not None:
+        shutil.rmtree(retired, ignore_errors=True)
+
+def prune_builds(keep=KEEP_BUILDS):
+    """Delete all but the newest `keep` builds (never the published one)"""
+    current = current_build()
+    builds = [b for b in list_builds() if b != current]
+    removed = 0
+    for build_dir in builds[:max(0, len(builds) - (keep - 1))]:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        build_manifest_path(build_dir).unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+def cmd_rollback(build_id=None):
+    """Point public/ back at an earlier build (default: the one before the current)"""
+    builds = list_builds()
+    current = current_build()
+    if build_id:
+        target = BUILDS_DIR / build_id
+        if target not in builds:
+            print(f"Unknown build: {build_id}")
+            print("Available builds: " + ", ".join(b.name for b in builds))
+            return
+    else:
+        older = [b for b in builds if current is None or b.name < current.name]
+        if not older:
+            print("No earlier build to roll back to")
+            return
+        target = older[-1]
+    publish_build(target)
+    print(f"public/ now points at {target.name}")
+
+def cmd_builds():
+    """List kept builds"""
+    current = current_build()
+    for build_dir in list_builds():
+        marker = '*' if build_dir == current else ' '
+        print(f"  {marker} {build_dir.name}")
+
+def cmd_build(profile=False, watch=False):
+    """
+    Build static site from articles into a staging directory, then publish it.
+
+    Timings and counters go to build-stats.json; with profile=True the build
+    runs under cProfile and the raw profile is saved to build-profile.prof.
+    With watch=True, keeps applying source changes afterwards (see watch_site).
+
+    Returns: (BuildOutput, site state from build_site)
+    """
+    print(f"\n{'='*50}")
+    print("BUILDING STATIC SITE")
+    print(f"{'='*50}")
+    
+    stats = BuildStats()
+    out = start_build()
+    print(f"  Staging: {out.root}")
+    profiler = None
+    if profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        site = build_site(out, stats)
+        finish_build(out)
+    except BaseException:
+        shutil.rmtree(out.root, ignore_errors=True)
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+    
+    stats.phase('publish')
+    publish_build(out.root)
+    pruned = prune_builds()
+    stats.end_phase()
+    print(f"\n  Files: {out.written} written ({out.written_bytes / (1024 * 1024):.1f} MB), "
+          f"{out.linked} hard-linked from previous build")
+    if pruned:
+        print(f"  Pruned {pruned} old build(s), keeping {KEEP_BUILDS}")
+    stats.print_summary()
+    data = stats.save(out)
+    print(f"  Total: {data['total_seconds']:.2f}s - stats saved to {BUILD_STATS_FILE.name}")
+    if profiler is not None:
+        import pstats
+        profiler.dump_stats(str(BUILD_PROFILE_FILE))
+        print(f"\n  Profile saved to {BUILD_PROFILE_FILE.name} (top 25 by cumulative time):\n")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    print(f"\n{'='*50}")
+    print(f"BUILD COMPLETE! Output: {OUTPUT_DIR} -> {out.root.name}")
+    print(f"{'='*50}\n")
+    if watch:
+        try:
+            watch_site(LiveSite(out, site))
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+    return out, site
+
+def build_site(out, stats):
+    """
+    Write every output file of the site through a BuildOutput.
+
+    Returns: the state watch mode keeps for targeted rebuilds (base_url, asset_map, metadata, related)
+    """
+    # Get base URL from config (default to empty for relative URLs if not set)
+    base_url = CONFIG.get('site', {}).get('base_url', '').rstrip('/')
+    if not base_url:
+        print("  Note: No base_url in config.json - using relative URLs")
+        base_url = ''
+    
+    # Copy images
+    print("\n[1/7] Copying images...")
+    stats.phase('images')
+    count = 0
+    if IMAGES_DIR.exists():
+        for img in IMAGES_DIR.glob("*.png"):
+            out.copy_file(f"assets/images/{img.name}", img)
+            count += 1
+    # Copy favicon to root
+    favicon_src = SCRIPT_DIR / "favicon.png"
+    if favicon_src.exists():
+        out.copy_file("favicon.png", favicon_src)
+        print(f"  Copied {count} images + favicon")
+    else:
+        print(f"  Copied {count} images")
+    asset_map = fingerprint_assets(out)
+    print(f"  Fingerprinted {len(asset_map)} assets")
+    
+    # Collect article metadata (bodies stay on disk until their page is rendered)
+    print("\n[2/7] Collecting article metadata...")
+    stats.phase('metadata')
+    store = get_article_store()
+    metadata = collect_article_metadata()
+    listings = list(listing_groups(metadata))
+    print(f"  Found {len(metadata)} articles")
+    stats.count('articles', len(metadata))
+    
+    effective_base_url = base_url if base_url else 'https://puretallow.com'
+    
+    # Build robots.txt + _headers
+    print("\n[3/7] Building robots.txt and _headers...")
+    stats.phase('robots_headers')
+    out.write_text("robots.txt", generate_robots_txt(effective_base_url))
+    out.write_text("_headers", generate_headers_file(sorted({l['lang'] for l in listings})))
+    print("  Built robots.txt and _headers")
+    
+    # Build sitemap.xml
+    print("\n[4/7] Building sitemap.xml...")
+    stats.phase('sitemap')
+    out.write_text("sitemap.xml", generate_sitemap_xml(metadata, effective_base_url, listings))
+    print(f"  Built sitemap.xml with {len(metadata) + len(listings) + 1} URLs")
+    
+    # Stream article pages + manifest: read -> derive -> render -> write
+    print("\n[5/7] Building articles with SEO enhancements...")
+    stats.phase('search_and_related')
+    related = index_corpus(store, metadata, out, stats)
+    search_shards = sum(1 for rel_path in out.files if rel_path.startswith("search/"))
+    asset_map['/search.js'] = write_hashed_asset(SEARCH_LOADER_JS.encode('utf-8'), "search.js", out)
+    print(f"  Built search index ({search_shards} shard files)")
+    if related:
+        print(f"  Related articles computed for {len(related)} pages")
+    else:
+        from related_articles import RELATED_AVAILABLE
+        if not RELATED_AVAILABLE:
+            print("  Note: Install numpy + scipy for related article links: pip install numpy scipy")
+    stats.phase('article_pages')
+    pipeline = read_article_bodies(store, metadata, stats)
+    pipeline = derive_article_fields(pipeline, group_by_translation(metadata), related, effective_base_url, stats)
+    pipeline = render_article_pages(pipeline, asset_map, effective_base_url, stats)
+    listing_entries = {}
+    page_count, page_bytes = write_article_pages(pipeline, out, "data/articles.json", stats, listing_entries)
+    asset_map['/data/articles.json'] = copy_hashed_asset("data/articles.json", out)
+    write_listing_manifests(out, listing_entries, asset_map)
+    print(f"  Built {page_count} article pages ({page_bytes / (1024 * 1024):.1f} MB)")
+    if stats.counters.get('derived_computed'):
+        print(f"  Note: {stats.counters['derived_computed']} articles have no current derived fields - "
+              "run 'python blog.py migrate' to store them")
+    print(f"  Built articles.json -> {asset_map['/data/articles.json']} "
+          f"(homepage listings: {len(listing_entries)} per-language manifests without bodies)")
+    
+    # Build listing pages (unchanged listings are linked from the previous build)
+    print("\n[6/7] Building listing pages...")
+    stats.phase('listings')
+    rendered, reused, listing_pages = build_listing_pages(out, listings, asset_map, effective_base_url)
+    stats.count('listings_rendered', rendered)
+    stats.count('listings_reused', reused)
+    stats.count('listing_pages', listing_pages)
+    print(f"  Built {len(listings)} listings ({listing_pages} pages): {rendered} rendered, {reused} unchanged")
+    
+    # Build index.html (last, so it can reference the fingerprinted manifest)
+    print("\n[7/7] Building index.html...")
+    stats.phase('index_html')
+    write_index_html(out, asset_map, listings)
+    print("  Built index.html")
+    if PRECOMPRESS:
+        stats.phase('precompress')
+        compressed, reused = precompress_outputs(out)
+        stats.count('precompressed', compressed)
+        print(f"  Precompressed variants: {compressed} written, {reused} unchanged"
+              + ("" if BROTLI_AVAILABLE else " (gzip only - pip install brotli for .br)"))
+    stats.end_phase()
+    
+    peak_mb = peak_memory_mb()
+    if peak_mb is not None:
+        print(f"\n  Peak memory: {peak_mb:.1f} MB ({len(metadata)} metadata records held)")
+    return {'base_url': effective_base_url, 'asset_map': asset_map, 'metadata': metadata, 'related': related}
+
+def write_index_html(out, asset_map, listings):
+    # language -> fingerprinted listing manifest (the homepage never loads article bodies)
+    listing_urls = {lang: asset_url(asset_map, '/' + LISTING_MANIFEST.format(lang=lang)) for lang in CONFIG['languages']
+                    if '/' + LISTING_MANIFEST.format(lang=lang) in asset_map}
+    frontend_products = {
+        key: {**p, "image_url": asset_url(asset_map, f"/assets/images/{p.get('image', '')}")}
+        for key, p in CONFIG['products'].items()
+    }
+    frontend_config = {
+        "products": frontend_products,
+        "languages": CONFIG['languages'],
+        "i18n": CONFIG.get('i18n', {})
+    }
+    html = (INDEX_HTML
+            .replace('{{CONFIG_JSON}}', json.dumps(frontend_config, ensure_ascii=False))
+            .replace('{{FAVICON_URL}}', asset_url(asset_map, '/favicon.png'))
+            .replace('{{LOGO_URL}}', asset_url(asset_map, '/assets/images/logo.png'))
+            .replace('{{LISTING_URLS}}', json.dumps(listing_urls))
+            .replace('{{SEARCH_JS_URL}}', asset_url(asset_map, '/search.js'))
+            .replace('{{LISTING_NAV}}', generate_listing_nav(listings)))
+    out.write_text("index.html", html)
+
+# =============================================================================
+# WATCH MODE
+# =============================================================================
+# build --watch / serve --watch: after one full build, article changes are
+# applied to the published build in place. Only the pages, search shards,
+# listings and manifests an edit affects are rendered again. A config.json
+# change restarts the process; an image change runs a full build.
+
+class LiveBuildOutput(BuildOutput):
+    """
+    Updates a published build in place.
+
+    Unchanged files are not touched. Changed files are replaced (write, then
+    rename) rather than modified, since their inode may be hard-linked into
+    older builds.
+    """
+
+    def __init__(self, root, files, listings):
+        super().__init__(root)
+        self.files = files
+        self.listings = listings
+        self.touched = set()
+
+    def begin_cycle(self):
+        self.written = self.written_bytes = self.removed = 0
+        self.touched = set()
+        self.previous_listings, self.listings = self.listings, {}
+
+    def write_bytes(self, rel_path, data):
+        self.touched.add(rel_path)
+        dst = self.root / rel_path
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.files.get(rel_path)
+        if entry and entry['sha256'] == digest and dst.exists():
+            return dst
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(dst.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, dst)
+        self.written += 1
+        self.written_bytes += len(data)
+        self.files[rel_path] = {'sha256': digest, 'size': len(data)}
+        return dst
+
+    def add_file(self, rel_path):
+        self.touched.add(rel_path)
+        dst = self.root / rel_path
+        self.files[rel_path] = {'sha256': file_sha256(dst), 'size': dst.stat().st_size}
+        self.written += 1
+        return dst
+
+    def reuse_previous(self, rel_paths):
+        """An unchanged listing's files are already in place"""
+        if not all(p in self.files for p in rel_paths):
+            return False
+        self.touched.update(rel_paths)
+        return True
+
+    def remove(self, rel_path):
+        path = self.root / rel_path
+        path.unlink(missing_ok=True)
+        if self.files.pop(rel_path, None) is not None:
+            self.removed += 1
+        # Drop directories left empty (articles/<slug>/, listing page/<n>/)
+        parent = path.parent
+        while parent != self.root:
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+            parent = parent.parent
+
+class LiveSite:
+    """The published build plus the state needed to rebuild single articles"""
+
+    def __init__(self, out, site):
+        # The build public/ links to, or public/ itself when it is a copy (see publish_copy)
+        self.out = LiveBuildOutput(OUTPUT_DIR.resolve(), out.files, out.listings)
+        self.base_url = site['base_url']
+        self.asset_map = site['asset_map']
+        self.metadata = {a['slug']: a for a in site['metadata']}
+        self.related = site['related']
+        # Loaded on the first change: slug -> data/articles.json entry, and listing_entry
+        self.manifest_entries = None
+        self.listing_entries = None
+        self.listing_languages = {a['language'] for a in site['metadata']}
+
+    def apply(self, changes):
+        """
+        Apply article changes to the published build.
+
+        Returns: (files written, files removed)
+        """
+        store = get_article_store()
+        out = self.out
+        out.begin_cycle()
+        stats = BuildStats()
+        if self.manifest_entries is None:
+            self.manifest_entries, self.listing_entries = {}, {}
+            for slug, a in self.metadata.items():
+                body = store.get_body(slug)
+                self.manifest_entries[slug] = manifest_entry(a, body)
+                self.listing_entries[slug] = listing_entry(a, body)
+
+        changed, removed = set(changes.articles_changed), set(changes.articles_removed)
+        before = {slug: self.metadata.get(slug) for slug in changed | removed}
+        for slug in sorted(changed):
+            try:
+                article = store.get(slug)
+            except ValueError as e:
+                print(f"  Skipping {slug}: {e}")
+                changed.discard(slug)
+                continue
+            if article is None:
+                removed.add(slug)
+                continue
+            self.metadata[slug] = article_metadata(article, store)
+            self.manifest_entries[slug] = manifest_entry(article, article.get('body', ''))
+            self.listing_entries[slug] = listing_entry(article, article.get('body', ''))
+        changed -= removed
+        for slug in removed:
+            self.metadata.pop(slug, None)
+            self.manifest_entries.pop(slug, None)
+            self.listing_entries.pop(slug, None)
+            self.related.pop(slug, None)
+            out.remove(f"articles/{slug}/index.html")
+        metadata = sorted(self.metadata.values(), key=metadata_order)
+
+        # Search shards and related articles of the affected languages
+        languages = {a['language'] for a in before.values() if a} | {self.metadata[s]['language'] for s in changed}
+        related = index_corpus(store, [a for a in metadata if a['language'] in languages], out, stats)
+        for rel_path in [p for p in out.files if p.startswith('search/') and p.split('/')[1] in languages]:
+            # Precompressed variants are dropped with their source further down
+            if rel_path not in out.touched and not rel_path.endswith(('.gz', '.br')):
+                out.remove(rel_path)
+
+        # Pages to render again: the edited ones, pages whose related links
+        # changed or point at an edited page, and translation groups an
+        # article joined or left (their hreflang tags)
+        pages = set(changed)
+        for slug, items in related.items():
+            new = [r['slug'] for r in items]
+            if new != [r['slug'] for r in self.related.get(slug, [])] or changed.intersection(new):
+                pages.add(slug)
+        self.related.update(related)
+        groups = group_by_translation(metadata)
+        for slug in changed | removed:
+            old, new = before.get(slug), self.metadata.get(slug)
+            key = lambda a: (a['product'], a['angle'], a['language'])
+            if old is None or new is None or key(old) != key(new):
+                for a in (old, new):
+                    if a:
+                        pages.update(x['slug'] for x in groups.get((a['product'], a['angle']), []))
+        records = [self.metadata[slug] for slug in pages if slug in self.metadata]
+        pipeline = read_article_bodies(store, records, stats)
+        pipeline = derive_article_fields(pipeline, groups, self.related, self.base_url, stats)
+        pipeline = render_article_pages(pipeline, self.asset_map, self.base_url, stats)
+        for a, body, page in pipeline:
+            out.write_text(f"articles/{a['slug']}/index.html", page)
+
+        # Manifest, listings, sitemap and index.html
+        with out.open_stream("data/articles.json") as manifest:
+            manifest.write('[' + ', '.join(self.manifest_entries[a['slug']] for a in metadata) + ']')
+        out.add_file("data/articles.json")
+        old_url = self.asset_map['/data/articles.json']
+        self.asset_map['/data/articles.json'] = copy_hashed_asset("data/articles.json", out)
+        if self.asset_map['/data/articles.json'] != old_url:
+            out.remove(old_url.lstrip('/'))
+        by_language = {}
+        for a in metadata:
+            by_language.setdefault(a['language'], []).append(self.listing_entries[a['slug']])
+        for url in write_listing_manifests(out, by_language, self.asset_map):
+            out.remove(url.lstrip('/'))
+        for lang in self.listing_languages - set(by_language):
+            out.remove(LISTING_MANIFEST.format(lang=lang))
+        self.listing_languages = set(by_language)
+        listings = list(listing_groups(metadata))
+        build_listing_pages(out, listings, self.asset_map, self.base_url)
+        listing_files = {p for entry in out.listings.values() for p in entry['files']}
+        for entry in out.previous_listings.values():
+            for rel_path in entry['files']:
+                if rel_path not in listing_files:
+                    out.remove(rel_path)
+        out.write_text("_headers", generate_headers_file(sorted({l['lang'] for l in listings})))
+        out.write_text("sitemap.xml", generate_sitemap_xml(metadata, self.base_url, listings))
+        write_index_html(out, self.asset_map, listings)
+        if PRECOMPRESS:
+            # Stale variants are dropped rather than compressed again (the server
+            # falls back to identity); the next full build restores them
+            for rel_path in [p for p in out.files if p.endswith(('.gz', '.br'))]:
+                if out.files.get(rel_path[:-3], {}).get('sha256') != out.files[rel_path].get('source'):
+                    out.remove(rel_path)
+        if out.root.parent == BUILDS_DIR:
+            finish_build(out)
+        return out.written, out.removed
+
+def watch_site(live, on_rebuild=None):
+    """Apply source changes to the published build as they happen (blocks)"""
+    # The SQLite store saves to one database file: watch it and compare article revisions
+    store = get_article_store() if STORAGE_BACKEND == 'sqlite' else None
+    watcher = SiteWatcher(ARTICLES_DIR, CONFIG_PATH, IMAGES_DIR, store=store)
+    sources = ARTICLES_DB.name if store is not None else "articles/"
+    print(f"\nWatching {sources}, config.json and images/ ({watcher.backend}) - Ctrl+C to stop")
+    if not WATCHDOG_AVAILABLE:
+        print("  Note: Install watchdog for inotify-based watching: pip install watchdog")
+    for changes in watcher.changes():
+        if changes.config:
+            print("\nconfig.json changed - restarting")
+            os.execv(sys.executable, [sys.executable] + sys.argv)
+        started = time.perf_counter()
+        if changes.images:
+            live = LiveSite(*cmd_build())
+            summary = "images changed: full build"
+        else:
+            try:
+                written, removed = live.apply(changes)
+            except Exception as e:
+                print(f"\n  Rebuild failed: {e}")
+                continue
+            count = len(changes.articles_changed) + len(changes.articles_removed)
+            summary = f"{count} article(s) changed: {written} files written, {removed} removed"
+        print(f"[{datetime.now():%H:%M:%S}] {summary} in {(time.perf_counter() - started) * 1000:.0f} ms")
+        if on_rebuild:
+            on_rebuild()
+
+BENCH_DIR = SCRIPT_DIR / ".bench"
+
+def cmd_bench_build(sizes=None, keep=False, rebuild=True):
+    """Time cold and unchanged builds of synthetic corpora of increasing size"""
+    from build_benchmark import DEFAULT_SIZES, chart_results, print_results, run_benchmark
+    sizes = sizes or DEFAULT_SIZES
+    print(f"\n{'='*50}")
+    print("BUILD SCALING BENCHMARK")
+    print(f"{'='*50}")
+    print(f"  Sizes: {', '.join(f'{n:,}' for n in sizes)} articles")
+    print(f"  Workspaces: {BENCH_DIR}")
+    results = run_benchmark(sizes, CONFIG, ARTICLES_DIR, BLOG_SCRIPT, BENCH_DIR,
+                            keep=keep, rebuild=rebuild)
+    print_results(results)
+    results_path = BENCH_DIR / "results.json"
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(), 'results': results}, f, indent=2)
+    print(f"\n  Results saved to {results_path}")
+    chart_path = BENCH_DIR / "scaling.png"
+    if chart_results(results, chart_path):
+        print(f"  Chart saved to {chart_path}")
+    else:
+        print("  Note: Install matplotlib for a chart: pip install matplotlib")
+
+
+def cmd_bench_startup(runs=10):
+    """Cold-start time of CLI commands and module imports (fresh process per run)"""
+    from startup_benchmark import print_results, run_benchmark
+    print(f"\n{'='*50}")
+    print("STARTUP BENCHMARK")
+    print(f"{'='*50}")
+    print(f"  {runs} runs per case")
+    results = run_benchmark(BLOG_SCRIPT, runs)
+    print_results(results)
+    BENCH_DIR.mkdir(exist_ok=True)
+    results_path = BENCH_DIR / "startup-results.json"
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(), 'results': results}, f, indent=2)
+    print(f"\n  Results saved to {results_path}")
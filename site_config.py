@@ -0,0 +1,58 @@
+"""
+Site Config Module for Pure Tallow Blog
+
+Paths and settings shared by the blog.py commands (generation.py,
+rotation.py, site_build.py, site_serve.py).
+
+config.json is parsed on first access to CONFIG (module __getattr__), so
+commands that never read it do not pay for it. `from site_config import
+CONFIG` in a module that needs it loads it at that point.
+"""
+
+import json
+import os
+from pathlib import Path
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+# Articles, build output and caches (BLOG_DATA_DIR points them elsewhere, e.g. for bench-build)
+DATA_DIR = Path(os.environ.get('BLOG_DATA_DIR') or SCRIPT_DIR)
+CONFIG_PATH = SCRIPT_DIR / "config.json"
+# The CLI entry point (run in child processes by the benchmarks)
+BLOG_SCRIPT = SCRIPT_DIR / "blog.py"
+ARTICLES_DIR = DATA_DIR / "articles"
+IMAGES_DIR = SCRIPT_DIR / "images"
+OUTPUT_DIR = DATA_DIR / "public"
+ROTATION_FILE = DATA_DIR / "rotation_state.json"
+ROTATION_LOCK = DATA_DIR / "rotation_state.json.lock"
+CACHE_DIR = DATA_DIR / ".cache"
+
+def load_config():
+    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# Settings computed from config.json on first access
+_LAZY = {
+    'CONFIG': load_config,
+    # Article storage (see article_store.py)
+    'STORAGE_BACKEND': lambda: __getattr__('CONFIG').get('storage', {}).get('backend', 'json'),
+    'ARTICLES_DB': lambda: DATA_DIR / __getattr__('CONFIG').get('storage', {}).get('db_path', 'articles.db'),
+}
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Also called directly below, after which the module global already exists
+    if name not in globals():
+        globals()[name] = _LAZY[name]()
+    return globals()[name]
+
+_article_store = None
+
+def get_article_store():
+    global _article_store
+    if _article_store is None:
+        from article_store import open_article_store
+        _article_store = open_article_store(__getattr__('STORAGE_BACKEND'), ARTICLES_DIR, __getattr__('ARTICLES_DB'),
+                                            snapshot_path=CACHE_DIR / "corpus.pickle")
+    return _article_store
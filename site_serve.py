@@ -0,0 +1,317 @@
+"""
+Site Serve Module for Pure Tallow Blog
+
+`blog.py serve`: the published build through static_server.py, with live
+reload (--watch) or article pages rendered on request from the article
+store (--dynamic), and the `bench-serve` load test.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from article_store import article_metadata
+from search_index import TermVectorCache
+from site_build import (BENCH_DIR, HASHED_ASSETS_DIR, BuildStats, LiveSite, cmd_build, collect_article_metadata,
+                        current_build, derive_article_fields, group_by_translation, hashed_asset_name,
+                        language_vectors, load_build_manifest, metadata_order, read_article_bodies,
+                        render_article_pages, watch_site)
+from site_config import BLOG_SCRIPT, CACHE_DIR, CONFIG, IMAGES_DIR, OUTPUT_DIR, SCRIPT_DIR, get_article_store
+from static_server import DEFAULT_CHECK_INTERVAL, STATS_PATH, Representation, StaticFileHandler, StaticServer
+
+
+# =============================================================================
+# DYNAMIC SERVING (serve --dynamic)
+# =============================================================================
+# Article pages are rendered from the article store on request, through the
+# same read -> derive -> render stages as cmd_build, and kept in an LRU that
+# is checked against each article's store revision. Everything else is
+# served from the published build.
+
+DYNAMIC_CACHE_PAGES = CONFIG.get('serve', {}).get('dynamic_cache_pages', 500)
+_ARTICLE_URL_RE = re.compile(r'^articles/([^/]+)/index\.html$')
+
+def published_asset_map(files):
+    """asset_map of a finished build, recovered from its manifest (fingerprinted copies under static/)"""
+    asset_map = {}
+    for rel_path, entry in files.items():
+        if rel_path.startswith(HASHED_ASSETS_DIR + '/'):
+            continue
+        hashed = f"{HASHED_ASSETS_DIR}/{hashed_asset_name(rel_path.rsplit('/', 1)[-1], entry['sha256'][:12])}"
+        if hashed in files:
+            asset_map['/' + rel_path] = '/' + hashed
+    return asset_map
+
+class DynamicSite:
+    """
+    Renders article pages on request (incremental static regeneration).
+
+    Pages are cached per slug with the store revision they were rendered
+    from. Related links are computed per language on first use and again
+    after one of its articles changes. With persist=True each rendered page
+    is also written into the published build.
+    """
+
+    def __init__(self, max_pages=DYNAMIC_CACHE_PAGES, persist=False):
+        self.store = get_article_store()
+        self.max_pages = max_pages
+        self.persist = persist
+        self.base_url = CONFIG.get('site', {}).get('base_url', '').rstrip('/') or 'https://puretallow.com'
+        build = current_build()
+        self.asset_map = published_asset_map(load_build_manifest(build).get('files', {}) if build else {})
+        self.metadata = {a['slug']: a for a in collect_article_metadata()}
+        self.groups = group_by_translation(sorted(self.metadata.values(), key=metadata_order))
+        # slug -> (revision, page bytes), least recently used first
+        self.pages = OrderedDict()
+        # language -> slug -> related records
+        self.related = {}
+        self.rendered = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def page(self, slug):
+        """Rendered page of an article (None if the store has no such article)"""
+        revision = self.store.revision(slug)
+        if revision is None:
+            return None
+        with self._lock:
+            cached = self.pages.get(slug)
+            if cached is not None and cached[0] == revision:
+                self.pages.move_to_end(slug)
+                self.hits += 1
+                return cached[1]
+        article = self.store.get(slug)
+        if article is None:
+            return None
+        a = article_metadata(article, self.store)
+        with self._lock:
+            if cached is not None:
+                # Edited since it was rendered: its term vector may have changed
+                self.related.pop(a['language'], None)
+            self._update_metadata(a)
+        stats = BuildStats()
+        related = self.related_for(a['language'], stats)
+        pipeline = read_article_bodies(self.store, [a], stats)
+        pipeline = derive_article_fields(pipeline, self.groups, related, self.base_url, stats)
+        pipeline = render_article_pages(pipeline, self.asset_map, self.base_url, stats)
+        page = next(pipeline)[2].encode('utf-8')
+        with self._lock:
+            self.pages[slug] = (revision, page)
+            self.pages.move_to_end(slug)
+            while len(self.pages) > self.max_pages:
+                self.pages.popitem(last=False)
+            self.rendered += 1
+        if self.persist:
+            self.write_page(slug, page)
+        return page
+
+    def _update_metadata(self, a):
+        """Record a new or edited article: regroup translations, drop stale related links and pages"""
+        old = self.metadata.get(a['slug'])
+        if old == a:
+            return
+        self.metadata[a['slug']] = a
+        self.related.pop(a['language'], None)
+        if old is None or (old['product'], old['angle']) != (a['product'], a['angle']):
+            self.groups = group_by_translation(sorted(self.metadata.values(), key=metadata_order))
+            # Its translations need the new hreflang tag
+            for x in self.groups.get((a['product'], a['angle']), []):
+                self.pages.pop(x['slug'], None)
+
+    def related_for(self, lang, stats):
+        from related_articles import RELATED_AVAILABLE, related_from_vectors
+        if not RELATED_AVAILABLE:
+            return {}
+        with self._lock:
+            related = self.related.get(lang)
+            if related is not None:
+                return related
+            records = sorted((a for a in self.metadata.values() if a['language'] == lang), key=metadata_order)
+        cache = TermVectorCache(CACHE_DIR / "terms" / f"{lang}.pickle")
+        vectors = language_vectors(self.store, records, cache, stats.clock())
+        cache.save()
+        related = related_from_vectors(records, vectors, k=5)
+        with self._lock:
+            self.related[lang] = related
+        return related
+
+    def write_page(self, slug, page):
+        """Write a rendered page into the published build (replacing, never modifying, hard-linked files)"""
+        root = current_build() or OUTPUT_DIR
+        dst = root / "articles" / slug / "index.html"
+        try:
+            if dst.stat().st_size == len(page) and dst.read_bytes() == page:
+                return
+        except FileNotFoundError:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f"{dst.name}.{threading.get_ident()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(page)
+        os.replace(tmp, dst)
+
+    def stats(self):
+        with self._lock:
+            return {'pages': len(self.pages), 'max_pages': self.max_pages,
+                    'rendered': self.rendered, 'hits': self.hits}
+
+class DynamicHandler(StaticFileHandler):
+    """Static handler that renders /articles/<slug>/ through server.dynamic"""
+
+    def load(self, site, url_path, rel, accepted):
+        match = _ARTICLE_URL_RE.match(rel)
+        if match:
+            page = self.server.dynamic.page(match.group(1))
+            if page is not None:
+                etag = f'"{hashlib.sha256(page).hexdigest()[:32]}"'
+                headers = [('ETag', etag)] + self.rule_headers(site, url_path)
+                rep = Representation(None, len(page), time.time_ns(), etag,
+                                     [('Content-Type', 'text/html; charset=utf-8')], headers)
+                rep.body = page
+                return rep
+        elif not (site.root / rel).is_file() and (rel.startswith('assets/images/') or rel == 'favicon.png'):
+            # No build yet: product images and favicon straight from the sources
+            source = IMAGES_DIR / rel.rsplit('/', 1)[-1] if rel != 'favicon.png' else SCRIPT_DIR / rel
+            if source.is_file():
+                return super().load(site._replace(root=source.parent, files={}), url_path, source.name, accepted)
+        return super().load(site, url_path, rel, accepted)
+
+def cmd_bench_serve(modes=None, levels=None, duration=None, procs=1):
+    """Load-test `blog.py serve` on the built site, per server mode and concurrency level"""
+    import serve_benchmark
+    duration = duration or serve_benchmark.DEFAULT_DURATION
+    modes = modes or serve_benchmark.DEFAULT_MODES
+    levels = levels or serve_benchmark.DEFAULT_CONCURRENCY
+    unknown = [m for m in modes if m not in serve_benchmark.SERVER_MODES]
+    if unknown:
+        print(f"Unknown mode(s): {', '.join(unknown)} (available: {', '.join(serve_benchmark.SERVER_MODES)})")
+        return
+    if not OUTPUT_DIR.exists():
+        print("No public/ folder found. Run 'python blog.py build' first.")
+        return
+    print(f"\n{'='*50}")
+    print("SERVE LOAD TEST")
+    print(f"{'='*50}")
+    print(f"  Modes: {', '.join(modes)} - concurrency {', '.join(map(str, levels))}, "
+          f"{duration:g}s per level, {procs} client process(es)")
+    results = serve_benchmark.run_benchmark(BLOG_SCRIPT, OUTPUT_DIR, BENCH_DIR, modes,
+                                            levels, duration, procs=procs)
+    serve_benchmark.print_results(results)
+    results_path = BENCH_DIR / "serve-results.json"
+    with open(results_path, 'w', encoding='utf-8') as f:
+        json.dump({'created_at': datetime.now().isoformat(), 'duration': duration, 'results': results}, f, indent=2)
+    print(f"\n  Results saved to {results_path}")
+    chart_path = BENCH_DIR / "serve.png"
+    if serve_benchmark.chart_results(results, chart_path):
+        print(f"  Chart saved to {chart_path}")
+    else:
+        print("  Note: Install matplotlib for a chart: pip install matplotlib")
+
+LIVE_RELOAD_PATH = "/__livereload"
+LIVE_RELOAD_SCRIPT = f'<script>new EventSource("{LIVE_RELOAD_PATH}").onmessage=function(){{location.reload()}}</script>'
+
+class LiveReload:
+    """Rebuild counter that live-reload connections wait on"""
+
+    def __init__(self):
+        self.generation = 0
+        self._cond = threading.Condition()
+
+    def notify(self):
+        with self._cond:
+            self.generation += 1
+            self._cond.notify_all()
+
+    def wait(self, generation, timeout):
+        """Wait until the generation moves past `generation` (or timeout), return the current one"""
+        with self._cond:
+            self._cond.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation
+
+class LiveReloadHandler(StaticFileHandler):
+    """Static handler that injects a reload script into HTML and streams reload events"""
+
+    def do_GET(self):
+        if self.path == LIVE_RELOAD_PATH:
+            return self.send_reload_events()
+        super().do_GET()
+
+    def rewrite_body(self, path):
+        html = path.read_text(encoding='utf-8')
+        head, sep, tail = html.rpartition('</body>')
+        return (head + LIVE_RELOAD_SCRIPT + sep + tail if sep else html + LIVE_RELOAD_SCRIPT).encode('utf-8')
+
+    def send_reload_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        live_reload = self.server.live_reload
+        generation = live_reload.generation
+        try:
+            while True:
+                current = live_reload.wait(generation, 15)
+                # Comment lines keep idle connections open through proxies
+                self.wfile.write(b"data: reload\n\n" if current != generation else b": ping\n\n")
+                self.wfile.flush()
+                generation = current
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+SERVE_CACHE_MB = CONFIG.get('serve', {}).get('cache_mb', 64)
+
+def cmd_serve(port=8000, watch=False, cache=True, dynamic=False, persist=False):
+    """
+    Serve the published build (see static_server.py): threaded, keep-alive,
+    sendfile bodies, manifest ETags, ranges, precompressed variants and the
+    _headers cache rules. Hot files are kept in an in-memory LRU of
+    serve.cache_mb (cache=False: always read from disk).
+    watch=True: rebuild on changes and live-reload browsers.
+    dynamic=True: render article pages from the article store on request
+    (see DynamicSite; persist=True also writes them into the published build).
+    """
+    live_reload = None
+    if watch:
+        live = LiveSite(*cmd_build())
+        live_reload = LiveReload()
+        threading.Thread(target=watch_site, args=(live, live_reload.notify), daemon=True).start()
+    elif not OUTPUT_DIR.exists() and not dynamic:
+        print("No public/ folder found. Run 'python blog.py build' first.")
+        return
+    cache_bytes = int(SERVE_CACHE_MB * 1024 * 1024) if cache else 0
+    # public/ is re-resolved periodically (on every request in watch mode) to pick up a build swap
+    handler = LiveReloadHandler if watch else DynamicHandler if dynamic else StaticFileHandler
+    with StaticServer(("", port), handler, OUTPUT_DIR,
+                      cache_bytes=cache_bytes, check_interval=0 if watch else DEFAULT_CHECK_INTERVAL) as httpd:
+        httpd.live_reload = live_reload
+        if dynamic and not watch:
+            httpd.dynamic = DynamicSite(persist=persist)
+            httpd.stats_sources['dynamic'] = httpd.dynamic.stats
+        print(f"Server running at http://localhost:{port}")
+        print(f"Serving from: {OUTPUT_DIR}" + (" (live reload on)" if watch else ""))
+        if dynamic and not watch:
+            print(f"Dynamic articles: {len(httpd.dynamic.metadata)} in the store, "
+                  f"up to {httpd.dynamic.max_pages} rendered pages cached"
+                  + (", persisted to the published build" if persist else ""))
+        if httpd.cache is not None:
+            print(f"File cache: {SERVE_CACHE_MB} MB - stats at http://localhost:{port}{STATS_PATH}")
+        print("Press Ctrl+C to stop")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nServer stopped")
+            if httpd.cache is not None:
+                c = httpd.cache.stats()
+                print(f"  Cache: {c['hits']} hits, {c['misses']} misses ({c['hit_ratio']:.0%}), "
+                      f"{c['entries']} files / {c['bytes'] / (1024 * 1024):.1f} MB held, "
+                      f"{c['evictions']} evicted, {c['invalidations']} invalidated")
+            if dynamic and not watch:
+                d = httpd.dynamic.stats()
+                print(f"  Dynamic: {d['rendered']} pages rendered, {d['hits']} served from memory")
+
@@ -0,0 +1,197 @@
+"""
+Site Watcher Module for Pure Tallow Blog
+
+Watches articles/, config.json and images/ and reports debounced change sets
+for `blog.py build --watch` and `blog.py serve --watch`. With the SQLite
+article store, the database and its WAL file are watched instead of
+articles/, and the changed articles are found by comparing the store's
+revisions.
+
+Uses watchdog (inotify on Linux, FSEvents on macOS) when it is installed,
+otherwise polls modification times.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterator, NamedTuple, Optional, Set, Tuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.1
+
+
+class ChangeSet(NamedTuple):
+    """What changed since the last change set"""
+    articles_changed: Set[str]
+    articles_removed: Set[str]
+    config: bool
+    images: bool
+
+
+def _scan(directory: Path, suffix: str) -> Dict[str, Tuple[int, int]]:
+    """file name -> (mtime_ns, size) for the files of a directory ending in suffix"""
+    files = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.is_file():
+                    st = entry.stat()
+                    files[entry.name] = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        pass
+    return files
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class SiteWatcher:
+    """
+    Debounced change sets for the site sources.
+
+    Usage:
+        watcher = SiteWatcher(articles_dir, config_path, images_dir)
+        watcher = SiteWatcher(articles_dir, config_path, images_dir, store=sqlite_store)
+        for changes in watcher.changes():
+            ...
+    """
+
+    def __init__(self, articles_dir: Path, config_path: Path, images_dir: Path,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, debounce: float = DEFAULT_DEBOUNCE,
+                 use_watchdog: bool = True, store=None):
+        self.articles_dir = Path(articles_dir).resolve()
+        self.config_path = Path(config_path).resolve()
+        self.images_dir = Path(images_dir).resolve()
+        # SqliteArticleStore: its database file and WAL are watched, revisions() says what changed
+        self.store = store
+        self.db_paths: Tuple[Path, ...] = ()
+        self._revisions: Dict[str, str] = {}
+        if store is not None:
+            db_path = Path(store.db_path).resolve()
+            self.db_paths = (db_path, db_path.with_name(db_path.name + '-wal'))
+            self._revisions = store.revisions()
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._stopped = threading.Event()
+
+    @property
+    def backend(self) -> str:
+        return "watchdog" if self.use_watchdog else f"polling every {self.poll_interval}s"
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._event.set()
+
+    def _store_changes(self) -> Tuple[Set[str], Set[str]]:
+        """(changed, removed) slugs of the store since the last call"""
+        revisions = self.store.revisions()
+        changed = {slug for slug, revision in revisions.items() if self._revisions.get(slug) != revision}
+        removed = set(self._revisions) - set(revisions)
+        self._revisions = revisions
+        return changed, removed
+
+    def _classify(self, paths: Set[str]) -> Optional[ChangeSet]:
+        changes = ChangeSet(set(), set(), False, False)
+        config = images = database = False
+        for raw in paths:
+            path = Path(raw)
+            if path in self.db_paths:
+                database = True
+            elif path == self.config_path:
+                config = True
+            elif path.parent == self.images_dir and path.suffix == '.png':
+                images = True
+            elif path.parent == self.articles_dir and path.suffix == '.json':
+                (changes.articles_changed if path.exists() else changes.articles_removed).add(path.stem)
+        if database:
+            changed, removed = self._store_changes()
+            changes.articles_changed.update(changed)
+            changes.articles_removed.update(removed)
+        if not (changes.articles_changed or changes.articles_removed or config or images):
+            return None
+        return changes._replace(config=config, images=images)
+
+    def changes(self) -> Iterator[ChangeSet]:
+        """Block until something changes, yield it, repeat (until stop())"""
+        if self.use_watchdog:
+            yield from self._watchdog_changes()
+        else:
+            yield from self._polling_changes()
+
+    def _watchdog_changes(self) -> Iterator[ChangeSet]:
+        watcher = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                with watcher._lock:
+                    watcher._pending.add(os.fsdecode(event.src_path))
+                    dest = getattr(event, 'dest_path', None)
+                    if dest:
+                        watcher._pending.add(os.fsdecode(dest))
+                watcher._event.set()
+
+        observer = Observer()
+        handler = Handler()
+        directories = [self.images_dir, self.config_path.parent]
+        directories += [self.db_paths[0].parent] if self.store is not None else [self.articles_dir]
+        for directory in dict.fromkeys(directories):
+            if directory.exists():
+                # config.json's directory is watched non-recursively; _classify ignores other files
+                observer.schedule(handler, str(directory), recursive=False)
+        observer.start()
+        try:
+            while not self._stopped.is_set():
+                self._event.wait()
+                if self._stopped.is_set():
+                    break
+                # Let a burst of events (editor temp files, git checkout) settle
+                time.sleep(self.debounce)
+                with self._lock:
+                    paths, self._pending = self._pending, set()
+                    self._event.clear()
+                changes = self._classify({str(Path(p).resolve()) for p in paths})
+                if changes:
+                    yield changes
+        finally:
+            observer.stop()
+            observer.join()
+
+    def _polling_changes(self) -> Iterator[ChangeSet]:
+        watch_dir = self.store is None
+        articles = _scan(self.articles_dir, '.json') if watch_dir else {}
+        database = [_stat(path) for path in self.db_paths]
+        images = _scan(self.images_dir, '.png')
+        config = _stat(self.config_path)
+        while not self._stopped.wait(self.poll_interval):
+            new_articles = _scan(self.articles_dir, '.json') if watch_dir else {}
+            new_database = [_stat(path) for path in self.db_paths]
+            new_images = _scan(self.images_dir, '.png')
+            new_config = _stat(self.config_path)
+            changed = {name[:-len('.json')] for name, sig in new_articles.items() if articles.get(name) != sig}
+            removed = {name[:-len('.json')] for name in set(articles) - set(new_articles)}
+            if new_database != database:
+                store_changed, store_removed = self._store_changes()
+                changed |= store_changed
+                removed |= store_removed
+            if changed or removed or new_images != images or new_config != config:
+                yield ChangeSet(changed, removed, new_config != config, new_images != images)
+            articles, database, images, config = new_articles, new_database, new_images, new_config
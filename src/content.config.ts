@@ -18,7 +18,17 @@ const articles = defineCollection({
     season: z.string(),
     variation_seed: z.string().optional(),
     useless_detail: z.string().optional(),
-    random_tangent: z.string().optional()
+    random_tangent: z.string().optional(),
+    // Derived fields stored by blog.py (see compute_derived_fields)
+    description: z.string().optional(),
+    faqs: z.array(z.object({ question: z.string(), answer: z.string() })).optional(),
+    faq_schema: z.string().optional(),
+    iso_date: z.string().optional(),
+    product_scent: z.string().optional(),
+    word_count: z.number().optional(),
+    reading_time: z.number().optional(),
+    content_hash: z.string().optional(),
+    derived_version: z.number().optional()
   })
 });
 
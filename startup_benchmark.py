@@ -0,0 +1,61 @@
+"""
+Startup Benchmark Module for Pure Tallow Blog
+
+Times cold starts: each case runs in a fresh interpreter (as cron and
+`serve --dynamic` do), several times, and reports the median and fastest
+wall time. Cases are read-only CLI commands and bare imports of the
+command modules, plus the interpreter alone as a floor.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+DEFAULT_RUNS = 10
+
+
+def default_cases(blog_script: Path) -> List[Tuple[str, List[str]]]:
+    """(name, arguments after the interpreter); all read-only"""
+    script = str(blog_script)
+    return [
+        ("python (floor)", ["-c", "pass"]),
+        ("blog.py help", [script, "help"]),
+        ("blog.py builds", [script, "builds"]),
+        ("import rotation", ["-c", "import rotation"]),
+        ("import site_build", ["-c", "import site_build"]),
+        ("import site_serve", ["-c", "import site_serve"]),
+        ("import generation", ["-c", "import generation"]),
+    ]
+
+
+def time_case(args: Sequence[str], cwd: Path, runs: int) -> dict:
+    """Wall time of `python <args>` over runs fresh processes"""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, *args], cwd=cwd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE)
+        times.append(time.perf_counter() - started)
+        if proc.returncode != 0:
+            return {"error": proc.stderr.decode('utf-8', 'replace').strip().splitlines()[-1:]}
+    return {"median_ms": statistics.median(times) * 1000, "min_ms": min(times) * 1000, "runs": runs}
+
+
+def run_benchmark(blog_script: Path, runs: int = DEFAULT_RUNS) -> List[dict]:
+    cwd = Path(blog_script).parent
+    # One untimed pass so every case starts from compiled .pyc files
+    for _, args in default_cases(blog_script):
+        subprocess.run([sys.executable, *args], cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return [{"case": name, **time_case(args, cwd, runs)} for name, args in default_cases(blog_script)]
+
+
+def print_results(results: List[dict]) -> None:
+    print(f"\n  {'case':<20}  {'median ms':>10}  {'min ms':>8}")
+    for r in results:
+        if "error" in r:
+            print(f"  {r['case']:<20}  failed: {' '.join(r['error'])}")
+            continue
+        print(f"  {r['case']:<20}  {r['median_ms']:>10.0f}  {r['min_ms']:>8.0f}")
@@ -0,0 +1,527 @@
+"""
+Static Server Module for Pure Tallow Blog
+
+Serves a published build (public/ -> .builds/<id>/) for previews and as a
+fallback origin:
+
+- one thread per connection, HTTP/1.1 keep-alive with an idle timeout
+- zero-copy bodies with socket.sendfile (os.sendfile on Linux and macOS)
+- strong ETags from the build manifest; If-None-Match / If-Modified-Since -> 304
+- single byte ranges (Range, If-Range -> 206 / 416)
+- precompressed .br / .gz variants chosen by Accept-Encoding
+- Cache-Control and other headers taken from the build's _headers file,
+  so the preview answers like Cloudflare Pages does
+- an optional in-memory LRU of hot files (FileCache), counters at /__stats
+"""
+
+import email.utils
+import http.server
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+MANIFEST_SUFFIX = '.manifest.json'
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xml',
+                      'image/svg+xml')
+# (Content-Encoding, file suffix), in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# How often public/ and the manifest are checked for a new build (seconds)
+DEFAULT_CHECK_INTERVAL = 0.5
+STATS_PATH = '/__stats'
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_headers_file(text: str) -> List[Tuple[re.Pattern, List[Tuple[str, str]]]]:
+    """Rules of a Cloudflare Pages _headers file as (path regex, [(name, value)])"""
+    rules = []
+    for line in text.splitlines():
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+        if not line[0].isspace():
+            pattern = re.compile('^' + re.escape(line.strip()).replace(r'\*', '.*') + '$')
+            rules.append((pattern, []))
+        elif rules and ':' in line:
+            name, value = line.strip().split(':', 1)
+            rules[-1][1].append((name.strip(), value.strip()))
+    return rules
+
+
+def content_type(path: str) -> str:
+    ctype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    if ctype.startswith('text/') or ctype in ('application/json', 'application/javascript'):
+        ctype += '; charset=utf-8'
+    return ctype
+
+
+def is_compressible(ctype: str) -> bool:
+    return ctype.startswith(COMPRESSIBLE_TYPES)
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """Accept-Encoding -> {coding: q}"""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding.strip().lower()] = q
+    return accepted
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for this header)"""
+    if header.strip() == '*':
+        return True
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for tag in header.split(','):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith('W/') else tag) == opaque:
+            return True
+    return False
+
+
+class SiteSnapshot(NamedTuple):
+    root: Path
+    files: dict
+    rules: list
+    # Bumped whenever the build or its manifest changes (None: no manifest, check mtimes)
+    generation: Optional[int]
+    # Files modified after the manifest was written are not described by it
+    manifest_mtime: int
+
+
+class PublishedSite:
+    """
+    The build a served directory currently points at.
+
+    public/ is a symlink that is swapped atomically on publish, so it is
+    resolved again at most every check_interval seconds; the manifest and
+    _headers of a build are loaded once and reloaded when the manifest
+    changes (watch mode).
+    """
+
+    def __init__(self, root: Path, check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.root = Path(root)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._key = None
+        self._snapshot = None
+        self._checked_at = 0.0
+        self._generation = 0
+
+    def snapshot(self) -> SiteSnapshot:
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+        resolved = self.root.resolve()
+        manifest_path = resolved.with_name(resolved.name + MANIFEST_SUFFIX)
+        try:
+            manifest_mtime = manifest_path.stat().st_mtime_ns
+        except OSError:
+            manifest_mtime = None
+        try:
+            headers_mtime = (resolved / '_headers').stat().st_mtime_ns
+        except OSError:
+            headers_mtime = None
+        key = (resolved, manifest_mtime, headers_mtime)
+        with self._lock:
+            if key != self._key:
+                files = {}
+                if manifest_mtime is not None:
+                    try:
+                        files = json.loads(manifest_path.read_text(encoding='utf-8')).get('files', {})
+                    except (OSError, ValueError):
+                        files = {}
+                try:
+                    rules = parse_headers_file((resolved / '_headers').read_text(encoding='utf-8'))
+                except OSError:
+                    rules = []
+                self._generation += 1
+                self._key = key
+                self._snapshot = SiteSnapshot(resolved, files, rules, self._generation if files else None,
+                                              manifest_mtime or 0)
+            self._checked_at = now
+            return self._snapshot
+
+
+class Representation:
+    """One servable file (or precompressed variant) with its response headers"""
+
+    __slots__ = ('path', 'size', 'mtime_ns', 'etag', 'content_headers', 'headers',
+                 'file', 'body', 'generation')
+
+    def __init__(self, path, size, mtime_ns, etag, content_headers, headers, file=None):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.etag = etag
+        # Content-Type / Content-Encoding (not sent with a 304)
+        self.content_headers = content_headers
+        # ETag, Last-Modified, Vary and the _headers rules
+        self.headers = headers
+        # Open file (fresh from disk) or body bytes (from a FileCache)
+        self.file = file
+        self.body = None
+        self.generation = None
+
+
+class FileCache:
+    """
+    In-memory LRU of file bodies and their response headers, capped by total bytes.
+
+    Entries are keyed by (build root, path, accepted encodings). An entry
+    is trusted while the site generation is unchanged; after that (or when
+    the build has no manifest) its mtime and size are checked once per
+    generation.
+    """
+
+    def __init__(self, max_bytes: int, max_file_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes or max_bytes // 4
+        self.entries: 'OrderedDict[tuple, Representation]' = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, generation: Optional[int]) -> Optional[Representation]:
+        with self._lock:
+            rep = self.entries.get(key)
+        if rep is not None and (generation is None or rep.generation != generation):
+            try:
+                st = os.stat(rep.path)
+                fresh = (st.st_mtime_ns, st.st_size) == (rep.mtime_ns, rep.size)
+            except OSError:
+                fresh = False
+            with self._lock:
+                if fresh:
+                    rep.generation = generation
+                else:
+                    self._remove(key)
+                    self.invalidations += 1
+                    rep = None
+        with self._lock:
+            if rep is None:
+                self.misses += 1
+                return None
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            self.hits += 1
+        return rep
+
+    def put(self, key: tuple, rep: Representation, generation: Optional[int]) -> Representation:
+        """Read rep's body into the cache (files over max_file_bytes stay on disk)"""
+        if rep.size > self.max_file_bytes or rep.file is None:
+            return rep
+        body = rep.file.read()
+        rep.file.close()
+        rep.file = None
+        rep.body = body
+        if len(body) != rep.size:
+            # Replaced while reading: serve what was read, don't keep it
+            rep.size = len(body)
+            return rep
+        rep.generation = generation
+        with self._lock:
+            self._remove(key)
+            self.entries[key] = rep
+            self.bytes += rep.size
+            while self.bytes > self.max_bytes and self.entries:
+                _, old = self.entries.popitem(last=False)
+                self.bytes -= old.size
+                self.evictions += 1
+        return rep
+
+    def _remove(self, key: tuple) -> None:
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old.size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+class StaticFileHandler(http.server.BaseHTTPRequestHandler):
+    """GET/HEAD for files of a PublishedSite (server.site, optional server.cache)"""
+
+    server_version = "TallowStatic/1.0"
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are closed after this many seconds
+    timeout = 30
+    # Headers and body go out in separate writes; don't let Nagle hold the body back
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path == STATS_PATH:
+            return self.send_stats()
+        self.serve(head=False)
+
+    def do_HEAD(self):
+        self.serve(head=True)
+
+    def resolve(self, site: SiteSnapshot, url_path: str) -> Optional[str]:
+        """URL path -> path relative to the build root (None if outside it)"""
+        path = posixpath.normpath(unquote(url_path))
+        if path.startswith('..') or '\0' in path:
+            return None
+        rel = path.lstrip('/')
+        if rel in ('', '.'):
+            return 'index.html'
+        if url_path.endswith('/'):
+            return rel + '/index.html'
+        return rel
+
+    def rewrite_body(self, path: Path) -> Optional[bytes]:
+        """Hook for subclasses: return bytes to serve instead of the file (None = serve file)"""
+        return None
+
+    def rule_headers(self, site: SiteSnapshot, url_path: str) -> List[Tuple[str, str]]:
+        headers, seen = [], set()
+        for pattern, rule in site.rules:
+            if pattern.match(url_path):
+                for name, value in rule:
+                    if name.lower() not in seen:
+                        seen.add(name.lower())
+                        headers.append((name, value))
+        return headers
+
+    def serve(self, head: bool):
+        site = self.server.site.snapshot()
+        url_path = urlsplit(self.path).path or '/'
+        rel = self.resolve(site, url_path)
+        if rel is None:
+            self.send_error(400)
+            return
+        # Precompressed variants are only offered for whole-file requests
+        accepted = ()
+        if 'Range' not in self.headers:
+            q = accepted_encodings(self.headers.get('Accept-Encoding', ''))
+            accepted = tuple(coding for coding, _ in ENCODINGS if q.get(coding, 0) > 0)
+        cache = self.server.cache
+        key = (site.root, url_path, accepted)
+        rep = cache.get(key, site.generation) if cache is not None else None
+        if rep is None:
+            rep = self.load(site, url_path, rel, accepted)
+            if rep is None:
+                return
+            if cache is not None:
+                rep = cache.put(key, rep, site.generation)
+        try:
+            self.send_representation(rep, head)
+        finally:
+            if rep.file is not None:
+                rep.file.close()
+
+    def load(self, site: SiteSnapshot, url_path: str, rel: str,
+             accepted: Tuple[str, ...]) -> Optional[Representation]:
+        """Open the file for a request (None if a response was already sent)"""
+        path = site.root / rel
+        if not path.is_file():
+            if path.is_dir():
+                self.send_response(301)
+                self.send_header('Location', url_path + '/')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return None
+            self.send_error(404)
+            return None
+
+        ctype = content_type(rel)
+        if rel.endswith('.html'):
+            body = self.rewrite_body(path)
+            if body is not None:
+                self.send_bytes(body, ctype, self.command == 'HEAD')
+                return None
+
+        encoding = None
+        compressible = is_compressible(ctype)
+        if compressible:
+            for coding, suffix in ENCODINGS:
+                if coding in accepted and self.variant_is_fresh(site, rel, suffix):
+                    encoding, rel, path = coding, rel + suffix, site.root / (rel + suffix)
+                    break
+
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(404)
+            return None
+        st = os.fstat(f.fileno())
+        entry = site.files.get(rel) if st.st_mtime_ns <= site.manifest_mtime else None
+        etag = f'"{entry["sha256"][:32]}"' if entry else f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        content_headers = [('Content-Type', ctype)]
+        if encoding:
+            content_headers.append(('Content-Encoding', encoding))
+        headers = [('ETag', etag), ('Last-Modified', email.utils.formatdate(st.st_mtime, usegmt=True))]
+        if compressible:
+            headers.append(('Vary', 'Accept-Encoding'))
+        headers += self.rule_headers(site, url_path)
+        return Representation(path, st.st_size, st.st_mtime_ns, etag, content_headers, headers, f)
+
+    def send_representation(self, rep: Representation, head: bool):
+        if self.not_modified(rep.etag, rep.mtime_ns / 1e9):
+            self.send_response(304)
+            for name, value in rep.headers:
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        start, end = 0, rep.size - 1
+        status = 200
+        byte_range = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+        encoded = any(name == 'Content-Encoding' for name, _ in rep.content_headers)
+        if byte_range and not encoded and (if_range is None or if_range.strip() == rep.etag):
+            parsed = self.parse_range(byte_range, rep.size)
+            if parsed == 'unsatisfiable':
+                self.send_response(416)
+                self.send_header('Content-Range', f'bytes */{rep.size}')
+                self.send_header('Content-Length', '0')
+                for name, value in rep.headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+            if parsed:
+                start, end = parsed
+                status = 206
+
+        length = end - start + 1 if rep.size else 0
+        self.send_response(status)
+        for name, value in rep.content_headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{rep.size}')
+        for name, value in rep.headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if head or not length:
+            return
+        try:
+            if rep.body is not None:
+                self.wfile.write(memoryview(rep.body)[start:end + 1])
+            else:
+                # socket.sendfile() uses os.sendfile() where available (no copy through Python)
+                self.connection.sendfile(rep.file, start, length)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    @staticmethod
+    def variant_is_fresh(site: SiteSnapshot, rel: str, suffix: str) -> bool:
+        """Whether rel + suffix exists and was compressed from the current rel"""
+        try:
+            source_mtime = (site.root / rel).stat().st_mtime_ns
+            variant_mtime = (site.root / (rel + suffix)).stat().st_mtime_ns
+        except OSError:
+            return False
+        entry = site.files.get(rel + suffix)
+        source = site.files.get(rel)
+        if entry and source and 'source' in entry and max(source_mtime, variant_mtime) <= site.manifest_mtime:
+            return entry['source'] == source['sha256']
+        # Not covered by the manifest (hand-made public/, pages written since): trust a variant newer than its source
+        return variant_mtime >= source_mtime
+
+    def not_modified(self, etag: str, mtime: float) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag_matches(if_none_match, etag)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return int(mtime) <= since
+        return False
+
+    @staticmethod
+    def parse_range(header: str, size: int):
+        """bytes=a-b / a- / -n -> (start, end); None to ignore the header; 'unsatisfiable'"""
+        match = _RANGE_RE.match(header.strip())
+        if not match:
+            return None  # multiple or malformed ranges: send the whole file
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            suffix = int(last)
+            if suffix == 0:
+                return 'unsatisfiable'
+            return max(0, size - suffix), size - 1
+        start = int(first)
+        if start >= size:
+            return 'unsatisfiable'
+        end = min(int(last), size - 1) if last else size - 1
+        if end < start:
+            return None
+        return start, end
+
+    def send_bytes(self, body: bytes, ctype: str, head: bool, cache_control: str = 'no-store'):
+        self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def send_stats(self):
+        """Server counters as JSON (loopback clients only)"""
+        if self.client_address[0] not in ('127.0.0.1', '::1'):
+            self.send_error(404)
+            return
+        body = json.dumps(self.server.stats(), indent=2).encode('utf-8')
+        self.send_bytes(body, 'application/json', head=False)
+
+
+class StaticServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server for one PublishedSite, with an optional FileCache"""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, handler_class, root: Path, cache_bytes: int = 0,
+                 check_interval: float = DEFAULT_CHECK_INTERVAL):
+        self.site = PublishedSite(root, check_interval)
+        self.cache = FileCache(cache_bytes) if cache_bytes > 0 else None
+        # name -> callable returning a dict, added to /__stats
+        self.stats_sources = {}
+        super().__init__(address, handler_class)
+
+    def stats(self) -> dict:
+        stats = {'cache': self.cache.stats() if self.cache is not None else None}
+        for name, source in self.stats_sources.items():
+            stats[name] = source()
+        return stats
@@ -0,0 +1,310 @@
+"""
+Generation Task Queue Module for Pure Tallow Blog
+
+A batch of (product, language, angle) tasks in a SQLite database that any
+number of workers (processes or hosts sharing the file) claim with expiring
+leases:
+
+- claim() hands out one task with a lease token and an expiry; a worker
+  that dies simply lets the lease run out and the task is claimed again
+- heartbeat() extends a lease while the API call is still running
+- fail() hands a task back with a retry delay that doubles per attempt, so
+  a transient API outage does not use up every attempt within seconds
+- complete() re-checks the lease token and runs the publish callback inside
+  the queue's write transaction, so a worker whose lease was taken over can
+  never publish, and two workers can never publish the same task
+- slugs are fixed when the batch is planned, so a task published again
+  after a crash overwrites its own article instead of adding a duplicate
+
+All state changes happen in BEGIN IMMEDIATE transactions (the SQLite write
+lock). The database may live on a shared filesystem as long as it supports
+POSIX locks; WAL mode is used only on local disks.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+# Delay before a failed task may be claimed again: doubles per attempt, up to the max
+DEFAULT_RETRY_BASE_SECONDS = 30
+MAX_RETRY_DELAY_SECONDS = 900
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock on a lock file (held across processes until the block exits)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a+') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Task(NamedTuple):
+    id: int
+    batch: str
+    product: str
+    language: str
+    angle: str
+    slug: str
+    attempt: int
+    lease_token: str
+
+
+class LeaseLost(Exception):
+    """The task's lease expired and was claimed by another worker"""
+
+
+class TaskQueue:
+    """
+    Leased generation tasks, grouped in batches (one per daily run).
+
+    Usage:
+        queue = TaskQueue(db_path)
+        queue.plan_batch("2026-01-31", plan)    # idempotent: first caller plans
+        while (task := queue.claim(worker_id)):
+            ...
+            queue.heartbeat(task)
+            queue.complete(task, publish)        # or queue.fail(task, error)
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS batches (
+            batch TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            info TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            batch TEXT NOT NULL,
+            product TEXT NOT NULL,
+            language TEXT NOT NULL,
+            angle TEXT NOT NULL,
+            slug TEXT NOT NULL,
+            state TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker TEXT,
+            lease_token TEXT,
+            lease_expires REAL,
+            not_before REAL,
+            error TEXT,
+            updated_at REAL NOT NULL,
+            UNIQUE (batch, product, language, angle)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_claim ON tasks(state, lease_expires);
+    """
+
+    def __init__(self, db_path: Path, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, wal: bool = True,
+                 retry_base_seconds: float = DEFAULT_RETRY_BASE_SECONDS):
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(str(self.db_path), timeout=60, isolation_level=None,
+                                     check_same_thread=False)
+        if wal:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        # Queues created before retry delays existed
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if 'not_before' not in columns:
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN not_before REAL")
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds a task that failed its attempts-th attempt waits before it can be claimed"""
+        return min(self.retry_base_seconds * 2 ** max(attempts - 1, 0), MAX_RETRY_DELAY_SECONDS)
+
+    @contextlib.contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction holding the database write lock"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def plan_batch(self, batch: str, plan: Callable[[], Tuple[Iterable[tuple], dict]]) -> bool:
+        """
+        Create a batch unless it exists. plan() runs under the write lock and
+        returns ((product, language, angle, slug) tuples, info dict).
+
+        Returns: True if this call created the batch
+        """
+        with self._write() as conn:
+            if conn.execute("SELECT 1 FROM batches WHERE batch = ?", (batch,)).fetchone():
+                return False
+            tasks, info = plan()
+            now = time.time()
+            conn.execute("INSERT INTO batches VALUES (?, ?, ?)", (batch, now, json.dumps(info)))
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (batch, product, language, angle, slug, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(batch, product, language, angle, slug, now) for product, language, angle, slug in tasks]
+            )
+            return True
+
+    def batch_info(self, batch: str) -> Optional[dict]:
+        with self._lock:
+            row = self._conn.execute("SELECT info FROM batches WHERE batch = ?", (batch,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def claim(self, worker: str, batches: Optional[List[str]] = None) -> Optional[Task]:
+        """
+        Lease the next pending (or expired) task, None if nothing is claimable
+        right now (tasks waiting out a retry delay are not)
+        """
+        now = time.time()
+        sql = ("SELECT id, batch, product, language, angle, slug, attempts FROM tasks "
+               "WHERE ((state = 'pending' AND (not_before IS NULL OR not_before <= ?)) "
+               "OR (state = 'leased' AND lease_expires < ?)) AND attempts < ?")
+        params: list = [now, now, self.max_attempts]
+        if batches:
+            sql += f" AND batch IN ({', '.join('?' * len(batches))})"
+            params += batches
+        sql += " ORDER BY attempts, id LIMIT 1"
+        with self._write() as conn:
+            row = conn.execute(sql, params).fetchone()
+            if row is None:
+                # Expired leases that used their last attempt
+                conn.execute(
+                    "UPDATE tasks SET state = 'failed', lease_token = NULL, updated_at = ?, "
+                    "error = COALESCE(error, 'lease expired') "
+                    "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+                    (now, now, self.max_attempts)
+                )
+                return None
+            task_id, batch, product, language, angle, slug, attempts = row
+            token = uuid.uuid4().hex
+            conn.execute(
+                "UPDATE tasks SET state = 'leased', attempts = attempts + 1, worker = ?, lease_token = ?, "
+                "lease_expires = ?, updated_at = ? WHERE id = ?",
+                (worker, token, now + self.lease_seconds, now, task_id)
+            )
+        return Task(task_id, batch, product, language, angle, slug, attempts + 1, token)
+
+    def heartbeat(self, task: Task) -> None:
+        """Extend a lease (raises LeaseLost if another worker has taken the task over)"""
+        now = time.time()
+        with self._write() as conn:
+            updated = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND lease_token = ? AND state = 'leased'",
+                (now + self.lease_seconds, now, task.id, task.lease_token)
+            ).rowcount
+        if not updated:
+            raise LeaseLost(f"task {task.id} ({task.slug})")
+
+    def complete(self, task: Task, publish: Callable[[], None]) -> None:
+        """
+        Publish a task's result exactly once: publish() runs only while this
+        worker still holds the lease, inside the write transaction that marks
+        the task done (raises LeaseLost otherwise).
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT state, lease_token FROM tasks WHERE id = ?", (task.id,)).fetchone()
+            if row is None or row != ('leased', task.lease_token):
+                raise LeaseLost(f"task {task.id} ({task.slug})")
+            publish()
+            conn.execute(
+                "UPDATE tasks SET state = 'done', lease_token = NULL, error = NULL, updated_at = ? WHERE id = ?",
+                (time.time(), task.id)
+            )
+
+    def fail(self, task: Task, error: str) -> None:
+        """Give a task back (pending again after retry_delay(), or failed after max_attempts)"""
+        now = time.time()
+        with self._write() as conn:
+            conn.execute(
+                "UPDATE tasks SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_token = NULL, lease_expires = NULL, not_before = ?, error = ?, updated_at = ? "
+                "WHERE id = ? AND lease_token = ?",
+                (self.max_attempts, now + self.retry_delay(task.attempt), error[:500], now,
+                 task.id, task.lease_token)
+            )
+
+    def counts(self, batch: str) -> dict:
+        """state -> number of tasks in a batch"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, COUNT(*) FROM tasks WHERE batch = ? GROUP BY state", (batch,)
+            ).fetchall()
+        return dict(rows)
+
+    def unfinished_batches(self) -> List[str]:
+        """Batches with tasks still pending or leased, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT batch FROM tasks WHERE state IN ('pending', 'leased') ORDER BY batch"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def open_tasks(self) -> List[Tuple[str, str, str]]:
+        """(product, language, angle) of every task still pending or leased"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT product, language, angle FROM tasks WHERE state IN ('pending', 'leased')"
+            ).fetchall()
+
+    def batches(self, limit: int = 10) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT batch FROM batches ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def leases(self, batch: str) -> List[tuple]:
+        """(slug, worker, seconds left, attempt) of the tasks currently leased in a batch"""
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slug, worker, lease_expires, attempts FROM tasks "
+                "WHERE batch = ? AND state = 'leased' ORDER BY lease_expires", (batch,)
+            ).fetchall()
+        return [(slug, worker, expires - now, attempts) for slug, worker, expires, attempts in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,100 @@
+"""
+Tests for article_repair.py (run: python -m pytest test_article_repair.py)
+
+Fixed inputs only: no API calls. validate_article() results are built by
+hand with just the fields find_repairs() reads.
+"""
+
+from article_repair import (Repair, apply_repairs, find_repairs, parse_rewrites, repair_messages,
+                            sentence_span)
+
+
+def failed(**checks):
+    """validate_article()-style result with the given checks failed"""
+    return {'checks': {name: {'found': found} for name, found in checks.items()},
+            'failed_checks': list(checks)}
+
+
+def span_text(text, pos):
+    start, end = sentence_span(text, pos)
+    return text[start:end]
+
+
+def test_sentence_span_stops_at_sentence_boundaries():
+    body = "First one. Second one here! Third?"
+    assert span_text(body, body.index("Second")) == "Second one here!"
+    assert span_text(body, body.index("Third")) == "Third?"
+
+
+def test_sentence_span_leaves_out_list_markers():
+    body = "Intro line.\n\n- You can buy it on Etsy. More text.\n1. Numbered item here."
+    assert span_text(body, body.index("Etsy")) == "You can buy it on Etsy."
+    assert span_text(body, body.index("Numbered")) == "Numbered item here."
+
+
+def test_sentence_span_leaves_out_heading_markers():
+    body = "## Why I delve into tallow\n\nPlain text."
+    assert span_text(body, body.index("delve")) == "Why I delve into tallow"
+
+
+def test_etsy_mentions_match_whole_words_only():
+    title = "My Etsy favourite"
+    body = "Betsy loves it. You can find it on Etsy. Etsyshop is not a mention."
+    repairs = find_repairs(title, body, failed(etsy_mentions=[]))
+    # The title has the first mention and keeps it; Betsy and Etsyshop are not mentions
+    assert [(r.field, body[r.start:r.end]) for r in repairs] == [('body', "You can find it on Etsy.")]
+
+
+def test_forbidden_phrases_match_inside_words_with_a_hint():
+    body = "We delved into the jar. Nothing else."
+    repairs = find_repairs("", body, failed(forbidden_phrases=["delve"]))
+    assert len(repairs) == 1
+    assert body[repairs[0].start:repairs[0].end] == "We delved into the jar."
+    assert repairs[0].problems == ('remove the AI-typical phrase "delved" (no word may contain "delve")',)
+
+
+def test_problems_in_one_sentence_become_one_repair():
+    body = "Let me delve into this game-changer. Fine sentence."
+    repairs = find_repairs("", body, failed(forbidden_phrases=["delve"], hyperbolic_claims=["game-changer"]))
+    assert len(repairs) == 1
+    assert body[repairs[0].start:repairs[0].end] == "Let me delve into this game-changer."
+    assert len(repairs[0].problems) == 2
+
+
+def test_before_context_skips_the_passages_list_marker():
+    body = "I bought it on Etsy.\n- You can buy it on Etsy."
+    repairs = find_repairs("", body, failed(etsy_mentions=[]))
+    prompt = repair_messages("Title", body, repairs, "English", "Tallow Balm")[1]['content']
+    assert "Before (do not rewrite): I bought it on Etsy." in prompt
+    assert "Passage: You can buy it on Etsy." in prompt
+
+
+def test_after_context_skips_blank_lines():
+    body = "Let me delve into it.\n\nNext paragraph here."
+    repairs = find_repairs("", body, failed(forbidden_phrases=["delve"]))
+    prompt = repair_messages("Title", body, repairs, "English", "Tallow Balm")[1]['content']
+    assert "After (do not rewrite): Next paragraph here." in prompt
+
+
+def test_parse_rewrites_reads_numbered_lines_and_drops_echoed_labels():
+    content = "[1] Passage: Short and plain.\n[2] Second\nrewrite.\n[7] Out of range."
+    assert parse_rewrites(content, 2) == {1: "Short and plain.", 2: "Second\nrewrite."}
+
+
+def test_unparseable_rewrite_changes_nothing():
+    title, body = "Title", "Let me delve into it. Fine."
+    repairs = find_repairs(title, body, failed(forbidden_phrases=["delve"]))
+    rewrites = parse_rewrites("Sure! Here is the fixed passage: It is fine.", len(repairs))
+    assert rewrites == {}
+    assert apply_repairs(title, body, repairs, rewrites) == (title, body, 0)
+
+
+def test_apply_repairs_keeps_offsets_of_earlier_spans():
+    body = "Aaa one. Bbb two. Ccc three."
+    repairs = [Repair('body', 0, 8, ('x',)), Repair('body', 18, 28, ('y',))]
+    rewrites = {1: "A much longer first sentence.", 2: "C."}
+    title, new_body, applied = apply_repairs("Old", body, repairs + [Repair('title', 0, 3, ('z',))],
+                                             {**rewrites, 3: "## New title\nextra line"})
+    assert new_body == "A much longer first sentence. Bbb two. C."
+    assert title == "New title"
+    assert applied == 3